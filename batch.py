@@ -0,0 +1,198 @@
+"""Batch mode: run the support pipeline over a JSONL file of tickets with a pool of workers.
+
+Each input line is a JSON object with the ticket text in ``message`` (or
+``ticket``, or ``title`` and ``body``), an optional ``id`` and optional
+``answers`` to the clarifying questions. Results are appended to the output
+JSONL as each ticket finishes, one record per input line; a rerun skips the
+lines that already have a result, so an interrupted batch resumes where it
+stopped.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from autogen.io.base import IOStream
+
+from config import BATCH_WORKERS, BATCH_DEFAULT_ANSWER, HUMAN_EXPERT_NAME
+from pipeline import SupportSystem, create_session
+from utils import InputRequest, SessionChannel, SessionIO
+
+REVIEW_MODES = ("approve", "queue")
+
+
+class TicketInput(SessionChannel):
+    """Answers a ticket's human input requests without anyone at a terminal.
+
+    The user replies to the first question with the ticket's answers and
+    ends every later exchange. The Human Expert approves everything; in
+    "queue" mode the approvals are provisional and the reviewed items are
+    returned with the result for a person to check later.
+    """
+
+    def __init__(self, answers: List[str], review: str):
+        super().__init__()
+        self.answers = deque(answers)
+        self.review = review
+        self.review_items: List[Dict[str, str]] = []
+
+    def ask(self, request: InputRequest) -> str:
+        if request.agent == HUMAN_EXPERT_NAME:
+            if self.review == "queue":
+                self.review_items.append({"sender": request.sender, "content": request.message})
+            return "APPROVE"
+        return self.answers.popleft() if self.answers else "exit"
+
+
+def ticket_fields(ticket: Dict, line: int) -> Tuple[str, str, List[str]]:
+    """Return the id, text and answers of an input record."""
+    ticket_id = str(ticket.get("id") or ticket.get("ticket_id") or ticket.get("request_id") or line)
+    text = ticket.get("message") or ticket.get("ticket")
+    if not text:
+        text = "\n\n".join(part for part in (ticket.get("title"), ticket.get("body")) if part)
+    answers = ticket.get("answers") or BATCH_DEFAULT_ANSWER
+    if isinstance(answers, list):
+        answers = "\n".join(f"{number}. {answer}" for number, answer in enumerate(answers, 1))
+    return ticket_id, text, [answers]
+
+
+def process_ticket(system: SupportSystem, line: int, ticket: Dict, review: str) -> Dict:
+    """Run one ticket through classification, research and solution; never raises."""
+    started = time.monotonic()
+    ticket_id, text, answers = ticket_fields(ticket, line)
+    record = {"line": line, "id": ticket_id}
+    if not text:
+        return {**record, "status": "failed", "error": "ticket has no text"}
+    channel = TicketInput(answers, review)
+    try:
+        with IOStream.set_default(SessionIO(max_chunks=0)):
+            session = create_session(system, store_approved=review == "approve")
+            channel.bind(session.user_proxy)
+            channel.bind(session.human_expert)
+            research, solution = session.run(text, survey=False)
+        record.update(
+            status="needs_review" if channel.review_items else "done",
+            questions=research.summary,
+            solution=solution.summary,
+        )
+        if channel.review_items:
+            record["review_items"] = channel.review_items
+    except Exception as e:
+        record.update(status="failed", error=f"{type(e).__name__}: {e}")
+    record["seconds"] = round(time.monotonic() - started, 1)
+    return record
+
+
+def completed_lines(output_path: str) -> Set[int]:
+    """Input lines that already have a successful result in the output file."""
+    done: Set[int] = set()
+    if not os.path.exists(output_path):
+        return done
+    with open(output_path, encoding="utf-8") as f:
+        for raw in f:
+            try:
+                record = json.loads(raw)
+            except ValueError:
+                continue  # A line cut short by an interrupted run
+            if record.get("status") == "failed":
+                done.discard(record.get("line"))
+            else:
+                done.add(record.get("line"))
+    return done
+
+
+def read_tickets(input_path: str, skip: Set[int]) -> Iterator[Tuple[int, Optional[Dict], Optional[str]]]:
+    """Yield (line number, ticket, parse error) for every non-empty line not in ``skip``."""
+    with open(input_path, encoding="utf-8") as f:
+        for line, raw in enumerate(f, 1):
+            if not raw.strip() or line in skip:
+                continue
+            try:
+                ticket = json.loads(raw)
+            except ValueError as e:
+                yield line, None, f"invalid JSON: {e}"
+                continue
+            if not isinstance(ticket, dict):
+                yield line, None, "ticket must be a JSON object"
+                continue
+            yield line, ticket, None
+
+
+async def run_batch(input_path: str, output_path: str, workers: int, review: str) -> Dict[str, int]:
+    """Process every pending ticket with ``workers`` concurrent sessions; returns counts per status."""
+    skip = completed_lines(output_path)
+    if skip:
+        print(f"Resuming: {len(skip)} tickets already have results in {output_path}")
+    system = SupportSystem(echo_usage=False)
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ticket")
+    queue: asyncio.Queue = asyncio.Queue(maxsize=workers * 2)
+    counts: Dict[str, int] = {}
+
+    with open(output_path, "a", encoding="utf-8") as output:
+        def write(record: Dict) -> None:
+            output.write(json.dumps(record, ensure_ascii=False) + "\n")
+            output.flush()
+            counts[record["status"]] = counts.get(record["status"], 0) + 1
+            print(f"[{sum(counts.values())}] line {record['line']} ({record.get('id')}): {record['status']} "
+                  f"in {record.get('seconds', 0)}s")
+
+        async def produce() -> None:
+            for item in read_tickets(input_path, skip):
+                await queue.put(item)
+            for _ in range(workers):
+                await queue.put(None)
+
+        async def work() -> None:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                line, ticket, error = item
+                if error is not None:
+                    write({"line": line, "status": "failed", "error": error})
+                    continue
+                write(await loop.run_in_executor(executor, process_ticket, system, line, ticket, review))
+
+        try:
+            await asyncio.gather(produce(), *(work() for _ in range(workers)))
+        finally:
+            executor.shutdown(wait=True)
+            system.close()
+    report = system.report()
+    if report:
+        print(report)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Process a JSONL file of support tickets.")
+    parser.add_argument("input", help="JSONL file with one ticket per line")
+    parser.add_argument("-o", "--output", help="Results JSONL (default: <input>.results.jsonl); appended to and resumed")
+    parser.add_argument("-w", "--workers", type=int, default=BATCH_WORKERS, help="Tickets processed at once (default: %(default)s)")
+    parser.add_argument(
+        "--review",
+        choices=REVIEW_MODES,
+        default="approve",
+        help="Human Expert steps: approve automatically, or approve provisionally and queue the items "
+        "in the result for review (default: %(default)s)",
+    )
+    args = parser.parse_args()
+    output = args.output or f"{os.path.splitext(args.input)[0]}.results.jsonl"
+    try:
+        counts = asyncio.run(run_batch(args.input, output, max(args.workers, 1), args.review))
+    except KeyboardInterrupt:
+        sys.exit(130)
+    print(", ".join(f"{count} {status}" for status, count in sorted(counts.items())) or "Nothing to do")
+    if counts.get("failed"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,11 @@
+"""Declarative catalog of the AWS services the support system covers."""
+from .bundle import BUNDLE_VERSION, ServiceCatalog, combined_fingerprint, compile_bundle, load_bundle, source_hash
+
+__all__ = [
+    'BUNDLE_VERSION',
+    'ServiceCatalog',
+    'combined_fingerprint',
+    'compile_bundle',
+    'load_bundle',
+    'source_hash',
+]
@@ -0,0 +1,168 @@
+"""Compilation of the declarative service catalog into a pre-rendered prompt bundle."""
+import hashlib
+import json
+import os
+from typing import Dict, List, Optional
+
+from researchers import base_researcher
+from researchers.base_researcher import BaseResearcher
+from specialists import base_specialist
+from specialists.base_specialist import PROMPT_TIERS, RESPONSE_FORMATS, BaseSpecialist
+from utils.solution_store import prompt_fingerprint
+
+# Bumped when the layout of the compiled bundle changes
+BUNDLE_VERSION = 1
+
+_RESEARCHER_FIELDS = ("description", "service_area", "expertise", "example_questions")
+_SPECIALIST_FIELDS = ("description", "prompt")
+
+
+def _sha256(*parts: bytes) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(hashlib.sha256(part).digest())
+    return digest.hexdigest()
+
+
+def source_hash(source_path: str) -> str:
+    """Hash of the catalog file and of the templates its prompts are rendered with."""
+    parts = []
+    for path in (source_path, base_researcher.__file__, base_specialist.__file__):
+        with open(path, "rb") as f:
+            parts.append(f.read())
+    return _sha256(str(BUNDLE_VERSION).encode(), *parts)
+
+
+def combined_fingerprint(fingerprints: Dict[str, str]) -> str:
+    """One hash for a set of per-agent prompt fingerprints, e.g. to version a cache."""
+    return _sha256(*(f"{name}:{fingerprints[name]}".encode() for name in sorted(fingerprints)))
+
+
+def _validate(services: List[Dict]) -> None:
+    keys = set()
+    for i, service in enumerate(services):
+        key = service.get("key")
+        if not isinstance(key, str) or not key:
+            raise ValueError(f"services[{i}].key must be a non-empty string")
+        if key in keys:
+            raise ValueError(f"Duplicate service key {key!r} in the service catalog")
+        keys.add(key)
+        for role, fields in (("researcher", _RESEARCHER_FIELDS), ("specialist", _SPECIALIST_FIELDS)):
+            missing = [field for field in fields if field not in service.get(role, {})]
+            if missing:
+                raise ValueError(f"Service {key!r} is missing {role} field(s): {', '.join(missing)}")
+
+
+def compile_bundle(source_path: str) -> Dict:
+    """Render every researcher prompt and every specialist prompt tier and format from the catalog."""
+    with open(source_path, encoding="utf-8") as f:
+        services = json.load(f)["services"]
+    _validate(services)
+
+    compiled = []
+    for service in services:
+        source = service["researcher"]
+        researcher = BaseResearcher(None)
+        researcher.service_area = source["service_area"]
+        researcher.expertise = source["expertise"]
+        system_message = researcher.build_system_message(source["example_questions"])
+        researcher_entry = {
+            "name": f"{service['key']}_Researcher",
+            "description": source["description"],
+            "service_area": source["service_area"],
+            "expertise": source["expertise"],
+            "system_message": system_message,
+            "fingerprint": prompt_fingerprint(system_message),
+        }
+
+        source = service["specialist"]
+        service_message = "\n".join(source["prompt"])
+        system_messages = {}
+        for output_format in RESPONSE_FORMATS:
+            specialist = BaseSpecialist(f"{service['key']}_Specialist", None, output_format=output_format)
+            specialist.build_system_message(service_message)
+            system_messages[output_format] = {tier: specialist.system_message_for(tier) for tier in PROMPT_TIERS}
+        specialist_entry = {
+            "name": f"{service['key']}_Specialist",
+            "description": source["description"],
+            "example_tags": source.get("example_tags", {}),
+            "service_message": service_message,
+            "system_messages": system_messages,
+            "fingerprints": {
+                output_format: {tier: prompt_fingerprint(message) for tier, message in by_tier.items()}
+                for output_format, by_tier in system_messages.items()
+            },
+        }
+        compiled.append({"key": service["key"], "researcher": researcher_entry, "specialist": specialist_entry})
+
+    return {"version": BUNDLE_VERSION, "source_hash": source_hash(source_path), "services": compiled}
+
+
+def load_bundle(source_path: str, bundle_path: Optional[str] = None) -> Dict:
+    """Return the compiled bundle, recompiling it when the catalog or the templates changed.
+
+    Without ``bundle_path`` the catalog is compiled in memory; otherwise the
+    bundle is written there and reused until its source hash goes stale.
+    """
+    if not bundle_path:
+        return compile_bundle(source_path)
+    expected = source_hash(source_path)
+    try:
+        with open(bundle_path, encoding="utf-8") as f:
+            bundle = json.load(f)
+        if bundle.get("version") == BUNDLE_VERSION and bundle.get("source_hash") == expected:
+            return bundle
+    except (OSError, ValueError):
+        pass
+
+    bundle = compile_bundle(source_path)
+    directory = os.path.dirname(bundle_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    # Written next to the target and renamed, so concurrent starts never read a partial file
+    temporary = f"{bundle_path}.{os.getpid()}.tmp"
+    with open(temporary, "w", encoding="utf-8") as f:
+        json.dump(bundle, f, ensure_ascii=False)
+    os.replace(temporary, bundle_path)
+    return bundle
+
+
+class ServiceCatalog:
+    """The researchers and specialists of every service, from a compiled prompt bundle.
+
+    Adding a service only takes a new entry in the catalog file; agent names
+    are derived from its key ("EKS" gives "EKS_Researcher" and
+    "EKS_Specialist"). The per-prompt fingerprints in the bundle are what the
+    solution store and question cache use to drop entries made with older prompts.
+    """
+
+    def __init__(self, bundle: Dict):
+        self.bundle = bundle
+        self.services = bundle["services"]
+
+    @classmethod
+    def load(cls, source_path: str, bundle_path: Optional[str] = None) -> "ServiceCatalog":
+        return cls(load_bundle(source_path, bundle_path))
+
+    def keys(self) -> List[str]:
+        return [service["key"] for service in self.services]
+
+    def researchers(self, openai_config) -> List[BaseResearcher]:
+        """Researcher descriptors in catalog order."""
+        return [BaseResearcher.from_bundle(service["researcher"], openai_config) for service in self.services]
+
+    def specialists(self, config_list, prompt_tier="full", output_format="text") -> List[BaseSpecialist]:
+        """Specialist descriptors in catalog order, with the system message of the given tier and format."""
+        return [
+            BaseSpecialist.from_bundle(service["specialist"], config_list, prompt_tier, output_format)
+            for service in self.services
+        ]
+
+    def researcher_fingerprints(self) -> Dict[str, str]:
+        return {service["researcher"]["name"]: service["researcher"]["fingerprint"] for service in self.services}
+
+    def specialist_fingerprints(self, prompt_tier="full", output_format="text") -> Dict[str, str]:
+        return {
+            service["specialist"]["name"]: service["specialist"]["fingerprints"][output_format][prompt_tier]
+            for service in self.services
+        }
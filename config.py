@@ -2,40 +2,205 @@
 from typing import Dict, List
 import os
 
+# Default file locations are relative to this directory, not the working directory
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _default_path(relative_path: str) -> str:
+    return os.path.join(BASE_DIR, relative_path)
+
+
+# Model tiers: "large" for long-form answers, "small" for short, latency-bound decisions
+MODEL_TIERS = {
+    "large": os.getenv("LLM_LARGE_MODEL", "gpt-4o"),
+    "small": os.getenv("LLM_SMALL_MODEL", "gpt-4o-mini"),
+}
+
 # OpenAI API configuration
 OPENAI_CONFIG: List[Dict] = [
     {
-        "cache_seed": None, # Disable caching for LLM calls (temporary)
-        "model": "gpt-4o",
+        "cache_seed": None, # Legacy autogen disk cache is off; see LLM_CACHE_* below
+        "model": MODEL_TIERS["large"],
         "api_key": os.getenv("OPENAI_API_KEY")
 
     }
 ]
 
+# The same configuration for each model tier
+MODEL_CONFIGS: Dict[str, List[Dict]] = {
+    tier: [{**entry, "model": model} for entry in OPENAI_CONFIG] for tier, model in MODEL_TIERS.items()
+}
+
+# Model tier of each role
+ROLE_MODEL_TIERS = {
+    "coordinator": "large",  # Research and Solution Coordinators
+    "researcher": "large",
+    "specialist": "large",
+    "classifier": "small",  # Technical question or not
+    "speaker_selection": "small",  # Group chat managers picking the next speaker
+    "summary": "small",  # reflection_with_llm chat summaries and the text-mode solution aggregation
+    "survey": "small",
+}
+
 # Agent names
 USER_PROXY_NAME = "User"
 SOLUTION_COORDINATOR_NAME = "Solution_Coordinator"
 RESEARCH_COORDINATOR_NAME = "Research_Coordinator"
-EKS_SPECIALIST_NAME = "EKS_Specialist"
-EKS_RESEARCHER_NAME = "EKS_Researcher"
-EC2_SPECIALIST_NAME = "EC2_Specialist"
-EC2_RESEARCHER_NAME = "EC2_Researcher"
-VPC_SPECIALIST_NAME = "VPC_Specialist"
-VPC_RESEARCHER_NAME = "VPC_Researcher"
-IAM_SPECIALIST_NAME = "IAM_Specialist"
-IAM_RESEARCHER_NAME = "IAM_Researcher"
-CLOUDWATCH_SPECIALIST_NAME = "CloudWatch_Specialist"
-CLOUDWATCH_RESEARCHER_NAME = "CloudWatch_Researcher"
 HUMAN_EXPERT_NAME = "Human_Expert"
-LAMBDA_RESEARCHER_NAME = "Lambda_Researcher"
-ECS_RESEARCHER_NAME = "ECS_Researcher"
-S3_RESEARCHER_NAME = "S3_Researcher"
-SNS_RESEARCHER_NAME = "SNS_Researcher"
-SQS_RESEARCHER_NAME = "SQS_Researcher"
-RDS_RESEARCHER_NAME = "RDS_Researcher"
-ELASTICACHE_RESEARCHER_NAME = "ElastiCache_Researcher"
-AURORA_RESEARCHER_NAME = "Aurora_Researcher"
+
+# Service catalog: researchers and specialists ("<key>_Researcher", "<key>_Specialist")
+# are declared in SERVICE_CATALOG_PATH and compiled into a pre-rendered prompt
+# bundle at PROMPT_BUNDLE_PATH, rebuilt only when the catalog or the prompt
+# templates change (an empty bundle path compiles in memory on every start)
+SERVICE_CATALOG_PATH = os.getenv("SERVICE_CATALOG_PATH", _default_path("catalog/services.json"))
+PROMPT_BUNDLE_PATH = os.getenv("PROMPT_BUNDLE_PATH", _default_path(".cache/prompt_bundle.json"))
 
 
 # Chat configuration
-MAX_ROUND = 20
\ No newline at end of file
+MAX_ROUND = 20
+
+# Group chats end a review pass early once no new information arrives (see utils/stopping.py);
+# GROUPCHAT_MAX_ROUND stays the upper bound
+GROUPCHAT_MAX_ROUND = 10
+GROUPCHAT_NOVELTY_SIMILARITY = 0.75  # A turn (or each of its numbered items) this similar to earlier ones adds nothing
+GROUPCHAT_MAX_IDLE_TURNS = 2  # Empty or repeated turns in a row that end the pass
+GROUPCHAT_MAX_REPEATS = 2  # Turns by one agent in a pass that count as a repeated-speaker loop
+
+# Group chat history: the last HISTORY_KEEP_TURNS turns are sent verbatim, older
+# turns as a digest, and each call's history is kept under HISTORY_MAX_TOKENS
+HISTORY_KEEP_TURNS = 4
+HISTORY_MAX_TOKENS = 12_000
+HISTORY_DIGEST_CHARS = 300  # Characters kept per turn in the digest
+
+# Specialist prompt tier: "full", "on_demand" (example solutions injected only
+# for topics the conversation mentions), "standard" (no example solutions) or
+# "minimal" (expertise and solution guidelines only); see token_report.py for the sizes
+SPECIALIST_PROMPT_TIER = os.getenv("SPECIALIST_PROMPT_TIER", "on_demand")
+
+# Local speaker routing
+ROUTER_CONFIDENCE_THRESHOLD = 3.0  # Minimum router score; below it the LLM selector is used
+ROUTER_MAX_SPEAKERS = 4  # Maximum number of researchers routed per problem
+
+# Research phase: "groupchat" runs researchers one per round, "fanout" asks
+# every routed researcher concurrently and merges their questions once
+RESEARCH_MODE = os.getenv("RESEARCH_MODE", "groupchat")
+RESEARCH_MAX_REWORKS = 2  # Human Expert REWORK rounds before the last questions are used
+
+# Research summary: "local" merges, de-duplicates and renumbers the researchers'
+# questions without an LLM call; "llm" uses reflection_with_llm instead
+RESEARCH_SUMMARY = os.getenv("RESEARCH_SUMMARY", "local")
+QUESTION_DEDUP_SIMILARITY = 0.75  # TF-IDF cosine similarity at which two questions are duplicates
+
+# Solution phase: "groupchat" runs specialists one per round, "parallel" runs
+# the routed specialists concurrently and aggregates their solutions once
+SOLUTION_MODE = os.getenv("SOLUTION_MODE", "groupchat")
+SOLUTION_MAX_CONCURRENCY = 4  # Specialists generating at the same time
+SOLUTION_TIMEOUT = 180  # Seconds a single specialist may take before it is dropped
+SOLUTION_MAX_REWORKS = 2  # Human Expert REWORK rounds before the last solutions are used
+
+# Speculative solutions ("parallel" solution mode): while the user answers the clarifying
+# questions, confidently routed specialists draft their solutions from the problem alone;
+# the drafts are used as they are if the answers add nothing, or revised for the answers
+SOLUTION_SPECULATION = os.getenv("SOLUTION_SPECULATION", "0") == "1"
+SPECULATION_THRESHOLD = 5.0  # Router score a specialist needs to draft ahead (stricter than routing)
+SPECULATION_GRACE = 2.0  # Seconds the solution phase waits for unfinished drafts before solving without them
+
+# Specialist output: "json" replies are schema-validated, ranked, de-duplicated and
+# rendered locally; "text" keeps the free-text layout and the LLM aggregation call
+SPECIALIST_OUTPUT = os.getenv("SPECIALIST_OUTPUT", "json")
+SOLUTION_DEDUP_SIMILARITY = 0.6  # TF-IDF cosine similarity at which two solutions overlap
+
+# Stream the specialists' completions token by token to the terminal or the
+# session's HTTP client while they are generated ("0" turns it off). Off by
+# default with JSON output, where the stream would be raw JSON
+SOLUTION_STREAMING = os.getenv("SOLUTION_STREAMING", "1" if SPECIALIST_OUTPUT == "text" else "0") == "1"
+
+# Local classifier: lexical score at which a message is technical without asking the LLM
+CLASSIFIER_TECHNICAL_SCORE = 3.0
+
+# Persistent LLM response cache (set LLM_CACHE_PATH to an empty string to disable)
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", _default_path(".cache/llm_responses.sqlite"))
+LLM_CACHE_MAX_ENTRIES = 50_000  # Least recently used responses are evicted beyond this
+LLM_CACHE_MAX_BYTES = 512 * 1024 * 1024  # Size cap for the pickled responses
+LLM_CACHE_TTL = 7 * 24 * 3600  # Seconds before a cached response expires
+LLM_CACHE_FLUSH_INTERVAL = 5.0  # Seconds between writes of batched hit/miss counts and access times
+
+# Semantic cache of approved clarifying questions (empty path disables it)
+QUESTION_CACHE_PATH = os.getenv("QUESTION_CACHE_PATH", _default_path(".cache/questions.sqlite"))
+QUESTION_CACHE_THRESHOLD = 0.8  # Minimum TF-IDF cosine similarity for a cache hit
+QUESTION_CACHE_MAX_ENTRIES = 5_000  # Oldest approved question sets are dropped beyond this
+
+# Store of approved solutions for repeat tickets (empty path disables it)
+SOLUTION_STORE_PATH = os.getenv("SOLUTION_STORE_PATH", _default_path(".cache/solutions.sqlite"))
+SOLUTION_STORE_MAX_AGE = 30 * 24 * 3600  # Seconds before an approved solution is considered stale
+
+# Client-side rate limits per model (the provider's requests and tokens per minute for
+# the account's tier); requests wait in the process instead of being rejected with 429.
+# Models not listed are not metered, an empty dict turns the scheduler off.
+LLM_RATE_LIMITS = {
+    "gpt-4o": {"rpm": 500, "tpm": 30_000},
+    "gpt-4o-mini": {"rpm": 500, "tpm": 200_000},
+}
+LLM_RATE_HEADROOM = 0.9  # Share of each limit the process uses
+LLM_BACKGROUND_RESERVE = 0.2  # Share of each budget surveys and summaries leave to interactive calls
+LLM_EXPECTED_COMPLETION_TOKENS = 1000  # Completion tokens charged for requests without max_tokens
+
+# Timeout of each role's LLM requests: seconds to connect and for each read of the
+# response (for streamed completions, the wait for the next chunk). The SDK retries a
+# request that timed out or failed LLM_ROLE_MAX_RETRIES times (2 for roles not listed)
+LLM_ROLE_TIMEOUTS = {
+    "coordinator": 120,
+    "researcher": 60,
+    "specialist": 150,  # Below SOLUTION_TIMEOUT, so a retry can still help in parallel mode
+    "classifier": 10,
+    "speaker_selection": 15,
+    "summary": 60,
+    "survey": 30,
+}
+LLM_ROLE_MAX_RETRIES = {
+    "classifier": 0,  # Latency-bound: fail after one timeout instead of waiting up to three
+    "speaker_selection": 0,
+}
+
+# Hedged requests: an interactive request still unanswered at the given percentile of its
+# role's recent latencies is sent once more, and the first response is used. The duplicates
+# cost tokens and rate-limit budget, so hedging is off by default ("1" turns it on)
+LLM_HEDGING = os.getenv("LLM_HEDGING", "0") == "1"
+LLM_HEDGE_PERCENTILES = {
+    "classifier": 0.95,
+    "speaker_selection": 0.95,
+    "researcher": 0.99,
+    "specialist": 0.99,  # Streamed: measured to the first chunk
+}
+LLM_LATENCY_WINDOW = 200  # Recent requests per role and model the percentiles are taken over
+LLM_HEDGE_MIN_SAMPLES = 20  # Requests a role needs before its requests are hedged
+
+# Identical LLM requests in flight at the same time (e.g. the same classifier or speaker
+# selection prompt from many sessions during an outage) share one upstream call ("0" turns it off)
+LLM_SINGLE_FLIGHT = os.getenv("LLM_SINGLE_FLIGHT", "1") == "1"
+
+# Print prompt, cached and completion tokens for every LLM call ("0" turns it off)
+LLM_USAGE_REPORT = os.getenv("LLM_USAGE_REPORT", "1") == "1"
+
+# HTTP session server (server.py)
+SERVER_HOST = os.getenv("SERVER_HOST", "127.0.0.1")
+SERVER_PORT = int(os.getenv("SERVER_PORT", "8080"))
+# Each session runs its (blocking) autogen chats on one worker thread for its whole life, also
+# while it waits for user or expert input; sessions beyond SERVER_WORKERS queue for a worker
+SERVER_WORKERS = int(os.getenv("SERVER_WORKERS", "32"))
+SERVER_MAX_SESSIONS = 128  # Running plus queued sessions; new ones are refused (503) beyond this
+SERVER_IDLE_TIMEOUT = 30 * 60  # Seconds a session waits for user or expert input before the chat is ended
+SERVER_POLL_TIMEOUT = 30  # Longest a request waits for the session's next input request
+SERVER_SESSION_RETENTION = 60 * 60  # Seconds a finished session's result is kept
+SERVER_STREAM_BUFFER = 20_000  # Streamed token chunks kept per session for clients to read
+
+# Human Expert review queue of the server: reviews wait in this file for any expert to
+# claim them (set REVIEW_QUEUE_PATH to an empty string to review inline in each session)
+REVIEW_QUEUE_PATH = os.getenv("REVIEW_QUEUE_PATH", _default_path(".cache/reviews.sqlite"))
+REVIEW_CLAIM_TIMEOUT = 15 * 60  # Seconds a claimed review stays with its expert before others may take it
+REVIEW_TIMEOUT = 4 * 60 * 60  # Seconds a session waits for a verdict before the review expires
+
+# Batch ticket processing (batch.py)
+BATCH_WORKERS = int(os.getenv("BATCH_WORKERS", "8"))  # Tickets processed concurrently
+# Reply to the clarifying questions for tickets without their own "answers"
+BATCH_DEFAULT_ANSWER = "No further details are available; please proceed with common, reasonable defaults."
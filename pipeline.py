@@ -0,0 +1,831 @@
+"""The support pipeline: process-wide resources and the agents of one support session."""
+
+import functools
+
+import autogen
+from autogen.agentchat.contrib.capabilities.transform_messages import TransformMessages
+
+from config import (
+    OPENAI_CONFIG,
+    MODEL_CONFIGS,
+    ROLE_MODEL_TIERS,
+    USER_PROXY_NAME,
+    RESEARCH_COORDINATOR_NAME,
+    SOLUTION_COORDINATOR_NAME,
+    HUMAN_EXPERT_NAME,
+    SPECIALIST_PROMPT_TIER,
+    GROUPCHAT_MAX_ROUND,
+    GROUPCHAT_NOVELTY_SIMILARITY,
+    GROUPCHAT_MAX_IDLE_TURNS,
+    GROUPCHAT_MAX_REPEATS,
+    HISTORY_KEEP_TURNS,
+    HISTORY_MAX_TOKENS,
+    HISTORY_DIGEST_CHARS,
+    ROUTER_CONFIDENCE_THRESHOLD,
+    ROUTER_MAX_SPEAKERS,
+    RESEARCH_MODE,
+    RESEARCH_MAX_REWORKS,
+    RESEARCH_SUMMARY,
+    QUESTION_DEDUP_SIMILARITY,
+    SOLUTION_MODE,
+    SOLUTION_MAX_CONCURRENCY,
+    SOLUTION_TIMEOUT,
+    SOLUTION_MAX_REWORKS,
+    SOLUTION_SPECULATION,
+    SPECULATION_THRESHOLD,
+    SPECULATION_GRACE,
+    SPECIALIST_OUTPUT,
+    SOLUTION_DEDUP_SIMILARITY,
+    SOLUTION_STREAMING,
+    CLASSIFIER_TECHNICAL_SCORE,
+    LLM_CACHE_PATH,
+    LLM_CACHE_MAX_ENTRIES,
+    LLM_CACHE_MAX_BYTES,
+    LLM_CACHE_TTL,
+    LLM_CACHE_FLUSH_INTERVAL,
+    QUESTION_CACHE_PATH,
+    QUESTION_CACHE_THRESHOLD,
+    QUESTION_CACHE_MAX_ENTRIES,
+    SOLUTION_STORE_PATH,
+    SOLUTION_STORE_MAX_AGE,
+    LLM_USAGE_REPORT,
+    LLM_RATE_LIMITS,
+    LLM_RATE_HEADROOM,
+    LLM_BACKGROUND_RESERVE,
+    LLM_EXPECTED_COMPLETION_TOKENS,
+    LLM_ROLE_TIMEOUTS,
+    LLM_ROLE_MAX_RETRIES,
+    LLM_HEDGING,
+    LLM_HEDGE_PERCENTILES,
+    LLM_LATENCY_WINDOW,
+    LLM_HEDGE_MIN_SAMPLES,
+    LLM_SINGLE_FLIGHT,
+    SERVICE_CATALOG_PATH,
+    PROMPT_BUNDLE_PATH,
+)
+
+from catalog import ServiceCatalog, combined_fingerprint
+
+from utils import (
+    BACKGROUND,
+    AdaptiveStop,
+    AgentRegistry,
+    HistoryCompactor,
+    LatencyTracker,
+    LocalClassifier,
+    QuestionCache,
+    QuestionSummary,
+    RateLimiter,
+    ResponseCache,
+    SolutionStore,
+    ServiceRouter,
+    RouterSpeakerSelector,
+    RoutedAutoSelector,
+    ResearchFanout,
+    SolutionAggregator,
+    SolutionDrafts,
+    SolutionEngine,
+    SolutionSummary,
+    SharedHttpClient,
+    SingleFlight,
+    UsageLogger,
+    compact_speaker_selection,
+    for_role,
+    is_approved,
+    last_verdict,
+    prioritize,
+    prioritize_summaries,
+    reflect_with_llm,
+    request_review,
+    stream_tokens,
+    with_http_client,
+    with_response_cache,
+)
+
+# Summary prompts used to aggregate the nested chat results
+RESEARCH_SUMMARY_PROMPT = """
+Analyze all researcher responses and provide raw grouped questions:
+1. Remove duplicate questions
+2. Remove questions about already provided information
+3. Group by AWS service/topic
+4. Use only questions from researchers
+5. Do not create new questions
+6. Number all questions sequentially across all groups
+
+Output raw questions and groupings only, no formatting needed.
+The Research Coordinator will handle the final formatting.
+"""
+
+SOLUTION_SUMMARY_PROMPT = """
+Aggregate specialists' solutions with these rules:
+1. REMOVE duplicate solutions
+2. REMOVE solutions not relevant to the user's problem
+3. For conflicting solutions, keep the most relevant specialist's solution
+4. Preserve all technical content exactly as provided
+
+Output raw solutions only, no additional formatting needed.
+The Solution Coordinator will handle the final presentation.
+"""
+
+def create_agents(
+    config_list=OPENAI_CONFIG,
+    prompt_tier=SPECIALIST_PROMPT_TIER,
+    output_format=SPECIALIST_OUTPUT,
+    on_create=None,
+    catalog=None,
+    role_configs=None,
+):
+    """Create all the necessary agents for the system.
+
+    Agents use ``config_list`` unless ``role_configs`` has a config list for
+    their role ("coordinator", "researcher" or "specialist").
+
+    ``prompt_tier`` selects the specialists' prompt size ("full", "on_demand",
+    "standard" or "minimal") and ``output_format`` their reply format ("json" or "text").
+    Researchers and specialists are returned as registries of service
+    descriptors from the service ``catalog`` (loaded from ``SERVICE_CATALOG_PATH``
+    by default); each agent is built the first time its service is routed to,
+    and ``on_create`` is called with it.
+    """
+    if catalog is None:
+        catalog = ServiceCatalog.load(SERVICE_CATALOG_PATH, PROMPT_BUNDLE_PATH)
+    role_configs = role_configs or {}
+    coordinator_config = role_configs.get("coordinator", config_list)
+
+    # Create the user proxy
+    user_proxy = autogen.UserProxyAgent(
+        name=USER_PROXY_NAME,
+        human_input_mode="ALWAYS",
+        code_execution_config=False,
+    )
+
+    # Create the research coordinator with modified prompt
+    research_coordinator = autogen.AssistantAgent(
+        name=RESEARCH_COORDINATOR_NAME,
+        system_message="""
+            You are an AWS Research Coordinator managing a team of AWS service researchers. Your role is to gather context through clarifying questions ONLY.
+
+            CORE RESPONSIBILITIES:
+            1. Analyze user's initial problem
+            2. Route to relevant researchers for questions
+            3. Consolidate researchers' questions
+            4. Validate questions with human expert before presenting to user
+            5. Rework questions if human expert requests it (repeat the process)
+            6. Present organized questions to user if approved by human expert
+
+            WORKFLOW:
+            1. For user's input:
+               - If input matches pattern "1. [answer] 2. [answer]..." -> Reply "TERMINATE"
+           - If input contains phrases like "proceed", "continue with solution" -> Reply "TERMINATE"
+           - Otherwise continue normal workflow:
+             * Identify mentioned AWS services
+             * Note potential related services
+             * Spot missing technical context
+
+            2. When engaging researchers:
+               - Include ALL potentially relevant researchers
+               - Provide clear context of the problem
+               - Request specific types of questions needed
+
+            3. When consolidating questions:
+               - Group by AWS service/topic
+               - Remove duplicate questions
+               - Preserve technical context
+               - DO NOT create new questions
+               - DO NOT suggest solutions
+
+            4. When handling Human Expert responses:
+               - For APPROVE: Present the exact approved questions to the user
+               - For REWORK: Route back to researchers with feedback
+
+            RESPONSE FORMAT:
+            After receiving researchers' input or APPROVE from Human Expert:
+            "Based on our research team's analysis:
+
+            [Service/Topic 1]:
+            1. Question 1
+            2. Question 2
+
+            [Service/Topic 2]:
+            3. Question 3
+            4. Question 4"
+
+            Reply with TERMINATE when:
+            - User provides numbered answers to clarifying questions (e.g., "1. Yes 2. No")
+        - User explicitly requests to proceed with solution
+        - Follow-up interaction is non-technical
+        - No further context is needed for working on the solution
+
+            IMPORTANT:
+            - Never suggest solutions
+            - Only use questions from researchers
+            - Focus on gathering context
+            - Preserve approved questions exactly as reviewed
+            """,
+        llm_config={"config_list": coordinator_config},
+    )
+    
+    # Create the solution coordinator
+    solution_coordinator = autogen.AssistantAgent(
+        name=SOLUTION_COORDINATOR_NAME,
+        system_message="""
+            You are an AWS Solution Coordinator managing a team of AWS service specialists. Your role is to coordinate solution development.
+
+            CORE RESPONSIBILITIES:
+            1. Analyze user's requirements and context
+            2. Route to relevant specialists for solutions
+            3. Present specialists' solutions exactly as provided after human expert approval
+            4. DO NOT modify or rewrite specialist solutions
+            5. DO NOT create new solutions or formats
+
+            WORKFLOW:
+            1. For user's input:
+               - Identify mentioned AWS services
+               - Route to relevant specialists
+
+            2. When presenting solutions:
+               - Present the exact solutions provided by specialists and approved by human expert
+               - Maintain all technical details, code examples, and formatting
+               - Include all implementation steps and commands
+               - Preserve the original structure and examples
+               
+            3. When handling Human Expert responses:
+               - For APPROVE: Present the exact approved solutions to the user
+               - For REWORK: Route back to specialists with feedback
+
+            Reply with TERMINATE when:
+            - Solutions have been provided
+            - No viable solutions exist
+            - Further context is needed
+            - Human Expert has approved the solutions with "APPROVE"
+
+            IMPORTANT:
+            - Never modify specialist solutions
+            - Present solutions exactly as approved
+            - Maintain all technical details and examples
+            - Keep original formatting and structure
+            """,
+        llm_config={"config_list": coordinator_config},
+    )
+
+    # Create the human expert
+    human_expert = autogen.UserProxyAgent(
+        name=HUMAN_EXPERT_NAME,
+        human_input_mode="ALWAYS",
+        default_auto_reply="APPROVE",
+        code_execution_config=False,
+        description="Human Expert can APPROVE or request REWORK with feedback for clarifying questions and proposed solutions.",
+        system_message="""
+            You are an AWS Human Expert who reviews:
+            1. Clarifying questions before they are sent to user
+            2. Final solutions before they are presented to user
+            
+            For each review, you can:
+            - Reply "APPROVE" to accept
+            - Reply "REWORK: [your feedback]" to request changes
+            
+            Focus on technical accuracy and completeness.
+        """,
+        is_termination_msg=lambda msg: "APPROVE" in msg["content"].upper(),
+    )
+
+    # Create researchers
+    researcher_profiles = catalog.researchers(role_configs.get("researcher", config_list))
+    researchers = AgentRegistry(researcher_profiles, on_create=on_create)
+
+    # Route problems to researchers locally, from their expertise and description
+    router = ServiceRouter(researcher_profiles)
+
+    # Create specialists
+    specialists = AgentRegistry(
+        catalog.specialists(role_configs.get("specialist", config_list), prompt_tier, output_format),
+        on_create=on_create,
+    )
+
+    return user_proxy, research_coordinator, solution_coordinator, specialists, researchers, human_expert, router
+
+
+class SupportSystem:
+    """Resources shared by every support session in a process.
+
+    Holds the LLM configuration of each role (its model tier and deadline,
+    with the persistent response cache), the rate limiter every LLM request goes
+    through, the compiled service catalog and the token usage logger. Sessions created
+    with :func:`create_session` are independent of each other, so one
+    process can run many of them at once.
+    """
+
+    def __init__(self, echo_usage: bool = True):
+        # Share one persistent response cache between all agents (and worker processes)
+        self.response_cache = None
+        if LLM_CACHE_PATH:
+            self.response_cache = ResponseCache(
+                LLM_CACHE_PATH,
+                max_entries=LLM_CACHE_MAX_ENTRIES,
+                max_bytes=LLM_CACHE_MAX_BYTES,
+                ttl=LLM_CACHE_TTL,
+                flush_interval=LLM_CACHE_FLUSH_INTERVAL,
+            )
+
+        # Meter every LLM request of the process against the provider's rate limits
+        self.rate_limiter = None
+        if LLM_RATE_LIMITS:
+            self.rate_limiter = RateLimiter(
+                LLM_RATE_LIMITS, headroom=LLM_RATE_HEADROOM, background_reserve=LLM_BACKGROUND_RESERVE
+            )
+
+        # Identical requests from concurrent sessions share one upstream call while it is in flight
+        self.single_flight = SingleFlight() if LLM_SINGLE_FLIGHT else None
+
+        # One connection pool for all agents' OpenAI clients instead of one (and a TLS setup) per agent;
+        # with hedging, slow requests of a role are sent a second time
+        self.http_client = SharedHttpClient(
+            rate_limiter=self.rate_limiter,
+            expected_completion_tokens=LLM_EXPECTED_COMPLETION_TOKENS,
+            hedge_percentiles=LLM_HEDGE_PERCENTILES if LLM_HEDGING else None,
+            latencies=LatencyTracker(LLM_LATENCY_WINDOW, min_samples=LLM_HEDGE_MIN_SAMPLES),
+            single_flight=self.single_flight,
+        )
+
+        # Each role calls the model of its tier (small and fast for decisions, large for answers)
+        # with its own deadline
+        tier_configs = {
+            tier: with_http_client(with_response_cache(config_list, self.response_cache), self.http_client)
+            for tier, config_list in MODEL_CONFIGS.items()
+        }
+        self.role_configs = {
+            role: for_role(tier_configs[tier], role, LLM_ROLE_TIMEOUTS.get(role), LLM_ROLE_MAX_RETRIES.get(role))
+            for role, tier in ROLE_MODEL_TIERS.items()
+        }
+
+        # Report per-call token usage, including prompt tokens served from the provider's prompt cache
+        self.usage_logger = None
+        if LLM_USAGE_REPORT:
+            self.usage_logger = UsageLogger(echo=echo_usage)
+            autogen.runtime_logging.start(logger=self.usage_logger)
+
+        # Services come from the catalog, compiled once into a prompt bundle with content hashes
+        self.catalog = ServiceCatalog.load(SERVICE_CATALOG_PATH, PROMPT_BUNDLE_PATH)
+
+    def config_for(self, role: str):
+        """The autogen config list of a role, e.g. "specialist" or "classifier"."""
+        return self.role_configs[role]
+
+    def report(self) -> str:
+        """Response cache, rate limiter, single-flight, hedging and token usage statistics so far."""
+        lines = []
+        if self.response_cache is not None:
+            stats = self.response_cache.stats()
+            lines.append(f"LLM response cache: {stats['hits']} hits, {stats['misses']} misses, {stats['entries']} entries")
+        if self.rate_limiter is not None:
+            lines.append(self.rate_limiter.report())
+        if self.single_flight is not None:
+            lines.append(self.single_flight.report())
+        if LLM_HEDGING:
+            lines.append(self.http_client.report())
+        if self.usage_logger is not None:
+            lines.append(self.usage_logger.report())
+        return "\n".join(lines)
+
+    def close(self) -> None:
+        """Stop usage logging, write the cache statistics and close the HTTP connections.
+
+        The statistics stay available through ``report``.
+        """
+        if self.response_cache is not None:
+            self.response_cache.flush()
+        if self.usage_logger is not None:
+            autogen.runtime_logging.stop()
+        self.http_client.close()
+
+
+class SupportSession:
+    """The agents of one support conversation, built by :func:`create_session`."""
+
+    def __init__(self, user_proxy, research_coordinator, solution_coordinator, surveyer, human_expert):
+        self.user_proxy = user_proxy
+        self.research_coordinator = research_coordinator
+        self.solution_coordinator = solution_coordinator
+        self.surveyer = surveyer
+        self.human_expert = human_expert
+
+    def run(self, message: str = "hi", survey: bool = True):
+        """Run the research, solution and (optionally) survey chats and return their ChatResults."""
+        # user starts the conversation with the coordinator
+        chats = [
+            {
+                "recipient": self.research_coordinator,
+                "message": message,
+                "summary_method": "reflection_with_llm",
+            },
+            {
+                "recipient": self.solution_coordinator,
+                "message": "Based on the research findings, create a detailed solution plan.",
+                "summary_method": "last_msg",
+            },
+            {
+                "recipient": self.surveyer,
+                "message": "Based on the provided information, determine whether the user is satisfied with the support experience.",
+                "carryover": "The customer is a newbie AWS user.",
+            },
+        ]
+        if not survey:
+            chats = chats[:2]
+        return self.user_proxy.initiate_chats(chats)
+
+
+def create_session(system: SupportSystem, store_approved: bool = True, on_token=None) -> SupportSession:
+    """Create the agents, group chats and reply functions of a new support session.
+
+    With ``store_approved`` False, approved questions and solutions are not
+    added to the question cache and solution store (e.g. when the approvals
+    are provisional); both are still consulted. With ``on_token`` (and
+    ``SOLUTION_STREAMING`` on), the specialists' completions are streamed and
+    ``on_token(agent_name, text)`` is called with each chunk as it arrives.
+    """
+    catalog = system.catalog
+
+    # Bound the history each researcher, specialist and speaker selection re-sends per
+    # group chat round: recent turns verbatim, older turns folded into a digest, capped in tokens
+    history_compactor = HistoryCompactor(
+        keep_last=HISTORY_KEEP_TURNS,
+        max_tokens=HISTORY_MAX_TOKENS,
+        digest_chars=HISTORY_DIGEST_CHARS,
+        model=OPENAI_CONFIG[0]["model"],
+    )
+    history_compaction = TransformMessages(transforms=[history_compactor], verbose=False)
+
+    def prepare_agent(agent):
+        history_compaction.add_to_agent(agent)
+        # Solutions reach the client while they are written, not only once complete
+        if on_token is not None and SOLUTION_STREAMING and agent.name in specialists:
+            stream_tokens(agent, on_token)
+
+    # Create agents; researchers and specialists are built when first routed to
+    user_proxy, research_coordinator, solution_coordinator, specialists, researchers, human_expert, router = create_agents(
+        on_create=prepare_agent, catalog=catalog, role_configs=system.role_configs
+    )
+    
+    # Both group chats go to the Human Expert, or end, as soon as a pass brings no new information
+    def stop_early(selector):
+        return AdaptiveStop(
+            selector,
+            reviewer_name=HUMAN_EXPERT_NAME,
+            similarity=GROUPCHAT_NOVELTY_SIMILARITY,
+            max_idle_turns=GROUPCHAT_MAX_IDLE_TURNS,
+            max_repeats=GROUPCHAT_MAX_REPEATS,
+        )
+
+    # Create group chat with researchers
+    # Speakers are picked by the local router and join the chat when first
+    # picked; the LLM selector is only used as a fallback when no researcher
+    # matches the problem confidently, after all of them have joined.
+    researcher_group = autogen.GroupChat(
+        agents=[human_expert],
+        messages=[],
+        speaker_selection_method=stop_early(
+            RouterSpeakerSelector(
+                router,
+                reviewer_name=HUMAN_EXPERT_NAME,
+                threshold=ROUTER_CONFIDENCE_THRESHOLD,
+                max_speakers=ROUTER_MAX_SPEAKERS,
+                join=lambda groupchat, names: researchers.join(groupchat, researchers_manager, names),
+            )
+        ),
+        select_speaker_auto_verbose=True,
+        allow_repeat_speaker=True,
+        max_round=GROUPCHAT_MAX_ROUND,
+    )
+    compact_speaker_selection(researcher_group, history_compactor)
+    researchers_manager = autogen.GroupChatManager(
+        groupchat=researcher_group,
+        human_input_mode="TERMINATE",
+        llm_config={"config_list": system.config_for("speaker_selection")},
+    )
+    
+    # Create group chat with specialists
+    # Only the specialists routed to the task join; the LLM picks among them.
+    specialist_group = autogen.GroupChat(
+        agents=[human_expert],
+        messages=[],
+        speaker_selection_method=stop_early(
+            RoutedAutoSelector(
+                router,
+                specialists.names(),
+                join=lambda groupchat, names: specialists.join(groupchat, specialists_manager, names),
+                threshold=ROUTER_CONFIDENCE_THRESHOLD,
+                max_agents=ROUTER_MAX_SPEAKERS,
+            )
+        ),
+        select_speaker_auto_verbose=True,
+        allow_repeat_speaker=True,
+        max_round=GROUPCHAT_MAX_ROUND,
+    )
+    compact_speaker_selection(specialist_group, history_compactor)
+    specialists_manager = autogen.GroupChatManager(
+        groupchat=specialist_group,
+        human_input_mode="TERMINATE",
+        llm_config={"config_list": system.config_for("speaker_selection")},
+    )
+
+    # Create surveyer
+    surveyer = autogen.AssistantAgent(
+        name="surveyer",
+        llm_config={"config_list": system.config_for("survey")},
+        human_input_mode="NEVER",
+        system_message="""
+            You are a surveyer.
+            Your ask a single question.
+            You job is to get a number between 1 and 10 from the user about support experience before ending the conversation.
+
+            Reply "TERMINATE" when you have no more questions.
+        """,
+    )
+
+    # Chat summaries are written by the summary model; autogen asks the chat's sender for them
+    summarizer = autogen.ConversableAgent(
+        name="summarizer",
+        llm_config={"config_list": system.config_for("summary")},
+        human_input_mode="NEVER",
+    )
+
+    # The survey and the chat summaries yield to calls a user is waiting for under rate limits
+    prioritize(surveyer, BACKGROUND)
+    for agent in (user_proxy, research_coordinator, solution_coordinator):
+        prioritize_summaries(agent, BACKGROUND, llm_agent=summarizer)
+
+    # Clear-cut messages (greetings, numbered answers, obvious AWS questions) are classified locally
+    local_classifier = LocalClassifier(router.service_terms(), technical_score=CLASSIFIER_TECHNICAL_SCORE)
+
+    # The LLM classifier is built once, on the first ambiguous message
+    @functools.lru_cache(maxsize=None)
+    def question_classifier():
+        return autogen.AssistantAgent(
+            name="question_classifier",
+            llm_config={"config_list": system.config_for("classifier")},
+            system_message="""
+                You are a classifier. Determine if the input is a technical question or problem that needs AWS expertise.
+                
+                Reply "YES" if:
+                - Message asks about AWS technical issues/problems
+                - Message requests technical guidance or troubleshooting
+                - Message describes technical errors or system behavior
+                
+                Reply "NO" if:
+                - Message is casual chat/greetings ("hi", "hello", etc)
+                - Message is a numbered list of answers to previous questions
+                - Message contains only status updates or confirmations
+                - Message is non-technical feedback or comments
+                
+                Examples:
+                "Hi there" -> "NO"
+                "1. Yes 2. Production 3. Last week" -> "NO" 
+                "How do I configure VPC peering?" -> "YES"
+                "My Lambda function is timing out" -> "YES"
+            """,
+        )
+
+    # Function to determine if a question is technical using LLM.
+    # Trigger checks run once per registered reply function, so each message
+    # content is classified only once.
+    @functools.lru_cache(maxsize=256)
+    def classify_message(content):
+        verdict = local_classifier.classify(content)
+        if verdict is not None:
+            return verdict
+
+        # Use an LLM to classify the ambiguous question
+        response = research_coordinator.initiate_chat(
+            recipient=question_classifier(),
+            message=content,
+            max_turns=1,
+        )
+
+        return response.summary.strip().upper() == "YES"
+
+    def is_technical_question_llm(agent):
+        return classify_message(agent.last_message()["content"])
+
+    # Function to handle follow-up questions that returns boolean
+    def should_trigger_research(sender):
+        # Only trigger for user_proxy messages
+        if sender is not user_proxy:
+            return False
+            
+        # Get last message
+        try:
+            last_message = sender.last_message()['content']  # Extract the content from the message dict
+        except:
+            return False
+            
+        # Skip empty messages
+        if not last_message:
+            return False
+            
+        # First check if it's a technical question
+        is_technical = is_technical_question_llm(sender)
+        
+        # For non-technical initial messages, don't trigger research
+        if not is_technical and "TERMINATE" not in last_message:
+            return False
+            
+        # For technical questions or responses to clarifying questions
+        if is_technical or (last_message and "TERMINATE" not in last_message and len(last_message.strip()) > 0):
+            return True
+            
+        return False
+
+    # Create research nested chats
+    research_nested_chat_queue = [
+        {
+            "recipient": researchers_manager,
+            "summary_method": "reflection_with_llm",
+            "summary_args": { 
+                "summary_prompt": RESEARCH_SUMMARY_PROMPT
+            },
+        },
+    ]
+    if RESEARCH_SUMMARY == "local":
+        # Merge, de-duplicate and renumber the questions locally instead of with an LLM call
+        research_nested_chat_queue[0]["summary_method"] = QuestionSummary(
+            researcher_group,
+            researcher_names=researchers.names(),
+            reviewer_name=HUMAN_EXPERT_NAME,
+            similarity=QUESTION_DEDUP_SIMILARITY,
+        )
+
+    def start_drafts(problem, questions):
+        if solution_drafts is not None:
+            # The user answers the questions next; confidently routed specialists draft meanwhile
+            solution_drafts.start(problem, questions)
+
+    # Approved question sets are remembered for near-duplicate problems
+    question_cache = None
+    if QUESTION_CACHE_PATH:
+        question_cache = QuestionCache(
+            QUESTION_CACHE_PATH,
+            review=lambda questions: request_review(research_coordinator, human_expert, questions),
+            threshold=QUESTION_CACHE_THRESHOLD,
+            max_entries=QUESTION_CACHE_MAX_ENTRIES,
+            version=combined_fingerprint(catalog.researcher_fingerprints()),
+            on_approved=start_drafts,
+        )
+
+    def remember_questions(problem, questions, researcher_names=None):
+        if question_cache is not None and store_approved:
+            question_cache.store(problem, questions)
+        start_drafts(problem, questions)
+
+    if RESEARCH_MODE == "fanout":
+        # Ask all relevant researchers concurrently instead of one speaker per round
+        research_fanout = ResearchFanout(
+            router,
+            researchers,
+            review=lambda questions: request_review(research_coordinator, human_expert, questions),
+            threshold=ROUTER_CONFIDENCE_THRESHOLD,
+            max_researchers=ROUTER_MAX_SPEAKERS,
+            max_reworks=RESEARCH_MAX_REWORKS,
+            on_approved=remember_questions,
+            similarity=QUESTION_DEDUP_SIMILARITY,
+        )
+        research_coordinator.register_reply(
+            trigger=should_trigger_research,
+            reply_func=research_fanout.generate_reply,
+            position=2,
+        )
+    else:
+        def research_from_nested_chats(chat_queue, recipient, messages, sender, config):
+            final, questions = autogen.ConversableAgent._summary_from_nested_chats(
+                chat_queue, recipient, messages, sender, config
+            )
+            if questions and is_approved(last_verdict(researcher_group.messages, HUMAN_EXPERT_NAME)):
+                remember_questions(messages[-1]["content"], questions)
+            return final, questions
+
+        # Register research nested chats with fixed trigger
+        research_coordinator.register_nested_chats(
+            research_nested_chat_queue,
+            trigger=should_trigger_research,
+            reply_func_from_nested_chats=research_from_nested_chats,
+        )
+
+    if question_cache is not None:
+        # Checked before the research phase: a confident hit skips the researchers
+        research_coordinator.register_reply(
+            trigger=should_trigger_research,
+            reply_func=question_cache.generate_reply,
+            position=2,
+        )
+
+    solution_nested_chat_queue = [
+        {
+            "recipient": specialists_manager,
+            "summary_method": "reflection_with_llm",
+            "summary_args": { 
+                "summary_prompt": SOLUTION_SUMMARY_PROMPT
+            },
+        },
+    ]
+
+    def current_ticket():
+        """Return the user's problem statement and their answers to the clarifying questions."""
+        user_messages = [
+            message.get("content") or ""
+            for message in user_proxy.chat_messages.get(research_coordinator, [])
+            if message.get("name") == USER_PROXY_NAME
+        ]
+        technical = [i for i, content in enumerate(user_messages) if content and classify_message(content)]
+        if not technical:
+            return "", ""
+        return user_messages[technical[0]], "\n".join(user_messages[technical[0] + 1:])
+
+    # Solutions drafted while the user answers the questions (started by start_drafts)
+    solution_drafts = None
+    if SOLUTION_SPECULATION and SOLUTION_MODE == "parallel":
+        solution_drafts = SolutionDrafts(
+            router,
+            specialists,
+            ticket=current_ticket,
+            threshold=SPECULATION_THRESHOLD,
+            max_specialists=ROUTER_MAX_SPEAKERS,
+            max_concurrency=SOLUTION_MAX_CONCURRENCY,
+            grace=SPECULATION_GRACE,
+        )
+
+    # Approved solutions are reused for repeat tickets with the same answers
+    solution_store = None
+    if SOLUTION_STORE_PATH:
+        solution_store = SolutionStore(
+            SOLUTION_STORE_PATH,
+            fingerprints=catalog.specialist_fingerprints(SPECIALIST_PROMPT_TIER, SPECIALIST_OUTPUT),
+            ticket=current_ticket,
+            max_age=SOLUTION_STORE_MAX_AGE,
+        )
+
+    def remember_solution(solution, specialist_names=None):
+        if solution_store is not None and store_approved:
+            solution_store.remember(solution, specialist_names)
+
+    if SPECIALIST_OUTPUT == "json":
+        # Validate, rank, de-duplicate and render the specialists' structured replies locally
+        solution_aggregator = SolutionAggregator(router, current_ticket, similarity=SOLUTION_DEDUP_SIMILARITY)
+        aggregate_solutions = solution_aggregator.aggregate
+        solution_nested_chat_queue[0]["summary_method"] = SolutionSummary(
+            specialist_group,
+            specialist_names=specialists.names(),
+            reviewer_name=HUMAN_EXPERT_NAME,
+            aggregator=solution_aggregator,
+        )
+    else:
+        def aggregate_solutions(replies):
+            return reflect_with_llm(summarizer, SOLUTION_SUMMARY_PROMPT, replies)
+
+    if SOLUTION_MODE == "parallel":
+        # Run the routed specialists concurrently and aggregate their answers once
+        solution_engine = SolutionEngine(
+            router,
+            specialists,
+            aggregate=aggregate_solutions,
+            review=lambda solutions: request_review(solution_coordinator, human_expert, solutions),
+            threshold=ROUTER_CONFIDENCE_THRESHOLD,
+            max_specialists=ROUTER_MAX_SPEAKERS,
+            max_concurrency=SOLUTION_MAX_CONCURRENCY,
+            timeout=SOLUTION_TIMEOUT,
+            max_reworks=SOLUTION_MAX_REWORKS,
+            on_approved=lambda problem, solution, names: remember_solution(solution, names),
+            drafts=solution_drafts,
+        )
+        solution_coordinator.register_reply(
+            trigger=user_proxy,
+            reply_func=solution_engine.generate_reply,
+            position=2,
+        )
+    else:
+        def solution_from_nested_chats(chat_queue, recipient, messages, sender, config):
+            final, solution = autogen.ConversableAgent._summary_from_nested_chats(
+                chat_queue, recipient, messages, sender, config
+            )
+            if solution and is_approved(last_verdict(specialist_group.messages, HUMAN_EXPERT_NAME)):
+                specialist_names = set(specialists.names())
+                remember_solution(
+                    solution,
+                    sorted({m.get("name") for m in specialist_group.messages} & specialist_names),
+                )
+            return final, solution
+
+        # Create solution nested chats
+        solution_coordinator.register_nested_chats(
+            solution_nested_chat_queue,
+            trigger=user_proxy,
+            reply_func_from_nested_chats=solution_from_nested_chats,
+        )
+
+    if solution_store is not None:
+        # Checked before the solution phase: a repeat ticket gets the approved solution back
+        solution_coordinator.register_reply(
+            trigger=user_proxy,
+            reply_func=solution_store.generate_reply,
+            position=2,
+        )
+
+    return SupportSession(user_proxy, research_coordinator, solution_coordinator, surveyer, human_expert)
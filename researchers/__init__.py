@@ -1,31 +1,6 @@
+"""AWS Support System researchers package; the services themselves are defined in the catalog."""
 from .base_researcher import BaseResearcher
-from .ec2_researcher import EC2Researcher
-from .vpc_researcher import VPCResearcher
-from .eks_researcher import EKSResearcher
-from .iam_researcher import IAMResearcher
-from .cloudwatch_researcher import CloudWatchResearcher
-from .lambda_researcher import LambdaResearcher
-from .ecs_researcher import ECSResearcher
-from .s3_researcher import S3Researcher
-from .sns_researcher import SNSResearcher
-from .sqs_researcher import SQSResearcher
-from .rds_researcher import RDSResearcher
-from .elasticache_researcher import ElastiCacheResearcher
-from .aurora_researcher import AuroraResearcher
 
 __all__ = [
     'BaseResearcher',
-    'EC2Researcher',
-    'VPCResearcher',
-    'EKSResearcher',
-    'IAMResearcher',
-    'CloudWatchResearcher',
-    'LambdaResearcher',
-    'ECSResearcher',
-    'S3Researcher',
-    'SNSResearcher',
-    'SQSResearcher',
-    'RDSResearcher',
-    'ElastiCacheResearcher',
-    'AuroraResearcher'
-] 
\ No newline at end of file
+]
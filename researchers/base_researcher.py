@@ -4,9 +4,12 @@ import autogen
 class BaseResearcher:
     def __init__(self, openai_config):
         self.openai_config = openai_config
+        # The shared instructions come first and are identical for every researcher,
+        # so the provider can cache them as a common prompt prefix; the service
+        # area, expertise and example questions follow at the end.
         self.base_system_message = """
-        You are a specialized AWS researcher for {service_area}.
-        You have deep expertise in: {expertise}
+        You are a specialized AWS researcher on a team where each researcher covers
+        one AWS service area, described at the end of this message.
         
         Your role is to:
         1. Carefully analyze if the user's question relates to your expertise area
@@ -35,8 +38,30 @@ class BaseResearcher:
         - Ask specific, focused questions that require concrete answers
         - Avoid general or obvious questions
         - Don't ask about standard configurations unless critical
+        
+        YOUR SERVICE AREA: {service_area}
+        You have deep expertise in: {expertise}
         """
 
+    def build_system_message(self, example_questions) -> str:
+        """Render the shared instructions for this researcher's service, followed by its example questions."""
+        questions = "".join(f"        {number}. {question}\n" for number, question in enumerate(example_questions, 1))
+        return self.base_system_message.format(
+            service_area=self.service_area,
+            expertise="\n- ".join(self.expertise)
+        ) + "\n        Example technical questions to consider:\n" + questions + "        "
+
+    @classmethod
+    def from_bundle(cls, entry, openai_config) -> "BaseResearcher":
+        """Create a researcher from its compiled catalog entry, with the pre-rendered system message."""
+        researcher = cls(openai_config)
+        researcher.name = entry["name"]
+        researcher.description = entry["description"]
+        researcher.service_area = entry["service_area"]
+        researcher.expertise = entry["expertise"]
+        researcher.system_message = entry["system_message"]
+        return researcher
+
     def create_agent(self) -> autogen.AssistantAgent:
         """Create a researcher agent with specific expertise."""
         return autogen.AssistantAgent(
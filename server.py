@@ -0,0 +1,421 @@
+"""HTTP service mode: many concurrent, independent support sessions in one process.
+
+API (JSON in and out):
+    POST   /sessions                {"message": "..."}                 start a session
+    GET    /sessions                                                   list sessions
+    GET    /sessions/<id>[?wait=s]                                     session state
+    GET    /sessions/<id>/transcript                                   printed output
+    GET    /sessions/<id>/stream[?after=n]                             solution tokens (Server-Sent Events)
+    POST   /sessions/<id>/input     {"agent": "User", "content": ...}  answer the pending request
+    DELETE /sessions/<id>                                              end and forget a session
+
+    GET    /reviews[?status=pending]                                   review queue
+    POST   /reviews/claim           {"reviewer": "...", "id": n}       claim the oldest (or a given) item
+    GET    /reviews/<n>                                                one item
+    POST   /reviews/<n>/verdict     {"reviewer", "verdict"}            APPROVE or "REWORK: <feedback>"
+    POST   /reviews/<n>/release     {"reviewer": "..."}                put a claimed item back
+
+A session's state has a ``status`` ("queued", "running", "done" or
+"failed") and the ``pending`` input request, if any: the agent that waits
+(the User or the Human Expert) and the message it has to answer. Starting a
+session and posting input wait up to ``wait`` seconds for the next request
+or the end.
+
+Sessions run on a pool of ``SERVER_WORKERS`` threads. autogen chats block,
+so a session holds its worker from start to end, including while it waits
+for input (up to ``SERVER_IDLE_TIMEOUT`` per request). Sessions started
+while every worker is busy are "queued" until one frees up, and beyond
+``SERVER_MAX_SESSIONS`` queued and running sessions new ones get 503.
+
+With a review queue (``REVIEW_QUEUE_PATH``), the Human Expert's reviews are
+not pending in the session: they are queued for any expert to claim and
+decide, and the session shows the item under ``review`` and resumes when the
+verdict arrives. Without one, the Human Expert answers through the session's
+input like the User.
+
+The stream sends the specialists' solution text as it is generated, one
+``token`` event per chunk ({"agent", "text"}, with the stream position as
+the event id), and ends with a ``state`` event once the session needs input
+or has ended. Reconnect with ``after`` set to the last id to continue.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlsplit
+
+from autogen.io.base import IOStream
+
+from config import (
+    SERVER_HOST,
+    SERVER_PORT,
+    SERVER_WORKERS,
+    SERVER_MAX_SESSIONS,
+    SERVER_IDLE_TIMEOUT,
+    SERVER_POLL_TIMEOUT,
+    SERVER_SESSION_RETENTION,
+    SERVER_STREAM_BUFFER,
+    HUMAN_EXPERT_NAME,
+    REVIEW_QUEUE_PATH,
+    REVIEW_CLAIM_TIMEOUT,
+    REVIEW_TIMEOUT,
+)
+from pipeline import SupportSystem, create_session
+from utils import ReviewChannel, ReviewQueue, ReviewStateError, SessionChannel, SessionIO
+
+MAX_BODY_BYTES = 1024 * 1024
+CHAT_NAMES = ("research", "solution", "survey")
+
+
+class HTTPError(Exception):
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class EventStream(NamedTuple):
+    handle: "SessionHandle"
+    after: int
+
+
+class SessionHandle:
+    """One support session, queued on ``executor`` and running its chats on one of its threads."""
+
+    def __init__(
+        self,
+        system: SupportSystem,
+        message: str,
+        loop: asyncio.AbstractEventLoop,
+        executor: ThreadPoolExecutor,
+        idle_timeout: float,
+        reviews: Optional[ReviewQueue] = None,
+        review_timeout: float = REVIEW_TIMEOUT,
+    ):
+        self.id = uuid.uuid4().hex
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.system = system
+        self.io = SessionIO()
+        if reviews is not None:
+            self.channel = ReviewChannel(
+                reviews,
+                self.id,
+                HUMAN_EXPERT_NAME,
+                review_timeout,
+                loop,
+                idle_timeout=idle_timeout,
+                max_tokens=SERVER_STREAM_BUFFER,
+            )
+        else:
+            self.channel = SessionChannel(loop, idle_timeout=idle_timeout, max_tokens=SERVER_STREAM_BUFFER)
+        self.channel.status = "queued"
+        self.future = executor.submit(self._run, message)
+
+    def _run(self, message: str) -> None:
+        self.channel.start()
+        with IOStream.set_default(self.io):
+            try:
+                session = create_session(self.system, on_token=self.channel.publish)
+                self.channel.bind(session.user_proxy)
+                self.channel.bind(session.human_expert)
+                results = session.run(message)
+                self.channel.finish([{"chat": name, "summary": result.summary} for name, result in zip(CHAT_NAMES, results)])
+            except Exception as e:
+                self.channel.finish(error=f"{type(e).__name__}: {e}")
+        self.finished_at = time.time()
+
+    def state(self) -> Dict:
+        return {"id": self.id, **self.channel.state()}
+
+    def cancel(self) -> None:
+        """End the session; a session still queued never starts."""
+        self.channel.cancel()
+        self.future.cancel()
+
+    async def a_state(self) -> Dict:
+        """``state`` from a worker thread, since a review session's state queries the review queue."""
+        return await asyncio.get_running_loop().run_in_executor(None, self.state)
+
+
+class SessionServer:
+    """Routes HTTP requests to sessions and the review queue, and forgets finished sessions after ``retention`` seconds."""
+
+    def __init__(
+        self,
+        system: SupportSystem,
+        workers: int,
+        max_sessions: int,
+        idle_timeout: float,
+        poll_timeout: float,
+        retention: float,
+        reviews: Optional[ReviewQueue] = None,
+        review_timeout: float = REVIEW_TIMEOUT,
+    ):
+        self.system = system
+        self.reviews = reviews
+        self.review_timeout = review_timeout
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="session")
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.poll_timeout = poll_timeout
+        self.retention = retention
+        self.sessions: Dict[str, SessionHandle] = {}
+
+    def _session(self, session_id: str) -> SessionHandle:
+        handle = self.sessions.get(session_id)
+        if handle is None:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"Unknown session {session_id}")
+        return handle
+
+    def _wait(self, query: Dict) -> float:
+        try:
+            wait = float(query.get("wait", [self.poll_timeout])[0])
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "wait must be a number of seconds")
+        return min(max(wait, 0.0), self.poll_timeout)
+
+    async def dispatch(self, method: str, path: str, query: Dict, body: Dict) -> Tuple[HTTPStatus, Union[Dict, EventStream]]:
+        parts = [part for part in path.split("/") if part]
+        if parts and parts[0] == "reviews" and len(parts) <= 3:
+            return await self.dispatch_review(method, parts, query, body)
+        if not parts or parts[0] != "sessions" or len(parts) > 3:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"No route for {path}")
+
+        if len(parts) == 1 and method == "POST":
+            active = sum(1 for handle in self.sessions.values() if handle.channel.status in ("queued", "running"))
+            if active >= self.max_sessions:
+                raise HTTPError(
+                    HTTPStatus.SERVICE_UNAVAILABLE, f"{active} sessions are queued or running, the limit is {self.max_sessions}"
+                )
+            message = body.get("message") or "hi"
+            if not isinstance(message, str):
+                raise HTTPError(HTTPStatus.BAD_REQUEST, "message must be a string")
+            handle = SessionHandle(
+                self.system,
+                message,
+                asyncio.get_running_loop(),
+                self.executor,
+                self.idle_timeout,
+                self.reviews,
+                self.review_timeout,
+            )
+            self.sessions[handle.id] = handle
+            await handle.channel.wait(self._wait(query))
+            return HTTPStatus.CREATED, await handle.a_state()
+        if len(parts) == 1 and method == "GET":
+            return HTTPStatus.OK, {
+                "sessions": [
+                    {
+                        "id": handle.id,
+                        "status": handle.channel.status,
+                        "waiting_for": getattr(handle.channel.pending, "agent", None),
+                        "review": getattr(handle.channel, "review_id", None),
+                    }
+                    for handle in self.sessions.values()
+                ]
+            }
+
+        handle = self._session(parts[1])
+        if len(parts) == 2 and method == "GET":
+            if "wait" in query:
+                await handle.channel.wait(self._wait(query))
+            return HTTPStatus.OK, await handle.a_state()
+        if len(parts) == 2 and method == "DELETE":
+            handle.cancel()
+            del self.sessions[handle.id]
+            return HTTPStatus.OK, {"id": handle.id, "status": "deleted"}
+        if parts[2:] == ["transcript"] and method == "GET":
+            return HTTPStatus.OK, {"id": handle.id, "transcript": handle.io.transcript()}
+        if parts[2:] == ["stream"] and method == "GET":
+            try:
+                after = int(query.get("after", ["0"])[0])
+            except ValueError:
+                raise HTTPError(HTTPStatus.BAD_REQUEST, "after must be a stream position")
+            return HTTPStatus.OK, EventStream(handle, after)
+        if parts[2:] == ["input"] and method == "POST":
+            agent, content = body.get("agent"), body.get("content", "")
+            if not isinstance(agent, str) or not isinstance(content, str):
+                raise HTTPError(HTTPStatus.BAD_REQUEST, "agent and content must be strings")
+            if not handle.channel.answer(agent, content):
+                raise HTTPError(HTTPStatus.CONFLICT, f"Session {handle.id} is not waiting for input from {agent}")
+            await handle.channel.wait(self._wait(query))
+            return HTTPStatus.OK, await handle.a_state()
+        raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, f"{method} is not supported on {path}")
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            try:
+                method, path, query, body = await read_request(reader)
+                status, payload = await self.dispatch(method, path, query, body)
+            except HTTPError as e:
+                status, payload = e.status, {"error": str(e)}
+            except Exception as e:
+                status, payload = HTTPStatus.INTERNAL_SERVER_ERROR, {"error": f"{type(e).__name__}: {e}"}
+            if isinstance(payload, EventStream):
+                await self.send_events(writer, payload)
+                return
+            data = json.dumps(payload).encode("utf-8")
+            writer.write(
+                f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                f"Content-Type: application/json\r\nContent-Length: {len(data)}\r\nConnection: close\r\n\r\n".encode("ascii")
+                + data
+            )
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def dispatch_review(self, method: str, parts: List[str], query: Dict, body: Dict) -> Tuple[HTTPStatus, Dict]:
+        if self.reviews is None:
+            raise HTTPError(HTTPStatus.NOT_FOUND, "The review queue is disabled; reviews are answered in each session")
+        loop = asyncio.get_running_loop()
+        if len(parts) == 1 and method == "GET":
+            status = query.get("status", [None])[0]
+            items = await loop.run_in_executor(None, self.reviews.items, status)
+            return HTTPStatus.OK, {"reviews": [item._asdict() for item in items]}
+        reviewer = body.get("reviewer")
+        if method == "POST" and (not isinstance(reviewer, str) or not reviewer):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "reviewer must be a non-empty string")
+        if parts[1:] == ["claim"] and method == "POST":
+            item_id = body.get("id")
+            if item_id is not None and not isinstance(item_id, int):
+                raise HTTPError(HTTPStatus.BAD_REQUEST, "id must be a review number")
+            item = await loop.run_in_executor(None, self.reviews.claim, reviewer, item_id)
+            return HTTPStatus.OK, {"review": item._asdict() if item is not None else None}
+
+        try:
+            item_id = int(parts[1])
+        except ValueError:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"Unknown review {parts[1]}")
+        try:
+            if len(parts) == 2 and method == "GET":
+                item = await loop.run_in_executor(None, self.reviews.get, item_id)
+                if item is None:
+                    raise KeyError(item_id)
+            elif parts[2:] == ["verdict"] and method == "POST":
+                verdict = body.get("verdict")
+                if not isinstance(verdict, str):
+                    raise HTTPError(HTTPStatus.BAD_REQUEST, "verdict must be a string")
+                item = await loop.run_in_executor(None, self.reviews.decide, item_id, reviewer, verdict)
+            elif parts[2:] == ["release"] and method == "POST":
+                item = await loop.run_in_executor(None, self.reviews.release, item_id, reviewer)
+            else:
+                raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, f"{method} is not supported on /{'/'.join(parts)}")
+        except KeyError:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"Unknown review {item_id}")
+        except ReviewStateError as e:
+            raise HTTPError(HTTPStatus.CONFLICT, str(e))
+        except ValueError as e:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, str(e))
+        return HTTPStatus.OK, {"review": item._asdict()}
+
+    async def send_events(self, writer: asyncio.StreamWriter, stream: EventStream) -> None:
+        """Send a session's streamed tokens as Server-Sent Events until it needs input or has ended."""
+        writer.write(
+            b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nCache-Control: no-cache\r\nConnection: close\r\n\r\n"
+        )
+        channel, position = stream.handle.channel, stream.after
+        while True:
+            events = await channel.wait_tokens(position, self.poll_timeout)
+            for event in events:
+                data = json.dumps({"agent": event.agent, "text": event.text})
+                writer.write(f"id: {event.seq}\nevent: token\ndata: {data}\n\n".encode("utf-8"))
+            if events:
+                position = events[-1].seq
+            elif channel.waiting():
+                state = await stream.handle.a_state()
+                writer.write(f"event: state\ndata: {json.dumps(state)}\n\n".encode("utf-8"))
+                await writer.drain()
+                return
+            else:
+                writer.write(b": keep-alive\n\n")
+            await writer.drain()
+
+    async def sweep(self) -> None:
+        """Forget finished sessions once their retention period is over."""
+        while True:
+            await asyncio.sleep(60)
+            now = time.time()
+            for session_id, handle in list(self.sessions.items()):
+                if handle.finished_at is not None and now - handle.finished_at > self.retention:
+                    del self.sessions[session_id]
+
+
+async def read_request(reader: asyncio.StreamReader) -> Tuple[str, str, Dict, Dict]:
+    """Parse one HTTP/1.1 request with an optional JSON body."""
+    request_line = (await reader.readline()).decode("latin-1").strip()
+    try:
+        method, target, _ = request_line.split(" ", 2)
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Malformed request line")
+    headers = {}
+    while True:
+        line = (await reader.readline()).decode("latin-1").strip()
+        if not line:
+            break
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    length = int(headers.get("content-length") or 0)
+    if length > MAX_BODY_BYTES:
+        raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"Request bodies are limited to {MAX_BODY_BYTES} bytes")
+    body = {}
+    if length:
+        try:
+            body = json.loads(await reader.readexactly(length))
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Request body must be JSON")
+        if not isinstance(body, dict):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Request body must be a JSON object")
+    url = urlsplit(target)
+    return method.upper(), url.path, parse_qs(url.query), body
+
+
+async def serve(host: str, port: int) -> None:
+    system = SupportSystem(echo_usage=False)
+    reviews = ReviewQueue(REVIEW_QUEUE_PATH, claim_timeout=REVIEW_CLAIM_TIMEOUT) if REVIEW_QUEUE_PATH else None
+    server = SessionServer(
+        system,
+        workers=SERVER_WORKERS,
+        max_sessions=SERVER_MAX_SESSIONS,
+        idle_timeout=SERVER_IDLE_TIMEOUT,
+        poll_timeout=SERVER_POLL_TIMEOUT,
+        retention=SERVER_SESSION_RETENTION,
+        reviews=reviews,
+        review_timeout=REVIEW_TIMEOUT,
+    )
+    listener = await asyncio.start_server(server.handle_connection, host, port)
+    sweeper = asyncio.create_task(server.sweep())
+    print(f"AWS Support System listening on http://{host}:{port}")
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        sweeper.cancel()
+        for handle in server.sessions.values():
+            handle.cancel()
+        server.executor.shutdown(wait=False, cancel_futures=True)
+        system.close()
+        report = system.report()
+        if report:
+            print(report)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve support sessions over HTTP.")
+    parser.add_argument("--host", default=SERVER_HOST, help="Interface to listen on (default: %(default)s)")
+    parser.add_argument("--port", type=int, default=SERVER_PORT, help="Port to listen on (default: %(default)s)")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
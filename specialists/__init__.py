@@ -1,32 +1,8 @@
-"""AWS Support System specialists package."""
-from .base_specialist import BaseSpecialist
-from .eks_specialist import EKSSpecialist
-from .ec2_specialist import EC2Specialist
-from .vpc_specialist import VPCSpecialist
-from .iam_specialist import IAMSpecialist
-from .cloudwatch_specialist import CloudWatchSpecialist
-from .lambda_specialist import LambdaSpecialist
-from .ecs_specialist import ECSSpecialist
-from .s3_specialist import S3Specialist
-from .sns_specialist import SNSSpecialist
-from .sqs_specialist import SQSSpecialist
-from .rds_specialist import RDSSpecialist
-from .elasticache_specialist import ElastiCacheSpecialist
-from .aurora_specialist import AuroraSpecialist
+"""AWS Support System specialists package; the services themselves are defined in the catalog."""
+from .base_specialist import BaseSpecialist, PROMPT_TIERS, RESPONSE_FORMATS
 
 __all__ = [
     'BaseSpecialist',
-    'EKSSpecialist',
-    'EC2Specialist',
-    'VPCSpecialist',
-    'IAMSpecialist',
-    'CloudWatchSpecialist',
-    'LambdaSpecialist',
-    'ECSSpecialist',
-    'S3Specialist',
-    'SNSSpecialist',
-    'SQSSpecialist',
-    'RDSSpecialist',
-    'ElastiCacheSpecialist',
-    'AuroraSpecialist',
-] 
\ No newline at end of file
+    'PROMPT_TIERS',
+    'RESPONSE_FORMATS',
+]
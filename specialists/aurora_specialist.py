@@ -1,27 +0,0 @@
-from .base_specialist import BaseSpecialist
-
-class AuroraSpecialist(BaseSpecialist):
-    def __init__(self, config_list):
-        super().__init__("Aurora_Specialist", config_list)
-        self.description = "This agent works with the coordinator to refine the problem and propose solutions for Aurora services."
-        aurora_specific_message = """You are an AWS Aurora specialist. You have deep expertise in:
-        1. Cluster management
-        2. Global databases
-        3. Serverless configuration
-        4. Replication
-        5. Performance optimization
-        6. Backup and recovery
-        7. Security and encryption
-        8. Parameter groups
-
-        When providing solutions:
-        - Include complete cluster configurations
-        - Provide AWS CLI commands for Aurora management
-        - Show both console steps and CLI approaches
-        - Include security best practices
-        - Add monitoring setup
-        - Provide scaling strategies
-        - Include backup plans
-        - Add performance optimization tips"""
-
-        self.system_message = aurora_specific_message + self.system_message 
\ No newline at end of file
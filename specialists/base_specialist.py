@@ -1,12 +1,36 @@
 """Base specialist configuration for AWS support system."""
+import re
+
 import autogen
 
-class BaseSpecialist:
-    def __init__(self, name, config_list):
-        self.name = name
-        self.config_list = config_list
-        self.description = ""
-        self.system_message = """
+from utils.examples import ExampleLibrary, split_examples
+
+# Section headings of the service-specific prompts, e.g. "        Example format for solutions:"
+SECTION_HEADING = re.compile(r"^ {0,8}[A-Z][A-Za-z ,/&-]*:\s*$", re.MULTILINE)
+
+EXAMPLES_SECTION = "Example format for solutions"
+
+# Prompt tiers and the service-specific sections each one leaves out. The
+# introduction and "When providing solutions" are always kept. "on_demand"
+# leaves the examples out of the system message and injects only the ones
+# the conversation mentions (see create_agent).
+PROMPT_TIERS = {
+    "full": (),
+    "on_demand": ("Example format for solutions",),
+    "standard": ("Example format for solutions",),
+    "minimal": (
+        "Example format for solutions",
+        "Information gathering guidelines",
+        "Common patterns and best practices",
+    ),
+}
+
+# Shared response formats: "text" is the original free-text layout, "json" the
+# structured form parsed and aggregated locally by utils.solutions.
+TEXT_RESPONSE_FORMAT = """
+        You are an AWS specialist on a support team. Your service area, expertise and
+        solution guidelines are described after the response format below.
+
         RESPONSE FORMAT:
         Always structure your response as:
         
@@ -31,16 +55,113 @@ class BaseSpecialist:
         
         [If no viable solution]:
         No viable solution available for the given requirements.
+
         """
-        
+
+JSON_RESPONSE_FORMAT = """
+        You are an AWS specialist on a support team. Your service area, expertise and
+        solution guidelines are described after the response format below.
+
+        RESPONSE FORMAT:
+        Always respond with a single JSON object, and nothing else, of this form:
+        {
+            "solutions": [
+                {
+                    "name": "Solution name",
+                    "description": "Brief description",
+                    "implementation": [
+                        {"language": "bash", "code": "Implementation details, code, commands"}
+                    ],
+                    "best_practices": ["Relevant AWS best practice"],
+                    "considerations": {
+                        "complexity": "Low|Medium|High",
+                        "cost": "Low|Medium|High",
+                        "scalability": "Low|Medium|High",
+                        "maintenance": "Low|Medium|High"
+                    }
+                }
+            ]
+        }
+
+        List one object per solution, best first. Put every command, script and
+        configuration file in its own "implementation" block, complete and ready to use.
+        If no viable solution exists for the given requirements, return {"solutions": []}.
+
+        """
+
+RESPONSE_FORMATS = {"text": TEXT_RESPONSE_FORMAT, "json": JSON_RESPONSE_FORMAT}
+
+
+class BaseSpecialist:
+    def __init__(self, name, config_list, prompt_tier="full", output_format="text"):
+        if prompt_tier not in PROMPT_TIERS:
+            raise ValueError(f"Unknown prompt tier {prompt_tier!r}, expected one of {sorted(PROMPT_TIERS)}")
+        if output_format not in RESPONSE_FORMATS:
+            raise ValueError(f"Unknown output format {output_format!r}, expected one of {sorted(RESPONSE_FORMATS)}")
+        self.name = name
+        self.config_list = config_list
+        self.prompt_tier = prompt_tier
+        self.output_format = output_format
+        self.description = ""
+        self.service_message = ""
+        # Extra topics per example title, for on-demand example injection
+        self.example_tags = {}
+        self.max_examples = 2
+        # Shared by every specialist and kept first, so the provider can cache it as a
+        # common prompt prefix; the service-specific text from the catalog is appended after it.
+        self.system_message = RESPONSE_FORMATS[output_format]
+        self.shared_message = self.system_message
+
+    def build_system_message(self, service_message: str) -> str:
+        """Append the service-specific prompt to the shared one, trimmed to the prompt tier."""
+        self.service_message = service_message
+        return self.system_message_for(self.prompt_tier)
+
+    def sections(self):
+        """Split the service-specific prompt into (heading, text) pairs; the introduction has no heading."""
+        headings = list(SECTION_HEADING.finditer(self.service_message))
+        sections = [(None, self.service_message[:headings[0].start()] if headings else self.service_message)]
+        for heading, following in zip(headings, headings[1:] + [None]):
+            end = following.start() if following else len(self.service_message)
+            sections.append((heading.group().strip().rstrip(":"), self.service_message[heading.start():end]))
+        return sections
+
+    def system_message_for(self, tier: str) -> str:
+        """Return the system message for a prompt tier ("full", "on_demand", "standard" or "minimal")."""
+        dropped = PROMPT_TIERS[tier]
+        if not dropped:
+            return self.shared_message + self.service_message
+        return self.shared_message + "".join(text for heading, text in self.sections() if heading not in dropped)
+
+    def example_library(self) -> ExampleLibrary:
+        """The worked examples of this specialist as tagged, individually injectable snippets."""
+        section = "".join(text for heading, text in self.sections() if heading == EXAMPLES_SECTION)
+        return ExampleLibrary(split_examples(section, self.example_tags), self.max_examples)
+
+    @classmethod
+    def from_bundle(cls, entry, config_list, prompt_tier="full", output_format="text") -> "BaseSpecialist":
+        """Create a specialist from its compiled catalog entry, with the pre-rendered system message."""
+        specialist = cls(entry["name"], config_list, prompt_tier, output_format)
+        specialist.description = entry["description"]
+        specialist.example_tags = entry["example_tags"]
+        specialist.service_message = entry["service_message"]
+        specialist.system_message = entry["system_messages"][output_format][prompt_tier]
+        return specialist
+
     def create_agent(self) -> autogen.AssistantAgent:
         """Create a configuration for an agent."""
-        return autogen.AssistantAgent(
+        llm_config = {"config_list": self.config_list}
+        if self.output_format == "json":
+            llm_config["response_format"] = {"type": "json_object"}
+        agent = autogen.AssistantAgent(
             name=self.name,
             description=self.description,
-            llm_config={"config_list": self.config_list},
+            llm_config=llm_config,
             system_message=self.system_message,
             human_input_mode="TERMINATE",
             max_consecutive_auto_reply=2,
             is_termination_msg=lambda msg: "TERMINATE" in msg["content"].upper(),
         )
+        if self.prompt_tier == "on_demand":
+            agent.register_hook("process_all_messages_before_reply", self.example_library().inject)
+        return agent
@@ -0,0 +1,31 @@
+from types import SimpleNamespace
+
+import pytest
+
+
+def profile(name, service_area, expertise, description):
+    return SimpleNamespace(name=name, service_area=service_area, expertise=expertise, description=description)
+
+
+@pytest.fixture
+def researchers():
+    return [
+        profile(
+            "EKS_Researcher",
+            "Amazon EKS",
+            ["Kubernetes clusters", "pods and nodes", "CrashLoopBackOff"],
+            "Asks about AWS Kubernetes workloads",
+        ),
+        profile(
+            "Lambda_Researcher",
+            "AWS Lambda",
+            ["serverless functions", "timeouts", "cold starts"],
+            "Asks about AWS serverless functions",
+        ),
+        profile(
+            "VPC_Researcher",
+            "Amazon VPC",
+            ["subnets", "security groups", "peering"],
+            "Asks about AWS network setup",
+        ),
+    ]
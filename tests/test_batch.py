@@ -0,0 +1,82 @@
+import asyncio
+import json
+
+import batch
+from utils.sessions import InputRequest
+
+
+def write_lines(path, lines):
+    path.write_text("".join(line + "\n" for line in lines), encoding="utf-8")
+
+
+def test_ticket_fields_accept_the_supported_layouts():
+    assert batch.ticket_fields({"id": 7, "message": "Pods restart", "answers": ["1.29", "m5"]}, 1) == (
+        "7",
+        "Pods restart",
+        ["1. 1.29\n2. m5"],
+    )
+    ticket_id, text, answers = batch.ticket_fields({"title": "Pods restart", "body": "Since Monday"}, 3)
+    assert (ticket_id, text) == ("3", "Pods restart\n\nSince Monday")
+    assert answers == [batch.BATCH_DEFAULT_ANSWER]
+
+
+def test_ticket_input_answers_once_and_approves_reviews():
+    channel = batch.TicketInput(["1. 1.29"], review="queue")
+    expert = InputRequest("Human_Expert", "Research_Coordinator", "1. Which version?", "")
+    user = InputRequest("User", "Research_Coordinator", "1. Which version?", "")
+
+    assert channel.ask(expert) == "APPROVE"
+    assert [channel.ask(user), channel.ask(user)] == ["1. 1.29", "exit"]
+    assert channel.review_items == [{"sender": "Research_Coordinator", "content": "1. Which version?"}]
+
+
+def test_completed_lines_retry_failures_and_ignore_cut_lines(tmp_path):
+    output = tmp_path / "out.jsonl"
+    write_lines(output, [
+        json.dumps({"line": 1, "status": "done"}),
+        json.dumps({"line": 2, "status": "failed"}),
+        json.dumps({"line": 3, "status": "needs_review"}),
+        '{"line": 4, "sta',
+    ])
+
+    assert batch.completed_lines(str(output)) == {1, 3}
+    assert batch.completed_lines(str(tmp_path / "missing.jsonl")) == set()
+
+
+def test_read_tickets_skips_completed_and_reports_bad_lines(tmp_path):
+    tickets = tmp_path / "tickets.jsonl"
+    write_lines(tickets, ['{"message": "a"}', "", "not json", "[1]", '{"message": "b"}'])
+
+    items = list(batch.read_tickets(str(tickets), skip={1}))
+
+    assert [line for line, _, _ in items] == [3, 4, 5]
+    assert items[0][2].startswith("invalid JSON")
+    assert items[1][2] == "ticket must be a JSON object"
+    assert items[2][1:] == ({"message": "b"}, None)
+
+
+class FakeSystem:
+    def close(self):
+        pass
+
+    def report(self):
+        return ""
+
+
+def test_run_batch_appends_one_record_per_pending_line(tmp_path, monkeypatch):
+    monkeypatch.setattr(batch, "SupportSystem", lambda echo_usage: FakeSystem())
+    monkeypatch.setattr(
+        batch,
+        "process_ticket",
+        lambda system, line, ticket, review: {"line": line, "id": str(line), "status": "done", "solution": ticket["message"]},
+    )
+    tickets, output = tmp_path / "tickets.jsonl", tmp_path / "out.jsonl"
+    write_lines(tickets, [json.dumps({"message": f"ticket {i}"}) for i in range(1, 6)] + ["oops"])
+    write_lines(output, [json.dumps({"line": 2, "status": "done"})])
+
+    counts = asyncio.run(batch.run_batch(str(tickets), str(output), workers=3, review="approve"))
+
+    records = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    assert counts == {"done": 4, "failed": 1}
+    assert sorted(record["line"] for record in records) == [1, 2, 3, 4, 5, 6]
+    assert {record["line"]: record["status"] for record in records}[6] == "failed"
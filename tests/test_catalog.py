@@ -0,0 +1,79 @@
+import json
+import os
+import shutil
+
+import pytest
+
+import config
+from catalog import BUNDLE_VERSION, ServiceCatalog, compile_bundle, load_bundle, source_hash
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "services.json"
+    shutil.copy(config.SERVICE_CATALOG_PATH, path)
+    return str(path)
+
+
+def test_default_paths_do_not_depend_on_the_working_directory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    assert os.path.isfile(config.SERVICE_CATALOG_PATH)
+    for path in (config.SERVICE_CATALOG_PATH, config.PROMPT_BUNDLE_PATH):
+        assert os.path.dirname(path).startswith(config.BASE_DIR)
+
+
+def test_bundle_is_reused_while_its_source_hash_matches(source, tmp_path):
+    bundle_path = str(tmp_path / "bundle.json")
+    bundle = load_bundle(source, bundle_path)
+    assert bundle["version"] == BUNDLE_VERSION and bundle["source_hash"] == source_hash(source)
+
+    # A bundle with the right hash is read as it is, not recompiled
+    with open(bundle_path, encoding="utf-8") as f:
+        stored = json.load(f)
+    stored["services"][0]["key"] = "CACHED"
+    with open(bundle_path, "w", encoding="utf-8") as f:
+        json.dump(stored, f)
+    assert load_bundle(source, bundle_path)["services"][0]["key"] == "CACHED"
+
+
+def test_changed_catalog_recompiles_the_bundle(source, tmp_path):
+    bundle_path = str(tmp_path / "bundle.json")
+    before = load_bundle(source, bundle_path)
+    with open(source, encoding="utf-8") as f:
+        catalog = json.load(f)
+    catalog["services"][0]["researcher"]["description"] += " (updated)"
+    with open(source, "w", encoding="utf-8") as f:
+        json.dump(catalog, f)
+
+    after = load_bundle(source, bundle_path)
+
+    assert after["source_hash"] != before["source_hash"]
+    assert after["services"][0]["researcher"]["description"].endswith(" (updated)")
+
+
+def test_corrupt_bundle_is_rebuilt(source, tmp_path):
+    bundle_path = tmp_path / "bundle.json"
+    bundle_path.write_text("{not json")
+
+    assert load_bundle(source, str(bundle_path)) == compile_bundle(source)
+
+
+def test_duplicate_keys_are_rejected(source):
+    with open(source, encoding="utf-8") as f:
+        catalog = json.load(f)
+    catalog["services"].append(catalog["services"][0])
+    with open(source, "w", encoding="utf-8") as f:
+        json.dump(catalog, f)
+
+    with pytest.raises(ValueError, match="Duplicate service key"):
+        compile_bundle(source)
+
+
+def test_agents_are_named_after_their_service_key(source):
+    catalog = ServiceCatalog.load(source)
+    key = catalog.keys()[0]
+
+    assert catalog.researchers(None)[0].name == f"{key}_Researcher"
+    assert catalog.specialists(None)[0].name == f"{key}_Specialist"
+    assert set(catalog.specialist_fingerprints()) == {f"{key}_Specialist" for key in catalog.keys()}
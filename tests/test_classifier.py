@@ -0,0 +1,45 @@
+import pytest
+
+from utils.classifier import LocalClassifier
+from utils.router import ServiceRouter
+
+
+@pytest.fixture
+def classifier(researchers):
+    return LocalClassifier(ServiceRouter(researchers).service_terms(), technical_score=3.0)
+
+
+def test_service_terms_leave_out_vendor_words(researchers):
+    terms = ServiceRouter(researchers).service_terms()
+
+    assert {"eks", "lambda", "vpc"} <= set(terms)
+    assert not {"aws", "amazon"} & set(terms)
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["", "   ", "Hi there!", "Thanks so much", "ok", "Please proceed with the solution", "1. Yes\n2. Last week"],
+)
+def test_small_talk_and_answers_are_not_technical(classifier, text):
+    assert classifier.classify(text) is False
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "My EKS pods keep failing with CrashLoopBackOff, how do I fix it?",
+        "Lambda function timeout after deploying, why?",
+        "Security groups in my VPC block traffic to the database",
+    ],
+)
+def test_service_questions_are_technical(classifier, text):
+    assert classifier.classify(text) is True
+
+
+def test_vendor_words_alone_do_not_make_a_question_technical(classifier):
+    assert classifier.score("I love AWS and Amazon") == 0
+    assert classifier.classify("I love AWS and Amazon") is False
+
+
+def test_ambiguous_messages_go_to_the_llm(classifier):
+    assert classifier.classify("Something about my setup is weird and I would like another opinion on it today") is None
@@ -0,0 +1,49 @@
+from utils.examples import EXAMPLES_PREAMBLE, ExampleLibrary, split_examples
+
+SECTION = """        Example format for solutions:
+        1. Lambda function timeout configuration:
+        aws lambda update-function-configuration --timeout 30
+        2. Provisioned concurrency setup:
+        aws lambda put-provisioned-concurrency-config
+        3. Dead letter queue:
+        aws lambda update-function-configuration --dead-letter-config
+"""
+
+
+def library(max_snippets=2):
+    return ExampleLibrary(split_examples(SECTION, {"Dead letter queue": ["failed events"]}), max_snippets)
+
+
+def test_examples_are_split_on_numbered_headings():
+    snippets = split_examples(SECTION)
+
+    assert [snippet.title for snippet in snippets] == [
+        "Lambda function timeout configuration",
+        "Provisioned concurrency setup",
+        "Dead letter queue",
+    ]
+    assert snippets[0].text.endswith("--timeout 30")
+    assert "configuration" not in snippets[0].tags[0]  # Generic title words do not count
+
+
+def test_examples_are_selected_by_title_and_extra_tags():
+    assert [s.title for s in library().select("My Lambda function hits a timeout")] == ["Lambda function timeout configuration"]
+    assert [s.title for s in library().select("Where do failed events go?")] == ["Dead letter queue"]
+    assert library().select("How do I rotate IAM keys?") == []
+
+
+def test_selection_is_capped_and_keeps_section_order_for_ties():
+    selected = library(max_snippets=2).select("Lambda function timeout, provisioned concurrency and a dead letter queue")
+
+    assert [s.title for s in selected] == ["Lambda function timeout configuration", "Provisioned concurrency setup"]
+
+
+def test_inject_appends_a_system_message_only_when_something_matches():
+    messages = [{"role": "system", "content": "You are the Lambda specialist."}, {"role": "user", "content": "My Lambda function hits a timeout"}]
+
+    assert library().inject(messages[:1]) == messages[:1]
+    injected = library().inject(messages)
+    assert injected[:2] == messages
+    assert injected[2]["role"] == "system"
+    assert injected[2]["content"].startswith(EXAMPLES_PREAMBLE)
+    assert "--timeout 30" in injected[2]["content"]
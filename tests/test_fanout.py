@@ -0,0 +1,174 @@
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from utils.fanout import SolutionEngine, _Fanout, run_blocking
+from utils.speculation import Draft
+from utils.streaming import StreamCancelled, TokenForwarder, stop_on, stop_requested
+
+
+class FakeAgent:
+    def __init__(self, name, reply="", delay=0.0, error=None):
+        self.name = name
+        self.reply = reply
+        self.delay = delay
+        self.error = error
+        self.stopped = threading.Event()
+
+    def process_all_messages_before_reply(self, messages):
+        return messages
+
+    def generate_oai_reply(self, messages):
+        deadline = time.monotonic() + self.delay
+        while time.monotonic() < deadline:
+            if stop_requested():  # What a streamed completion does at its next chunk
+                self.stopped.set()
+                return True, None
+            time.sleep(0.01)
+        if self.error is not None:
+            raise self.error
+        return True, {"content": f"{self.reply} ({messages[-1]['content']})"}
+
+
+class FakeRegistry:
+    def __init__(self, agents):
+        self.agents = {agent.name: agent for agent in agents}
+
+    def names(self):
+        return list(self.agents)
+
+    def get(self, name):
+        return self.agents[name]
+
+
+class FakeRouter:
+    def route(self, text, threshold, max_services):
+        return []
+
+
+def engine(agents, timeout=1.0):
+    return SolutionEngine(
+        FakeRouter(),
+        FakeRegistry(agents),
+        aggregate=lambda replies: "\n".join(f"{name}: {content}" for name, content in replies),
+        review=lambda result: "APPROVED",
+        threshold=0.5,
+        max_specialists=3,
+        max_concurrency=3,
+        timeout=timeout,
+    )
+
+
+def test_fanout_is_abstract():
+    with pytest.raises(TypeError):
+        _Fanout(FakeRouter(), FakeRegistry([]), review=str, threshold=0.5, max_agents=1, max_reworks=0)
+
+
+def test_replies_follow_registration_order_and_failures_are_left_out():
+    agents = [
+        FakeAgent("EKS_Specialist", "slow", delay=0.2),
+        FakeAgent("Lambda_Specialist", error=RuntimeError("boom")),
+        FakeAgent("VPC_Specialist", "fast"),
+    ]
+
+    result = run_blocking(engine(agents).a_run("pods restart"), 3)
+
+    assert result == "EKS_Specialist: slow (pods restart)\nVPC_Specialist: fast (pods restart)"
+
+
+def test_timed_out_call_is_told_to_stop():
+    slow = FakeAgent("EKS_Specialist", "slow", delay=5.0)
+    agents = [slow, FakeAgent("VPC_Specialist", "fast")]
+
+    started = time.monotonic()
+    result = run_blocking(engine(agents, timeout=0.2).a_run("pods restart"), 2)
+
+    assert time.monotonic() - started < 1.0
+    assert result == "VPC_Specialist: fast (pods restart)"
+    assert slow.stopped.wait(1.0)
+
+
+def test_run_blocking_closes_the_loop_after_abandoned_calls():
+    slow = FakeAgent("EKS_Specialist", "slow", delay=5.0)
+    loops = []
+
+    async def abandon():
+        loops.append(asyncio.get_running_loop())
+        return await engine([slow], timeout=0.1).a_ask(slow, "pods restart", 0.1)
+
+    with pytest.raises(asyncio.TimeoutError):
+        run_blocking(abandon(), 1)
+
+    assert not loops[0].is_closed()  # The abandoned call has not returned yet
+    assert slow.stopped.wait(1.0)
+    deadline = time.monotonic() + 1.0
+    while not loops[0].is_closed() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert loops[0].is_closed()
+
+
+def test_forwarder_raises_into_a_stopped_stream():
+    stop = threading.Event()
+    tokens = []
+    forwarder = TokenForwarder("EKS_Specialist", lambda name, text: tokens.append(text), stop)
+
+    forwarder.print("Check", end="")
+    stop.set()
+    with pytest.raises(StreamCancelled):
+        forwarder.print(" the pods", end="")
+
+    assert tokens == ["Check"]
+
+
+def test_stop_is_scoped_to_the_block():
+    stop = threading.Event()
+    stop.set()
+    with stop_on(stop):
+        assert stop_requested()
+    assert not stop_requested()
+
+
+class CountingAgent(FakeAgent):
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def generate_oai_reply(self, messages):
+        with CountingAgent.lock:
+            CountingAgent.running += 1
+            CountingAgent.peak = max(CountingAgent.peak, CountingAgent.running)
+        try:
+            return super().generate_oai_reply(messages)
+        finally:
+            with CountingAgent.lock:
+                CountingAgent.running -= 1
+
+
+def test_solution_engine_bounds_concurrency():
+    agents = [CountingAgent(f"{service}_Specialist", "ok", delay=0.1) for service in ("EKS", "Lambda", "VPC", "S3", "RDS")]
+    solutions = engine(agents)
+    solutions.max_concurrency = 2
+
+    result = run_blocking(solutions.a_run("pods restart"), 5)
+
+    assert CountingAgent.peak == 2
+    assert result.count("ok (pods restart)") == 5
+
+
+def test_solution_engine_uses_ready_drafts():
+    agents = [FakeAgent("EKS_Specialist", "asked"), FakeAgent("VPC_Specialist", "asked")]
+    drafts = SimpleNamespace(
+        take=lambda: {
+            "EKS_Specialist": Draft("drafted", None),
+            "VPC_Specialist": Draft("drafted", "revise for the answers"),
+        }
+    )
+    solutions = engine(agents)
+    solutions.drafts = drafts
+
+    result = run_blocking(solutions.a_run("pods restart"), 2)
+
+    assert result == "EKS_Specialist: drafted\nVPC_Specialist: asked (revise for the answers)"
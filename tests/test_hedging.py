@@ -0,0 +1,178 @@
+import json
+import threading
+import time
+
+import httpx2
+import openai
+import pytest
+
+from utils.hedging import HedgeCancelled, LatencyTracker, hedged
+from utils.http_client import ROLE_HEADER, SharedHttpClient, collect_completion, for_role
+
+
+def test_percentile_needs_min_samples():
+    tracker = LatencyTracker(window=10, min_samples=3)
+    tracker.record("classifier", 0.1)
+    tracker.record("classifier", 0.2)
+    assert tracker.percentile("classifier", 0.9) is None
+    tracker.record("classifier", 0.3)
+    assert tracker.percentile("classifier", 0.9) == 0.3
+    assert tracker.percentile("specialist", 0.9) is None
+
+
+def test_percentile_uses_the_recent_window():
+    tracker = LatencyTracker(window=3, min_samples=1)
+    for seconds in (9.0, 1.0, 1.0, 1.0):
+        tracker.record("key", seconds)
+    assert tracker.percentile("key", 0.99) == 1.0
+
+
+def test_fast_attempt_is_not_hedged():
+    started = []
+
+    def attempt(index):
+        started.append(index)
+        return "primary"
+
+    assert hedged(attempt, 0.5, discard=lambda value: None) == ("primary", 0)
+    assert started == [0]
+
+
+def test_slow_attempt_is_hedged_and_the_loser_discarded():
+    discarded, loser_done = [], threading.Event()
+
+    def attempt(index):
+        if index == 0:
+            time.sleep(0.3)
+            return "primary"
+        return "hedge"
+
+    def discard(value):
+        discarded.append(value)
+        loser_done.set()
+
+    assert hedged(attempt, 0.05, discard) == ("hedge", 1)
+    assert loser_done.wait(2)
+    assert discarded == ["primary"]
+
+
+def test_loser_is_cancelled():
+    cancelled, stopped = [], threading.Event()
+
+    def attempt(index):
+        if index == 0:
+            while not stopped.wait(0.01):
+                pass
+            raise HedgeCancelled()
+        return "hedge"
+
+    def cancel(index):
+        cancelled.append(index)
+        stopped.set()
+
+    assert hedged(attempt, 0.05, discard=lambda value: None, cancel=cancel) == ("hedge", 1)
+    assert cancelled == [0]
+
+
+def test_failed_attempt_leaves_the_other_to_answer():
+    def attempt(index):
+        if index == 0:
+            time.sleep(0.1)
+            raise TimeoutError("primary")
+        time.sleep(0.2)
+        return "hedge"
+
+    assert hedged(attempt, 0.05, discard=lambda value: None) == ("hedge", 1)
+
+
+def test_error_before_the_hedge_delay_is_raised_without_hedging():
+    started = []
+
+    def attempt(index):
+        started.append(index)
+        raise ValueError("bad request")
+
+    with pytest.raises(ValueError):
+        hedged(attempt, 0.5, discard=lambda value: None)
+    assert started == [0]
+
+
+def test_error_is_raised_when_both_attempts_fail():
+    def attempt(index):
+        time.sleep(0.1)
+        raise TimeoutError(index)
+
+    with pytest.raises(TimeoutError):
+        hedged(attempt, 0.05, discard=lambda value: None)
+
+
+def event(delta, finish_reason=None, usage=None):
+    choices = [{"index": 0, "delta": delta, "finish_reason": finish_reason}] if delta is not None else []
+    chunk = {"id": "c1", "object": "chat.completion.chunk", "created": 1, "model": "gpt-4o-mini", "choices": choices}
+    if usage is not None:
+        chunk["usage"] = usage
+    return f"data: {json.dumps(chunk)}\n\n".encode()
+
+
+class Events(httpx2.SyncByteStream):
+    def __init__(self, chunks, pause=0.0):
+        self.chunks = chunks
+        self.pause = pause
+        self.sent = 0
+        self.closed = threading.Event()
+
+    def __iter__(self):
+        for chunk in self.chunks:
+            time.sleep(self.pause)
+            self.sent += 1
+            yield chunk
+
+    def close(self):
+        self.closed.set()
+
+
+def answer(text, pause=0.0):
+    words = [event({"role": "assistant", "content": ""})] + [event({"content": word}) for word in text]
+    usage = {"prompt_tokens": 5, "completion_tokens": len(text), "total_tokens": 5 + len(text)}
+    return Events(words + [event({}, "stop"), event(None, usage=usage), b"data: [DONE]\n\n"], pause)
+
+
+def test_stream_events_are_assembled_into_a_completion():
+    lines = b"".join(answer(["Y", "ES"])).decode().splitlines()
+    completion = collect_completion(lines)
+    assert completion["choices"] == [
+        {"index": 0, "message": {"role": "assistant", "content": "YES"}, "finish_reason": "stop"}
+    ]
+    assert completion["usage"]["completion_tokens"] == 2
+    assert collect_completion(['data: {"error": {"message": "overloaded"}}']) == {"error": {"message": "overloaded"}}
+
+
+def test_hedged_completion_stops_the_slow_generation():
+    streams, bodies, roles = [answer(["N", "O"] * 50, pause=0.02), answer(["YES"])], [], []
+
+    def handler(request):
+        roles.append(request.headers.get(ROLE_HEADER))
+        bodies.append(json.loads(request.content))
+        return httpx2.Response(200, headers={"content-type": "text/event-stream"}, stream=streams[len(bodies) - 1])
+
+    client = SharedHttpClient(
+        transport=httpx2.MockTransport(handler),
+        hedge_percentiles={"classifier": 0.5},
+        latencies=LatencyTracker(min_samples=1),
+    )
+    client.latencies.record(("classifier", "gpt-4o-mini", False), 0.1)
+    config = for_role([{"model": "gpt-4o-mini"}], "classifier", timeout=5, max_retries=0)[0]
+    assert config["max_retries"] == 0
+    llm = openai.OpenAI(
+        api_key="sk-test", http_client=client, default_headers=config["default_headers"], max_retries=0
+    )
+
+    completion = llm.chat.completions.create(model="gpt-4o-mini", messages=[{"role": "user", "content": "Hi"}])
+
+    assert completion.choices[0].message.content == "YES"
+    assert completion.usage.total_tokens == 6
+    assert [body["stream"] for body in bodies] == [True, True]
+    assert client.stats() == {"hedged": 1, "hedge_wins": 1}
+    assert streams[0].closed.wait(2)
+    assert streams[0].sent < len(streams[0].chunks)
+    assert roles == [None, None]
@@ -0,0 +1,76 @@
+import autogen
+import pytest
+
+from utils.history import DIGEST_HEADER, HistoryCompactor, compact_speaker_selection
+
+
+@pytest.fixture(autouse=True)
+def word_tokens(monkeypatch):
+    # One token per word, so budgets are easy to follow (and no tokenizer download is needed)
+    monkeypatch.setattr("utils.history.count_token", lambda text, model: len(text.split()))
+
+
+def turns(count, words=5):
+    task = {"role": "user", "name": "User", "content": "Task: my pods restart"}
+    return [task] + [
+        {"role": "user", "name": f"Agent_{i}", "content": " ".join([f"turn{i}"] * words)} for i in range(1, count + 1)
+    ]
+
+
+def tokens(messages):
+    return sum(len((m.get("content") or "").split()) for m in messages)
+
+
+def test_short_histories_are_unchanged():
+    messages = turns(3)
+    assert HistoryCompactor(keep_last=4).apply_transform(messages) == messages
+
+
+def test_old_turns_are_folded_into_a_digest():
+    messages = turns(8)
+    compacted = HistoryCompactor(keep_last=3, digest_chars=12).apply_transform(messages)
+
+    assert compacted[0] == messages[0]
+    assert compacted[1]["content"].splitlines() == [DIGEST_HEADER] + [
+        f"- Agent_{i}: turn{i} turn{i} ..." for i in range(1, 6)
+    ]
+    assert compacted[2:] == messages[-3:]
+
+
+def test_history_is_kept_under_the_token_ceiling():
+    messages = turns(10, words=50)
+    compactor = HistoryCompactor(keep_last=4, max_tokens=150, digest_chars=40)
+
+    compacted = compactor.apply_transform(messages)
+
+    assert tokens(compacted) <= 150
+    assert compacted[-1] == messages[-1]
+
+
+def test_long_messages_are_cut_when_nothing_else_is_left():
+    messages = turns(1, words=500)
+    compacted = HistoryCompactor(keep_last=1, max_tokens=100).apply_transform(messages)
+
+    assert tokens(compacted) <= 100
+    assert compacted[-1]["content"].endswith("[... truncated to fit the context budget]")
+    assert messages[-1]["content"] == " ".join(["turn1"] * 500)  # The chat's own message is left as it is
+
+
+def test_trailing_system_messages_are_never_folded():
+    examples = {"role": "system", "content": "Worked examples"}
+    compacted = HistoryCompactor(keep_last=2).apply_transform(turns(6) + [examples])
+
+    assert compacted[-1] == examples
+
+
+def test_speaker_selection_sends_the_compacted_history():
+    agents = [autogen.ConversableAgent(name, llm_config=False) for name in ("EKS_Researcher", "VPC_Researcher")]
+    groupchat = autogen.GroupChat(agents=agents, messages=turns(8), speaker_selection_method="auto")
+    compact_speaker_selection(groupchat, HistoryCompactor(keep_last=2))
+
+    _, _, messages = groupchat._prepare_and_select_agents(agents[0])
+
+    assert len(messages) == 4
+    assert messages[1]["content"].startswith(DIGEST_HEADER)
+    assert messages[-1] == groupchat.messages[-1]
+    assert len(groupchat.messages) == 9
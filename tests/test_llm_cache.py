@@ -0,0 +1,82 @@
+import json
+import sqlite3
+
+from utils.llm_cache import ResponseCache, normalize_key
+
+
+def key(content, **params):
+    return json.dumps({"model": "gpt-4o", "messages": [{"role": "user", "content": content}], **params})
+
+
+def test_key_ignores_whitespace_and_transport_parameters():
+    assert normalize_key(key("Why  do my\n pods restart?")) == normalize_key(
+        key("Why do my pods restart?", stream=True, timeout=60)
+    )
+    assert normalize_key(key("Why do my pods restart?")) != normalize_key(key("Why do my pods restart?", temperature=1))
+
+
+def test_entries_expire_after_ttl(tmp_path, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr("utils.llm_cache.time.time", lambda: clock[0])
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"), ttl=60)
+    cache.set(key("a"), "reply")
+
+    clock[0] += 30
+    assert cache.get(key("a")) == "reply"
+    clock[0] += 31
+    assert cache.get(key("a")) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr("utils.llm_cache.time.time", lambda: clock[0])
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"), max_entries=2, flush_interval=3600)
+    for name in "ab":
+        clock[0] += 1
+        cache.set(key(name), name)
+    clock[0] += 1
+    assert cache.get(key("a")) == "a"  # Batched: "a" is now the most recently used only in memory
+
+    clock[0] += 1
+    cache.set(key("c"), "c")
+
+    assert [cache.get(key(name)) for name in "abc"] == ["a", None, "c"]
+
+
+def test_lookups_are_batched_until_flushed(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    cache = ResponseCache(path, flush_interval=3600)
+    cache.set(key("a"), "a")
+    for _ in range(3):
+        cache.get(key("a"))
+    cache.get(key("b"))
+
+    def counters():
+        return dict(sqlite3.connect(path).execute("SELECT name, value FROM counters").fetchall())
+
+    assert counters() == {}
+    cache.flush()
+    assert counters() == {"hits": 3, "misses": 1}
+    assert cache.stats()["total_hits"] == 3
+
+
+def test_lookups_are_written_once_the_interval_has_passed(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    cache = ResponseCache(path, flush_interval=0)
+    cache.get(key("a"))
+
+    assert dict(sqlite3.connect(path).execute("SELECT name, value FROM counters").fetchall()) == {"misses": 1}
+
+
+def test_processes_sharing_a_file_share_totals(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    first, second = ResponseCache(path), ResponseCache(path)
+    first.set(key("a"), "a")
+    assert second.get(key("a")) == "a"
+    first.get(key("b"))
+    second.close()
+
+    assert first.stats()["total_hits"] == 1
+    assert first.stats()["total_misses"] == 1
+    assert (second.hits, second.misses) == (1, 0)
@@ -0,0 +1,34 @@
+import pipeline
+from config import LLM_ROLE_TIMEOUTS, MODEL_TIERS, ROLE_MODEL_TIERS
+from utils.http_client import ROLE_HEADER, for_role
+
+
+def test_for_role_tags_requests_without_changing_the_source():
+    config_list = [{"model": "gpt-4o", "default_headers": {"X-Team": "support"}}]
+    entry = for_role(config_list, "classifier", timeout=10)[0]
+    assert entry["default_headers"] == {"X-Team": "support", ROLE_HEADER: "classifier"}
+    assert entry["timeout"] == 10
+    assert config_list == [{"model": "gpt-4o", "default_headers": {"X-Team": "support"}}]
+    assert "timeout" not in for_role(config_list, "coordinator")[0]
+
+
+def test_each_role_calls_the_model_of_its_tier(tmp_path, monkeypatch):
+    monkeypatch.setattr(pipeline, "LLM_CACHE_PATH", str(tmp_path / "cache.sqlite"))
+    monkeypatch.setattr(pipeline, "PROMPT_BUNDLE_PATH", str(tmp_path / "bundle.json"))
+    monkeypatch.setattr(pipeline, "LLM_USAGE_REPORT", False)
+    system = pipeline.SupportSystem(echo_usage=False)
+    try:
+        assert system.config_for("classifier")[0]["model"] == MODEL_TIERS["small"]
+        assert system.config_for("speaker_selection")[0]["model"] == MODEL_TIERS["small"]
+        assert system.config_for("specialist")[0]["model"] == MODEL_TIERS["large"]
+        assert system.config_for("classifier")[0]["max_retries"] == 0
+        assert "max_retries" not in system.config_for("specialist")[0]
+        for role, tier in ROLE_MODEL_TIERS.items():
+            entry = system.config_for(role)[0]
+            assert entry["model"] == MODEL_TIERS[tier]
+            assert entry["default_headers"][ROLE_HEADER] == role
+            assert entry["timeout"] == LLM_ROLE_TIMEOUTS[role]
+            assert entry["http_client"] is system.http_client
+            assert entry["cache"] is system.response_cache
+    finally:
+        system.close()
@@ -0,0 +1,60 @@
+import pytest
+
+from specialists.base_specialist import BaseSpecialist, RESPONSE_FORMATS
+
+SERVICE_MESSAGE = """
+        You are the Amazon EKS specialist.
+
+        Information gathering guidelines:
+        - Ask for the Kubernetes version
+
+        Common patterns and best practices:
+        - Use managed node groups
+
+        When providing solutions:
+        - Include kubectl commands
+
+        Example format for solutions:
+        Solution 1: Fix CrashLoopBackOff
+        """
+
+
+@pytest.fixture
+def specialist():
+    specialist = BaseSpecialist("EKS_Specialist", [])
+    specialist.build_system_message(SERVICE_MESSAGE)
+    return specialist
+
+
+def test_sections_split_on_headings(specialist):
+    headings = [heading for heading, _ in specialist.sections()]
+
+    assert headings == [
+        None,
+        "Information gathering guidelines",
+        "Common patterns and best practices",
+        "When providing solutions",
+        "Example format for solutions",
+    ]
+    assert "".join(text for _, text in specialist.sections()) == SERVICE_MESSAGE
+
+
+def test_tiers_drop_sections_but_keep_the_introduction_and_guidelines(specialist):
+    full, standard, minimal = (specialist.system_message_for(tier) for tier in ("full", "standard", "minimal"))
+
+    assert full == RESPONSE_FORMATS["text"] + SERVICE_MESSAGE
+    assert "Solution 1: Fix CrashLoopBackOff" not in standard
+    assert "Use managed node groups" in standard
+    assert "Use managed node groups" not in minimal and "Ask for the Kubernetes version" not in minimal
+    for message in (standard, minimal):
+        assert message.startswith(RESPONSE_FORMATS["text"])
+        assert "You are the Amazon EKS specialist." in message
+        assert "Include kubectl commands" in message
+    assert len(minimal) < len(standard) < len(full)
+
+
+def test_unknown_tier_or_format_is_rejected():
+    with pytest.raises(ValueError):
+        BaseSpecialist("EKS_Specialist", [], prompt_tier="tiny")
+    with pytest.raises(ValueError):
+        BaseSpecialist("EKS_Specialist", [], output_format="yaml")
@@ -0,0 +1,56 @@
+from utils.question_cache import QuestionCache
+
+PROBLEM = "My EKS pods keep restarting with CrashLoopBackOff after the last deployment"
+QUESTIONS = "1. Which Kubernetes version?\n2. What do the pod logs show?"
+
+
+def cache(tmp_path, review=lambda questions: "APPROVED", **kwargs):
+    return QuestionCache(str(tmp_path / "questions.sqlite"), review, threshold=0.5, **kwargs)
+
+
+def reply(questions, problem):
+    return questions.generate_reply(None, messages=[{"content": problem}])
+
+
+def test_near_duplicate_problems_reuse_approved_questions(tmp_path):
+    questions = cache(tmp_path)
+    questions.store(PROBLEM, QUESTIONS)
+
+    hit = questions.lookup("EKS pods keep restarting in CrashLoopBackOff after the deployment")
+
+    assert hit is not None and hit.questions == QUESTIONS
+    assert questions.lookup("Lambda function times out when calling DynamoDB") is None
+
+
+def test_entries_of_another_version_are_kept_but_not_matched(tmp_path):
+    cache(tmp_path, version="v1").store(PROBLEM, QUESTIONS)
+
+    assert cache(tmp_path, version="v2").lookup(PROBLEM) is None
+    assert cache(tmp_path, version="v1").lookup(PROBLEM) is not None
+
+
+def test_oldest_entries_are_evicted_beyond_max_entries(tmp_path):
+    questions = cache(tmp_path, max_entries=1)
+    questions.store(PROBLEM, QUESTIONS)
+    questions.store("Lambda function times out when calling DynamoDB", "1. What is the timeout?")
+
+    assert questions.lookup(PROBLEM) is None
+
+
+def test_approved_hit_answers_without_research(tmp_path):
+    approved = []
+    questions = cache(tmp_path, on_approved=lambda *args: approved.append(args))
+    questions.store(PROBLEM, QUESTIONS)
+
+    assert reply(questions, PROBLEM) == (True, QUESTIONS)
+    assert approved == [(PROBLEM, QUESTIONS)]
+
+
+def test_rework_invalidates_the_entry(tmp_path):
+    reviewed = []
+    questions = cache(tmp_path, review=lambda questions: reviewed.append(questions) or "REWORK: ask about nodes")
+    questions.store(PROBLEM, QUESTIONS)
+
+    assert reply(questions, PROBLEM) == (False, None)
+    assert reviewed == [QUESTIONS]
+    assert questions.lookup(PROBLEM) is None
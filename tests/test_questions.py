@@ -0,0 +1,43 @@
+from types import SimpleNamespace
+
+from utils.questions import QUESTIONS_PREAMBLE, QuestionSummary, merge_questions
+
+EKS = "1. Which Kubernetes version does the cluster run?\n2. What do the pod logs show?"
+VPC = "1. Which Kubernetes version is the cluster on?\n2. Are the nodes in private subnets?"
+
+
+def test_questions_are_grouped_by_service_and_numbered_across_groups():
+    merged = merge_questions([("EKS_Researcher", EKS), ("VPC_Researcher", VPC)])
+
+    assert merged == (
+        f"{QUESTIONS_PREAMBLE}\n\n"
+        "[EKS]:\n1. Which Kubernetes version does the cluster run?\n2. What do the pod logs show?\n\n"
+        "[VPC]:\n3. Which Kubernetes version is the cluster on?\n4. Are the nodes in private subnets?"
+    )
+
+
+def test_near_duplicates_are_kept_by_the_first_researcher_to_ask():
+    merged = merge_questions([("EKS_Researcher", EKS), ("VPC_Researcher", VPC)], similarity=0.6)
+
+    assert "Which Kubernetes version is the cluster on?" not in merged
+    assert merged.endswith("[VPC]:\n3. Are the nodes in private subnets?")
+
+
+def test_replies_without_numbered_questions_give_nothing():
+    assert merge_questions([("EKS_Researcher", "I have no questions.")]) == ""
+
+
+def test_summary_uses_the_replies_since_the_last_rework():
+    messages = [
+        {"name": "User", "content": "My pods restart"},
+        {"name": "EKS_Researcher", "content": "1. Is it a Fargate profile?"},
+        {"name": "Human_Expert", "content": "REWORK: ask about the version"},
+        {"name": "EKS_Researcher", "content": EKS},
+        {"name": "Human_Expert", "content": "APPROVED"},
+    ]
+    summary = QuestionSummary(SimpleNamespace(messages=messages), ["EKS_Researcher"], "Human_Expert", similarity=0.6)
+
+    assert summary(None, None, {}) == merge_questions([("EKS_Researcher", EKS)])
+    assert QuestionSummary(SimpleNamespace(messages=messages[:1]), ["EKS_Researcher"], "Human_Expert", 0.6)(
+        None, None, {}
+    ) == "TERMINATE"
@@ -0,0 +1,75 @@
+import threading
+import time
+
+from utils.rate_limit import BACKGROUND, INTERACTIVE, RateLimiter, TokenBucket
+
+
+def acquire_in_thread(limiter, model, tokens, priority, admitted):
+    thread = threading.Thread(target=lambda: admitted.append(limiter.acquire(model, tokens, priority)), daemon=True)
+    thread.start()
+    return thread
+
+
+def test_wait_time_caps_the_floor_at_capacity():
+    bucket = TokenBucket(60)
+    assert bucket.wait_time(55, floor=12) == 0.0
+    bucket.take(30)
+    assert bucket.wait_time(55, floor=12) > 0.0
+
+
+def test_background_request_above_the_reserve_is_admitted_from_a_full_bucket():
+    limiter = RateLimiter({"gpt-4o": {"rpm": 500, "tpm": 30_000}}, headroom=0.9, background_reserve=0.2)
+    admitted = []
+    # 23k tokens is more than the 27k budget minus its 20% background reserve
+    acquire_in_thread(limiter, "gpt-4o", 23_000, BACKGROUND, admitted).join(timeout=2)
+    assert len(admitted) == 1
+
+
+def test_background_request_behind_a_large_one_is_not_starved():
+    limiter = RateLimiter({"m": {"rpm": 6000, "tpm": 6000}}, headroom=1.0, background_reserve=0.1)
+    admitted = []
+    large = acquire_in_thread(limiter, "m", 5500, BACKGROUND, admitted)
+    small = acquire_in_thread(limiter, "m", 10, BACKGROUND, admitted)
+    large.join(timeout=3)
+    small.join(timeout=3)
+    assert len(admitted) == 2
+
+
+def test_requests_within_budget_are_admitted_at_once_and_unmetered_models_pass():
+    limiter = RateLimiter({"m": {"rpm": 60, "tpm": 10_000}}, headroom=1.0)
+    assert limiter.acquire("m", 1000) < 0.05
+    assert limiter.acquire("other", 10**9) == 0.0
+    assert limiter.stats()["requests"] == 1
+
+
+def test_request_waits_for_the_token_budget_to_refill():
+    limiter = RateLimiter({"m": {"rpm": 6000, "tpm": 600}}, headroom=1.0)  # 10 tokens per second
+    limiter.acquire("m", 600)
+    waited = limiter.acquire("m", 3)
+    assert 0.2 < waited < 1.0
+
+
+def test_interactive_requests_are_admitted_before_earlier_background_ones():
+    limiter = RateLimiter({"m": {"rpm": 600, "tpm": 10**6}}, headroom=1.0, background_reserve=0.0)
+    limiter._models["m"].requests.level = 0.0  # Next request slot in 0.1s
+    order = []
+
+    def request(priority, label):
+        limiter.acquire("m", 1, priority)
+        order.append(label)
+
+    background = threading.Thread(target=request, args=(BACKGROUND, "background"))
+    background.start()
+    time.sleep(0.03)
+    interactive = threading.Thread(target=request, args=(INTERACTIVE, "interactive"))
+    interactive.start()
+    background.join(timeout=2)
+    interactive.join(timeout=2)
+    assert order == ["interactive", "background"]
+
+
+def test_rate_limited_response_pauses_the_model():
+    limiter = RateLimiter({"m": {"rpm": 6000, "tpm": 10**6}}, headroom=1.0)
+    limiter.observe("m", 429, {"retry-after-ms": "300"})
+    assert limiter.acquire("m", 1) >= 0.25
+    assert limiter.stats()["rate_limited"] == 1
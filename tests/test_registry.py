@@ -0,0 +1,48 @@
+import autogen
+
+from utils.registry import AgentRegistry
+
+
+class Descriptor:
+    def __init__(self, name):
+        self.name = name
+        self.builds = 0
+
+    def create_agent(self):
+        self.builds += 1
+        return autogen.ConversableAgent(self.name, llm_config=False, human_input_mode="NEVER")
+
+
+def registry(*names, on_create=None):
+    return AgentRegistry([Descriptor(name) for name in names], on_create)
+
+
+def test_agents_are_built_once_on_first_use():
+    created = []
+    agents = registry("EKS_Specialist", "VPC_Specialist", on_create=created.append)
+
+    assert agents.built() == []
+    first = agents.get("VPC_Specialist")
+    assert agents.get("VPC_Specialist") is first
+    assert agents.descriptors["VPC_Specialist"].builds == 1
+    assert created == [first]
+    assert agents.names() == ["EKS_Specialist", "VPC_Specialist"]
+    assert "EKS_Specialist" in agents and "S3_Specialist" not in agents
+
+
+def test_agents_joining_mid_chat_get_the_missed_messages():
+    agents = registry("EKS_Specialist", "VPC_Specialist")
+    expert = autogen.ConversableAgent("Human_Expert", llm_config=False, human_input_mode="NEVER")
+    groupchat = autogen.GroupChat(agents=[expert], messages=[], allow_repeat_speaker=True)
+    manager = autogen.GroupChatManager(groupchat, llm_config=False)
+    groupchat.append({"role": "user", "name": "User", "content": "My pods restart"}, expert)
+
+    agents.join(groupchat, manager, ["EKS_Specialist"])
+    agents.join(groupchat, manager, ["EKS_Specialist", "VPC_Specialist"])
+
+    eks, vpc = agents.get("EKS_Specialist"), agents.get("VPC_Specialist")
+    assert groupchat.agent_names == ["Human_Expert", "EKS_Specialist", "VPC_Specialist"]
+    assert [m["content"] for m in eks.chat_messages[manager]] == ["My pods restart"]
+    assert vpc in groupchat.allowed_speaker_transitions_dict[eks]
+    assert eks in groupchat.allowed_speaker_transitions_dict[vpc]
+    assert agents.built() == [eks, vpc]
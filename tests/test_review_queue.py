@@ -0,0 +1,98 @@
+import threading
+import time
+
+import pytest
+
+from utils.review import pass_transcript
+from utils.review_queue import ReviewChannel, ReviewQueue, ReviewStateError
+from utils.sessions import InputRequest
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return ReviewQueue(str(tmp_path / "reviews.sqlite"), claim_timeout=0.1, poll_interval=0.02)
+
+
+def test_claims_go_oldest_first_and_only_once(queue):
+    first = queue.submit("s1", "Research_Coordinator", "questions", timeout=60)
+    second = queue.submit("s2", "Solution_Coordinator", "solution", timeout=60)
+    assert queue.claim("alice").id == first.id
+    assert queue.claim("bob").id == second.id
+    assert queue.claim("carol") is None
+
+
+def test_lapsed_claim_can_be_taken_over(queue):
+    item = queue.submit("s1", "Research_Coordinator", "questions", timeout=60)
+    assert queue.claim("alice").reviewer == "alice"
+    assert queue.claim("bob") is None
+    with pytest.raises(ReviewStateError):
+        queue.decide(item.id, "bob", "APPROVE")
+    time.sleep(0.15)
+    assert queue.claim("bob").reviewer == "bob"
+    assert queue.decide(item.id, "bob", "APPROVE").status == "decided"
+    with pytest.raises(ReviewStateError):
+        queue.decide(item.id, "alice", "REWORK: more detail")
+
+
+def test_undecided_review_expires(queue):
+    item = queue.submit("s1", "Research_Coordinator", "questions", timeout=0.05)
+    time.sleep(0.1)
+    assert queue.claim("alice") is None
+    assert queue.get(item.id).status == "expired"
+    assert queue.wait(item.id) is None
+
+
+def test_verdict_wakes_the_waiting_session(queue):
+    item = queue.submit("s1", "Solution_Coordinator", "solution", timeout=60)
+    verdicts = []
+    waiter = threading.Thread(target=lambda: verdicts.append(queue.wait(item.id)))
+    waiter.start()
+    queue.claim("alice", item.id)
+    queue.decide(item.id, "alice", "APPROVE")
+    waiter.join(timeout=2)
+    assert verdicts == ["APPROVE"]
+
+
+def test_invalid_verdict_and_unknown_item(queue):
+    item = queue.submit("s1", "Solution_Coordinator", "solution", timeout=60)
+    with pytest.raises(ValueError):
+        queue.decide(item.id, "alice", "looks fine")
+    with pytest.raises(KeyError):
+        queue.decide(9999, "alice", "APPROVE")
+
+
+def test_reviewer_gets_the_whole_pass(queue):
+    channel = ReviewChannel(queue, "s1", "Human_Expert", review_timeout=60)
+    messages = [
+        {"name": "Human_Expert", "content": "REWORK: ask about the VPC"},
+        {"name": "EKS_Researcher", "content": "1. Which node group?"},
+        {"name": "VPC_Researcher", "content": "(silent)\n"},
+        {"name": "Lambda_Researcher", "content": "1. Which runtime?"},
+        {"name": "Research_Coordinator", "content": "   "},
+    ]
+    request = channel.request("Human_Expert", messages, "prompt")
+    assert request.sender == "Research_Coordinator"
+    assert request.message == (
+        "EKS_Researcher:\n1. Which node group?\n\nVPC_Researcher:\n(silent)\n\nLambda_Researcher:\n1. Which runtime?"
+    )
+    assert channel.request("User", messages[:2], "prompt").message == "1. Which node group?"
+    assert pass_transcript([{"name": "Solution_Coordinator", "content": "solution"}], "Human_Expert") == "solution"
+
+
+def test_pending_review_is_announced(queue):
+    channel = ReviewChannel(queue, "s1", "Human_Expert", review_timeout=60)
+    notified = []
+    channel._notify = lambda: notified.append(channel.state()["review"])
+    verdicts = []
+    waiter = threading.Thread(
+        target=lambda: verdicts.append(channel.ask(InputRequest("Human_Expert", "Solution_Coordinator", "solution", "")))
+    )
+    waiter.start()
+    deadline = time.time() + 2
+    while not notified and time.time() < deadline:
+        time.sleep(0.01)
+    assert notified and notified[0]["status"] == "pending"
+    queue.decide(notified[0]["id"], "alice", "APPROVE")
+    waiter.join(timeout=2)
+    assert verdicts == ["APPROVE"]
+    assert notified[-1] is None
@@ -0,0 +1,69 @@
+import autogen
+
+from utils.router import RoutedAutoSelector, RouterSpeakerSelector, ServiceRouter
+
+
+def agent(name):
+    return autogen.ConversableAgent(name, llm_config=False, human_input_mode="NEVER")
+
+
+def test_rank_puts_the_best_match_first(researchers):
+    router = ServiceRouter(researchers)
+    ranked = router.rank("My EKS pods are in CrashLoopBackOff")
+    assert ranked[0][0] == "EKS_Researcher"
+    assert [name for name, _ in ranked] == ["EKS_Researcher"]
+
+
+def test_words_shared_by_every_researcher_carry_no_weight(researchers):
+    router = ServiceRouter(researchers)
+    assert router.idf["aws"] == 0
+    assert router.rank("aws") == []
+
+
+def test_route_applies_threshold_and_limit(researchers):
+    router = ServiceRouter(researchers)
+    text = "Lambda timeouts inside a VPC subnet"
+    assert set(router.route(text, threshold=0.1)) == {"Lambda_Researcher", "VPC_Researcher"}
+    assert len(router.route(text, threshold=0.1, max_agents=1)) == 1
+    assert router.route(text, threshold=100.0) == []
+
+
+def test_speaker_selector_runs_each_routed_researcher_then_the_reviewer(researchers):
+    router = ServiceRouter(researchers)
+    expert, eks, vpc = agent("Human_Expert"), agent("EKS_Researcher"), agent("VPC_Researcher")
+    chat = autogen.GroupChat(agents=[expert, eks, vpc], messages=[], max_round=10)
+    select = RouterSpeakerSelector(router, "Human_Expert", threshold=0.5, max_speakers=3)
+    chat.messages.append({"name": "Research_Coordinator", "content": "EKS pods cannot reach a VPC peering subnet"})
+    first = select(agent("Research_Coordinator"), chat)
+    chat.messages.append({"name": first.name, "content": "1. Which version?"})
+    second = select(first, chat)
+    chat.messages.append({"name": second.name, "content": "1. Which CIDR?"})
+    assert {first.name, second.name} == {"EKS_Researcher", "VPC_Researcher"}
+    assert select(second, chat) is expert
+    chat.messages.append({"name": "Human_Expert", "content": "APPROVE"})
+    assert select(expert, chat) is None
+
+
+def test_speaker_selector_falls_back_and_joins_everyone_when_unsure(researchers):
+    router = ServiceRouter(researchers)
+    joined = []
+    chat = autogen.GroupChat(agents=[agent("Human_Expert")], messages=[], max_round=10)
+    select = RouterSpeakerSelector(
+        router, "Human_Expert", threshold=0.5, max_speakers=3, join=lambda groupchat, names: joined.extend(names)
+    )
+    chat.messages.append({"name": "Research_Coordinator", "content": "Something is slow"})
+    assert select(agent("Research_Coordinator"), chat) == "auto"
+    assert set(joined) == {"EKS_Researcher", "Lambda_Researcher", "VPC_Researcher"}
+
+
+def test_routed_auto_selector_joins_only_the_routed_agents(researchers):
+    router = ServiceRouter(researchers)
+    joined = []
+    names = ["EKS_Specialist", "Lambda_Specialist", "VPC_Specialist"]
+    select = RoutedAutoSelector(
+        router, names, join=lambda groupchat, routed: joined.append(routed), threshold=0.5, max_agents=2
+    )
+    chat = autogen.GroupChat(agents=[agent("Human_Expert")], messages=[], max_round=10)
+    chat.messages.append({"name": "Solution_Coordinator", "content": "Lambda cold starts and timeouts"})
+    assert select(chat.agents[0], chat) == "auto"
+    assert joined == [["Lambda_Specialist"]]
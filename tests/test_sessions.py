@@ -0,0 +1,126 @@
+import asyncio
+import threading
+import time
+from http import HTTPStatus
+from types import SimpleNamespace
+
+import pytest
+
+import server
+from utils.sessions import InputRequest, SessionChannel
+
+QUESTION = InputRequest("User", "Research_Coordinator", "1. Which version?", "")
+
+
+def ask_in_thread(channel, request=QUESTION):
+    replies = []
+    thread = threading.Thread(target=lambda: replies.append(channel.ask(request)))
+    thread.start()
+    deadline = time.monotonic() + 2
+    while channel.pending is None and thread.is_alive() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return thread, replies
+
+
+def test_answer_goes_to_the_waiting_agent_only():
+    channel = SessionChannel(idle_timeout=2)
+    thread, replies = ask_in_thread(channel)
+
+    assert channel.state()["pending"]["message"] == "1. Which version?"
+    assert not channel.answer("Human_Expert", "APPROVE")
+    assert channel.answer("User", "1.29")
+    thread.join(2)
+    assert replies == ["1.29"]
+    assert channel.pending is None
+
+
+def test_unanswered_requests_and_cancelled_sessions_exit():
+    channel = SessionChannel(idle_timeout=0.05)
+    assert channel.ask(QUESTION) == "exit"
+
+    channel = SessionChannel(idle_timeout=2)
+    thread, replies = ask_in_thread(channel)
+    channel.cancel()
+    thread.join(2)
+    assert replies == ["exit"]
+    assert channel.ask(QUESTION) == "exit"
+
+
+def test_tokens_are_read_after_a_position():
+    channel = SessionChannel(max_tokens=2)
+    for text in ("Solution", " 1", ": restart"):
+        channel.publish("EKS_Specialist", text)
+
+    assert [event.text for event in channel.tokens()] == [" 1", ": restart"]
+    assert [event.seq for event in channel.tokens(2)] == [3]
+    assert channel.tokens(3) == []
+
+
+class FakeSession:
+    """Stands in for a SupportSession: asks the user once, then ends."""
+
+    def __init__(self):
+        self.user_proxy = SimpleNamespace(name="User", register_hook=lambda *args: None)
+        self.human_expert = SimpleNamespace(name="Human_Expert", register_hook=lambda *args: None)
+
+    def run(self, message):
+        answer = self.user_proxy.get_human_input("")
+        return [SimpleNamespace(summary=f"{message}: {answer}")]
+
+
+@pytest.fixture
+def session_server(monkeypatch):
+    monkeypatch.setattr(server, "create_session", lambda system, on_token=None: FakeSession())
+    servers = []
+
+    def make(workers, max_sessions):
+        instance = server.SessionServer(
+            system=None, workers=workers, max_sessions=max_sessions, idle_timeout=5, poll_timeout=1, retention=60
+        )
+        servers.append(instance)
+        return instance
+
+    yield make
+    for instance in servers:
+        for handle in instance.sessions.values():
+            handle.cancel()
+        instance.executor.shutdown(wait=True)
+
+
+def test_sessions_beyond_the_workers_are_queued_and_beyond_the_limit_refused(session_server):
+    async def scenario():
+        sessions = session_server(workers=1, max_sessions=2)
+        _, first = await sessions.dispatch("POST", "/sessions", {"wait": ["1"]}, {"message": "first"})
+        _, second = await sessions.dispatch("POST", "/sessions", {"wait": ["0"]}, {"message": "second"})
+        assert first["pending"]["agent"] == "User"
+        assert second["status"] == "queued"
+
+        with pytest.raises(server.HTTPError) as refused:
+            await sessions.dispatch("POST", "/sessions", {"wait": ["0"]}, {"message": "third"})
+        assert refused.value.status == HTTPStatus.SERVICE_UNAVAILABLE
+
+        # Ending the first session frees its worker for the queued one
+        _, done = await sessions.dispatch(
+            "POST", f"/sessions/{first['id']}/input", {"wait": ["1"]}, {"agent": "User", "content": "1.29"}
+        )
+        assert done["status"] == "done" and done["result"] == [{"chat": "research", "summary": "first: 1.29"}]
+        _, second = await sessions.dispatch("GET", f"/sessions/{second['id']}", {"wait": ["1"]}, {})
+        assert second["status"] == "running" and second["pending"]["agent"] == "User"
+
+    asyncio.run(scenario())
+
+
+def test_deleted_queued_session_never_starts(session_server):
+    async def scenario():
+        sessions = session_server(workers=1, max_sessions=2)
+        _, first = await sessions.dispatch("POST", "/sessions", {"wait": ["1"]}, {"message": "first"})
+        _, queued = await sessions.dispatch("POST", "/sessions", {"wait": ["0"]}, {"message": "second"})
+        handle = sessions.sessions[queued["id"]]
+
+        await sessions.dispatch("DELETE", f"/sessions/{queued['id']}", {}, {})
+        await sessions.dispatch("POST", f"/sessions/{first['id']}/input", {"wait": ["1"]}, {"agent": "User", "content": "x"})
+
+        assert handle.future.cancelled()
+        assert queued["id"] not in sessions.sessions
+
+    asyncio.run(scenario())
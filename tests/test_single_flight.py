@@ -0,0 +1,78 @@
+import threading
+import time
+
+import pytest
+
+from utils.single_flight import SingleFlight
+
+
+def run_followers(flight, key, call, count):
+    """Start a leader and ``count`` followers for the key; return their threads and results."""
+    results = []
+
+    def run():
+        try:
+            results.append(flight.do(key, call))
+        except Exception as error:
+            results.append(error)
+
+    threads = [threading.Thread(target=run) for _ in range(count + 1)]
+    threads[0].start()
+    time.sleep(0.05)
+    for thread in threads[1:]:
+        thread.start()
+    return threads, results
+
+
+def wait_for_followers(flight, count):
+    deadline = time.monotonic() + 2
+    while flight.stats()["shared"] < count and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_identical_calls_in_flight_share_one_call():
+    flight, release, calls = SingleFlight(), threading.Event(), []
+
+    def call():
+        calls.append(1)
+        release.wait(2)
+        return "response"
+
+    threads, results = run_followers(flight, "key", call, 4)
+    wait_for_followers(flight, 4)
+    release.set()
+    for thread in threads:
+        thread.join(timeout=2)
+    assert len(calls) == 1
+    assert sorted(results) == [("response", False)] + [("response", True)] * 4
+    assert flight.stats() == {"calls": 5, "shared": 4, "in_flight": 0}
+
+
+def test_error_reaches_every_follower():
+    flight, release = SingleFlight(), threading.Event()
+
+    def call():
+        release.wait(2)
+        raise TimeoutError("upstream")
+
+    threads, results = run_followers(flight, "key", call, 2)
+    wait_for_followers(flight, 2)
+    release.set()
+    for thread in threads:
+        thread.join(timeout=2)
+    assert len(results) == 3 and all(isinstance(result, TimeoutError) for result in results)
+
+
+def test_finished_calls_are_not_reused_and_keys_are_separate():
+    flight, calls = SingleFlight(), []
+
+    def call():
+        calls.append(1)
+        return len(calls)
+
+    assert flight.do("a", call) == (1, False)
+    assert flight.do("a", call) == (2, False)
+    assert flight.do("b", call) == (3, False)
+    with pytest.raises(ValueError):
+        flight.do("a", lambda: (_ for _ in ()).throw(ValueError("bad")))
+    assert flight.stats()["in_flight"] == 0
@@ -0,0 +1,56 @@
+from utils.solution_store import SolutionStore, prompt_fingerprint
+
+PROBLEM = "My EKS pods keep restarting"
+ANSWERS = "1. 1.29\n2. OOMKilled"
+
+
+def store(tmp_path, fingerprints=None, **kwargs):
+    fingerprints = fingerprints or {"EKS_Specialist": prompt_fingerprint("eks"), "VPC_Specialist": prompt_fingerprint("vpc")}
+    return SolutionStore(str(tmp_path / "solutions.sqlite"), fingerprints, ticket=lambda: (PROBLEM, ANSWERS), **kwargs)
+
+
+def test_key_ignores_case_and_whitespace():
+    assert SolutionStore.key("My EKS  pods keep\nrestarting", ANSWERS) == SolutionStore.key(PROBLEM.lower(), ANSWERS)
+    assert SolutionStore.key(PROBLEM, ANSWERS) != SolutionStore.key(PROBLEM, "1. 1.29\n2. Evicted")
+
+
+def test_repeat_ticket_is_answered_with_provenance(tmp_path):
+    solutions = store(tmp_path)
+    solutions.remember("Raise the memory limit", ["EKS_Specialist"])
+
+    handled, reply = solutions.generate_reply(None, messages=[])
+
+    assert handled
+    assert reply.startswith("[Approved solution reused from ")
+    assert reply.endswith("\n\nRaise the memory limit")
+
+
+def test_changed_prompt_of_a_contributor_invalidates_the_entry(tmp_path):
+    store(tmp_path).remember("Raise the memory limit", ["EKS_Specialist"])
+
+    other_changed = store(tmp_path, {"EKS_Specialist": prompt_fingerprint("eks"), "VPC_Specialist": "changed"})
+    assert other_changed.get(PROBLEM, ANSWERS) is not None
+
+    contributor_changed = store(tmp_path, {"EKS_Specialist": "changed", "VPC_Specialist": prompt_fingerprint("vpc")})
+    assert contributor_changed.get(PROBLEM, ANSWERS) is None
+    assert store(tmp_path).get(PROBLEM, ANSWERS) is None  # Deleted on lookup
+
+
+def test_without_contributors_any_prompt_change_invalidates(tmp_path):
+    store(tmp_path).remember("Raise the memory limit")
+
+    assert store(tmp_path, {"EKS_Specialist": prompt_fingerprint("eks"), "VPC_Specialist": "changed"}).get(
+        PROBLEM, ANSWERS
+    ) is None
+
+
+def test_entries_expire_after_max_age(tmp_path, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr("utils.solution_store.time.time", lambda: clock[0])
+    solutions = store(tmp_path, max_age=60)
+    solutions.remember("Raise the memory limit")
+
+    clock[0] += 59
+    assert solutions.get(PROBLEM, ANSWERS) is not None
+    clock[0] += 2
+    assert solutions.get(PROBLEM, ANSWERS) is None
@@ -0,0 +1,82 @@
+import json
+
+import pytest
+
+from utils.router import ServiceRouter
+from utils.solutions import NO_VIABLE_SOLUTION, SchemaError, SolutionAggregator, parse_reply
+
+LEVELS = {"complexity": "Low", "cost": "Low", "scalability": "High", "maintenance": "Low"}
+
+
+def solution(name, description, code="kubectl rollout restart deployment/app", **considerations):
+    return {
+        "name": name,
+        "description": description,
+        "implementation": [{"language": "bash", "code": code}],
+        "best_practices": [],
+        "considerations": {**LEVELS, **considerations},
+    }
+
+
+def reply(*solutions):
+    return json.dumps({"solutions": list(solutions)})
+
+
+@pytest.fixture
+def aggregator(researchers):
+    return SolutionAggregator(ServiceRouter(researchers), ticket=lambda: ("EKS pods in CrashLoopBackOff", ""))
+
+
+def test_reply_is_parsed_from_a_fenced_json_object():
+    parsed = parse_reply("EKS_Specialist", "```json\n" + reply(solution("Restart", "Restart the pods")) + "\n```")
+
+    assert [s.name for s in parsed] == ["Restart"]
+    assert parsed[0].considerations["scalability"] == "High"
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["no json here", '{"solutions": "none"}', reply(solution("Restart", "Restart", complexity="Extreme"))],
+)
+def test_invalid_replies_are_rejected(text):
+    with pytest.raises(SchemaError):
+        parse_reply("EKS_Specialist", text)
+
+
+def test_identical_code_is_a_duplicate(aggregator):
+    result = aggregator.aggregate([
+        ("EKS_Specialist", reply(solution("Restart pods", "Restart the EKS pods in CrashLoopBackOff"))),
+        ("VPC_Specialist", reply(solution("Roll the deployment", "Roll the deployment"))),
+    ])
+
+    assert "Solution 1: Restart pods" in result
+    assert "Roll the deployment" not in result
+    assert "Conflicting proposals" not in result
+
+
+def test_disagreeing_solutions_are_listed_as_conflicts(aggregator):
+    result = aggregator.aggregate([
+        ("EKS_Specialist", reply(solution("Raise memory limits", "Raise the EKS pods memory limits", "kubectl set resources"))),
+        (
+            "VPC_Specialist",
+            reply(solution("Raise memory limits", "Raise the EKS pods memory limits", "eksctl scale", cost="High")),
+        ),
+    ])
+
+    assert result.count("Solution ") == 2  # The kept solution and the conflict line referring to it
+    assert "Proposed by: EKS_Specialist" in result
+    assert result.endswith(
+        "Conflicting proposals (set aside):\n"
+        "- Raise memory limits (VPC_Specialist) disagrees with Solution 1: different implementation, cost Low vs High"
+    )
+
+
+def test_invalid_replies_are_kept_as_text(aggregator, caplog):
+    result = aggregator.aggregate([("EKS_Specialist", "Just restart it")])
+
+    assert result == "Additional input from EKS_Specialist:\nJust restart it"
+    assert "did not return valid structured output" in caplog.text
+
+
+def test_no_solutions_renders_the_no_viable_solution_message(aggregator):
+    assert aggregator.aggregate([("EKS_Specialist", reply())]) == NO_VIABLE_SOLUTION
@@ -0,0 +1,108 @@
+import threading
+
+from utils.speculation import DRAFT_PROMPT, SolutionDrafts, contradicts, split_assumptions
+
+PROBLEM = "My Lambda function times out when it calls DynamoDB"
+QUESTIONS = "1. Which runtime does the function use?\n2. Is the function attached to a VPC?"
+DRAFT = "Raise the timeout and reuse the DynamoDB client.\nAssumption 1: Python runtime\nAssumption 2: not in a VPC"
+
+
+class FakeRouter:
+    def __init__(self, names):
+        self.names = names
+        self.calls = []
+
+    def route(self, problem, threshold, max_speakers):
+        self.calls.append((problem, threshold, max_speakers))
+        return self.names
+
+
+class FakeSpecialist:
+    def __init__(self, name, reply, release=None):
+        self.name = name
+        self.reply = reply
+        self.release = release
+        self.prompts = []
+
+    def process_all_messages_before_reply(self, messages):
+        return messages
+
+    def generate_oai_reply(self, messages):
+        self.prompts.append(messages[-1]["content"])
+        if self.release is not None:
+            self.release.wait(2)
+        return True, self.reply
+
+
+class FakeRegistry:
+    def __init__(self, agents):
+        self.agents = {agent.name: agent for agent in agents}
+
+    def names(self):
+        return list(self.agents)
+
+    def get(self, name):
+        return self.agents[name]
+
+
+def drafts(agents, answers="", grace=1.0):
+    return SolutionDrafts(
+        FakeRouter([agent.name for agent in agents]),
+        FakeRegistry(agents),
+        ticket=lambda: (PROBLEM, answers),
+        threshold=5.0,
+        max_specialists=3,
+        max_concurrency=2,
+        grace=grace,
+    )
+
+
+def test_assumptions_are_split_off_the_draft():
+    text, assumptions = split_assumptions(DRAFT + "\n**Assumption 3:** default memory")
+    assert text == "Raise the timeout and reuse the DynamoDB client."
+    assert assumptions == {1: "Python runtime", 2: "not in a VPC", 3: "** default memory"}
+
+
+def test_answers_matching_the_assumptions_need_no_revision():
+    _, assumptions = split_assumptions(DRAFT)
+    assert not contradicts("1. Python\n2. Not in a VPC", QUESTIONS, assumptions)
+    assert not contradicts("Please proceed", QUESTIONS, assumptions)
+    assert not contradicts("python, not attached to a vpc", QUESTIONS, assumptions)
+    assert contradicts("1. Node.js\n2. Not in a VPC", QUESTIONS, assumptions)
+    assert contradicts("2. Yes, private subnets", QUESTIONS, assumptions)
+    assert contradicts("It runs Java in private subnets", QUESTIONS, assumptions)
+    assert contradicts("1. Python", QUESTIONS, {})
+
+
+def test_drafts_are_revised_only_when_the_answers_differ():
+    matching = drafts([FakeSpecialist("Lambda_Specialist", DRAFT)], answers="1. Python\n2. No VPC")
+    assert matching.start(PROBLEM, QUESTIONS)
+    draft = matching.take()["Lambda_Specialist"]
+    assert draft.text == "Raise the timeout and reuse the DynamoDB client."
+    assert draft.revision_prompt is None
+
+    differing = drafts([FakeSpecialist("Lambda_Specialist", DRAFT)], answers="1. Java 17\n2. No VPC")
+    differing.start(PROBLEM, QUESTIONS)
+    draft = differing.take()["Lambda_Specialist"]
+    assert "Java 17" in draft.revision_prompt and "Assumption 1: Python runtime" in draft.revision_prompt
+
+
+def test_drafts_are_handed_out_once_and_slow_ones_are_left_out():
+    release = threading.Event()
+    speculation = drafts(
+        [FakeSpecialist("Lambda_Specialist", DRAFT), FakeSpecialist("DynamoDB_Specialist", DRAFT, release)],
+        grace=0.05,
+    )
+    assert speculation.start(PROBLEM, QUESTIONS)
+    assert speculation.start(PROBLEM, QUESTIONS)  # Already drafting this problem
+    assert list(speculation.take()) == ["Lambda_Specialist"]
+    assert speculation.take() == {}
+    release.set()
+    prompt = speculation.specialists.get("Lambda_Specialist").prompts[0]
+    assert prompt == DRAFT_PROMPT.format(problem=PROBLEM, questions=QUESTIONS)
+
+
+def test_nothing_is_drafted_without_confident_routes():
+    speculation = drafts([])
+    assert not speculation.start(PROBLEM, QUESTIONS)
+    assert speculation.take() == {}
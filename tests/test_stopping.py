@@ -0,0 +1,94 @@
+from types import SimpleNamespace
+
+from utils.stopping import AdaptiveStop, adds_information, is_empty_contribution
+
+REVIEWER = "Human_Expert"
+
+
+class FakeGroupChat:
+    def __init__(self, names, messages):
+        self.agents = [SimpleNamespace(name=name) for name in names]
+        self.messages = messages
+
+    @property
+    def agent_names(self):
+        return [agent.name for agent in self.agents]
+
+    def agent_by_name(self, name):
+        return next(agent for agent in self.agents if agent.name == name)
+
+
+def turn(name, content):
+    return {"name": name, "content": content}
+
+
+def chat(*messages, names=("EKS_Researcher", "Lambda_Researcher", "VPC_Researcher", REVIEWER)):
+    return FakeGroupChat(names, [turn("Research_Coordinator", "My EKS pods keep restarting"), *messages])
+
+
+def stop(**kwargs):
+    return AdaptiveStop(lambda last_speaker, groupchat: "next", REVIEWER, similarity=0.8, **kwargs)
+
+
+def test_empty_contributions():
+    assert is_empty_contribution("")
+    assert is_empty_contribution("(silent)")
+    assert is_empty_contribution("I have nothing further to add.")
+    assert is_empty_contribution("No additional questions.")
+    assert not is_empty_contribution("1. Which node group runs the pods?")
+
+
+def test_repeated_content_adds_no_information():
+    earlier = ["1. Which Kubernetes version runs the cluster?"]
+    assert not adds_information("1. Which Kubernetes version runs the cluster?", earlier, 0.8)
+    assert adds_information("1. Which Kubernetes version runs the cluster?\n2. Which VPC CNI version?", earlier, 0.8)
+    assert adds_information("1. Which node group?", [], 0.8)
+
+
+def test_selector_chooses_while_the_pass_adds_information():
+    groupchat = chat(turn("EKS_Researcher", "1. Which Kubernetes version?"))
+    policy = stop()
+    assert policy(groupchat.agent_by_name("EKS_Researcher"), groupchat) == "next"
+    assert policy.stops == {}
+
+
+def test_idle_turns_hand_over_to_the_reviewer():
+    groupchat = chat(
+        turn("EKS_Researcher", "1. Which Kubernetes version?"),
+        turn("Lambda_Researcher", "(silent)"),
+        turn("VPC_Researcher", "1. Which Kubernetes version?"),
+        names=("EKS_Researcher", "Lambda_Researcher", "VPC_Researcher", "IAM_Researcher", REVIEWER),
+    )
+    policy = stop()
+    assert policy(groupchat.agent_by_name("VPC_Researcher"), groupchat).name == REVIEWER
+    assert policy.stops == {"no new information": 1}
+
+
+def test_every_agent_spoken_and_repeated_speaker_end_the_pass():
+    groupchat = chat(
+        turn("EKS_Researcher", "1. Which Kubernetes version?"),
+        turn("Lambda_Researcher", "1. Which runtime?"),
+        turn("VPC_Researcher", "1. Which subnets?"),
+    )
+    policy = stop()
+    assert policy(groupchat.agent_by_name("VPC_Researcher"), groupchat).name == REVIEWER
+    groupchat = chat(turn("EKS_Researcher", "1. Which Kubernetes version?"), turn("EKS_Researcher", "2. Which nodes?"))
+    assert policy(groupchat.agent_by_name("EKS_Researcher"), groupchat).name == REVIEWER
+    assert policy.stops == {"every agent has spoken": 1, "repeated speaker": 1}
+
+
+def test_chat_ends_when_a_pass_adds_nothing_or_is_approved():
+    groupchat = chat(
+        turn(REVIEWER, "REWORK: ask about the nodes"),
+        turn("EKS_Researcher", "(silent)"),
+        turn("Lambda_Researcher", "Nothing to add."),
+    )
+    assert stop()(groupchat.agent_by_name("Lambda_Researcher"), groupchat) is None
+
+    groupchat = chat(turn("EKS_Researcher", "1. Which Kubernetes version?"), turn(REVIEWER, "APPROVED"))
+    assert stop()(groupchat.agent_by_name(REVIEWER), groupchat) is None
+
+
+def test_approval_of_an_empty_pass_does_not_end_the_chat():
+    groupchat = chat(turn(REVIEWER, "APPROVED"))
+    assert stop()(groupchat.agent_by_name(REVIEWER), groupchat) == "next"
@@ -0,0 +1,79 @@
+import threading
+
+import pytest
+
+from main import TokenPrinter
+from utils.streaming import TokenForwarder
+
+
+def test_forwarder_drops_colour_codes_but_keeps_the_final_newline():
+    tokens = []
+    forwarder = TokenForwarder("EKS_Specialist", lambda name, text: tokens.append((name, text)))
+
+    forwarder.print("\033[32m", end="")
+    forwarder.print("Solution 1", end="", flush=True)
+    forwarder.print(" ", end="", flush=True)
+    forwarder.print("\033[0m\n")
+
+    assert tokens == [("EKS_Specialist", "Solution 1"), ("EKS_Specialist", " "), ("EKS_Specialist", "\n")]
+
+
+def test_printer_prefixes_lines_and_keeps_agents_apart(capsys):
+    print_token = TokenPrinter()
+    print_token("EKS_Specialist", "Solution 1: ")
+    print_token("VPC_Specialist", "Solution 1: open the")  # Held until the EKS line ends
+    print_token("EKS_Specialist", "restart\nDescription: pods")
+    print_token("VPC_Specialist", " port\n")
+    print_token("EKS_Specialist", "\n")
+
+    assert capsys.readouterr().out == (
+        "[EKS_Specialist] Solution 1: restart\n"
+        "[VPC_Specialist] Solution 1: open the port\n"
+        "[EKS_Specialist] Description: pods\n"
+    )
+
+
+def test_printer_flush_prints_what_is_held(capsys):
+    print_token = TokenPrinter()
+    print_token("EKS_Specialist", "Solution 1")
+    print_token("VPC_Specialist", "Solution 2")
+    print_token.flush()
+
+    assert capsys.readouterr().out == "[EKS_Specialist] Solution 1\n[VPC_Specialist] Solution 2\n"
+
+
+def test_concurrent_streams_never_share_a_line(capsys):
+    print_token = TokenPrinter()
+    agents = [f"{service}_Specialist" for service in ("EKS", "VPC", "S3")]
+
+    def stream(agent):
+        for i in range(50):
+            for word in ("step", f" {i}", "\n"):
+                print_token(agent, word)
+
+    threads = [threading.Thread(target=stream, args=(agent,)) for agent in agents]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    print_token.flush()
+
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 150
+    for agent in agents:
+        assert [line for line in lines if line.startswith(f"[{agent}] ")] == [f"[{agent}] step {i}" for i in range(50)]
+
+
+@pytest.mark.parametrize("output, expected", [("json", False), ("text", True)])
+def test_streaming_is_off_by_default_with_json_output(monkeypatch, output, expected):
+    import importlib
+
+    import config
+
+    monkeypatch.delenv("SOLUTION_STREAMING", raising=False)
+    monkeypatch.setenv("SPECIALIST_OUTPUT", output)
+    try:
+        assert importlib.reload(config).SOLUTION_STREAMING is expected
+    finally:
+        monkeypatch.undo()
+        importlib.reload(config)
@@ -0,0 +1,57 @@
+from types import SimpleNamespace
+
+from specialists.base_specialist import BaseSpecialist, RESPONSE_FORMATS
+from utils.usage import UsageLogger
+
+
+def usage(prompt, completion, cached=None):
+    details = SimpleNamespace(cached_tokens=cached) if cached is not None else None
+    return SimpleNamespace(
+        usage=SimpleNamespace(prompt_tokens=prompt, completion_tokens=completion, prompt_tokens_details=details)
+    )
+
+
+def log(logger, name, response, request=None, is_cached=0):
+    logger.log_chat_completion(None, 0, 0, SimpleNamespace(name=name), request or {}, response, is_cached, 0.0, "")
+
+
+def test_cached_prompt_tokens_are_totalled_per_agent():
+    logger = UsageLogger(echo=False)
+    log(logger, "EKS_Specialist", usage(1200, 300, cached=1024))
+    log(logger, "EKS_Specialist", usage(1300, 200, cached=1024))
+    log(logger, "VPC_Specialist", usage(900, 100))
+
+    assert logger.summary() == {
+        "EKS_Specialist": {"calls": 2, "prompt_tokens": 2500, "cached_tokens": 2048, "completion_tokens": 500},
+        "VPC_Specialist": {"calls": 1, "prompt_tokens": 900, "cached_tokens": 0, "completion_tokens": 100},
+    }
+
+
+def test_response_cache_hits_send_no_tokens():
+    logger = UsageLogger(echo=False)
+    log(logger, "EKS_Specialist", usage(1200, 300, cached=1024), is_cached=1)
+
+    assert logger.summary() == {"EKS_Specialist": {"response_cache_hits": 1}}
+
+
+def test_streamed_calls_report_cached_tokens_as_unknown():
+    logger = UsageLogger(echo=False)
+    log(logger, "EKS_Specialist", usage(1200, 300), request={"stream": True})
+    log(logger, "VPC_Specialist", usage(900, 100), request={"stream": True})
+    log(logger, "VPC_Specialist", usage(900, 100, cached=512))
+
+    rows = {line.split()[0]: line.split() for line in logger.report().splitlines()[1:]}
+    assert rows["EKS_Specialist"][4] == "n/a"
+    assert rows["VPC_Specialist"][4] == "512"
+    assert "cached_tokens" not in logger.summary()["EKS_Specialist"]
+
+
+def test_specialist_prompts_start_with_the_shared_format():
+    messages = []
+    for name, service in (("EKS_Specialist", "EKS"), ("VPC_Specialist", "VPC")):
+        specialist = BaseSpecialist(name, [], output_format="json")
+        messages.append(specialist.build_system_message(f"\n        You are the {service} specialist.\n"))
+
+    shared = RESPONSE_FORMATS["json"]
+    assert all(message.startswith(shared) for message in messages)
+    assert messages[0][len(shared):] != messages[1][len(shared):]
@@ -0,0 +1,67 @@
+"""Print the system-message token count of every agent, per specialist prompt tier."""
+
+import argparse
+import logging
+import sys
+
+from autogen.token_count_utils import count_token
+
+from catalog import ServiceCatalog
+from config import OPENAI_CONFIG, PROMPT_BUNDLE_PATH, SERVICE_CATALOG_PATH, SPECIALIST_PROMPT_TIER
+from pipeline import create_agents
+from specialists import PROMPT_TIERS
+
+
+def token_counts(model):
+    """Return {agent name: {tier: system-message tokens}} for every agent with a system message."""
+    # No request is made; the OpenAI client only needs some key to be constructed.
+    logging.getLogger("autogen.oai.client").setLevel(logging.ERROR)
+    config_list = [{**entry, "api_key": entry.get("api_key") or "unused"} for entry in OPENAI_CONFIG]
+    catalog = ServiceCatalog.load(SERVICE_CATALOG_PATH, PROMPT_BUNDLE_PATH)
+    counts = {}
+    for tier in PROMPT_TIERS:
+        user_proxy, research_coordinator, solution_coordinator, specialists, researchers, human_expert, _ = (
+            create_agents(config_list, prompt_tier=tier, catalog=catalog)
+        )
+        # Researchers and specialists are only described, not built, until they are routed to
+        agents = [
+            research_coordinator,
+            solution_coordinator,
+            human_expert,
+            *researchers.descriptors.values(),
+            *specialists.descriptors.values(),
+        ]
+        for agent in agents:
+            counts.setdefault(agent.name, {})[tier] = count_token(agent.system_message, model)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--model", default=OPENAI_CONFIG[0]["model"], help="Tokenizer model (default: %(default)s)")
+    parser.add_argument(
+        "--tier",
+        choices=list(PROMPT_TIERS),
+        default=SPECIALIST_PROMPT_TIER,
+        help="Tier checked against --budget (default: %(default)s)",
+    )
+    parser.add_argument("--budget", type=int, help="Exit with status 1 if any agent's prompt exceeds this many tokens")
+    args = parser.parse_args()
+
+    counts = token_counts(args.model)
+    tiers = list(PROMPT_TIERS)
+    print(f"{'agent':<28}" + "".join(f"{tier:>10}" for tier in tiers))
+    for name, by_tier in counts.items():
+        print(f"{name:<28}" + "".join(f"{by_tier[tier]:>10}" for tier in tiers))
+    print(f"{'total':<28}" + "".join(f"{sum(c[tier] for c in counts.values()):>10}" for tier in tiers))
+
+    if args.budget is not None:
+        over = {name: c[args.tier] for name, c in counts.items() if c[args.tier] > args.budget}
+        for name, tokens in over.items():
+            print(f"Over budget ({args.tier}): {name} has {tokens} tokens > {args.budget}", file=sys.stderr)
+        if over:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
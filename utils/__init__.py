@@ -0,0 +1,95 @@
+"""Supporting components for the AWS Support System."""
+from .router import ServiceRouter, RouterSpeakerSelector, RoutedAutoSelector, service_key
+from .classifier import LocalClassifier
+from .examples import ExampleLibrary, ExampleSnippet, split_examples
+from .llm_cache import ResponseCache, normalize_key, with_response_cache
+from .history import HistoryCompactor, compact_speaker_selection
+from .hedging import HedgeCancelled, LatencyTracker, hedged
+from .http_client import ROLE_HEADER, SharedHttpClient, estimate_request, for_role, with_http_client
+from .single_flight import SingleFlight
+from .rate_limit import BACKGROUND, INTERACTIVE, RateLimiter, llm_priority, prioritize, prioritize_summaries
+from .review import is_approved, last_verdict, pass_transcript, request_review
+from .review_queue import ReviewChannel, ReviewItem, ReviewQueue, ReviewStateError, is_verdict
+from .question_cache import QuestionCache
+from .solution_store import SolutionStore, prompt_fingerprint
+from .solutions import Conflict, SchemaError, Solution, SolutionAggregator, SolutionSummary, parse_reply, render_solutions
+from .usage import UsageLogger
+from .registry import AgentRegistry
+from .sessions import InputRequest, SessionChannel, SessionIO, TokenEvent
+from .streaming import StreamCancelled, TokenForwarder, stop_on, stop_requested, stream_tokens
+from .questions import QuestionSummary, merge_questions
+from .fanout import ResearchFanout, SolutionEngine, reflect_with_llm, run_blocking
+from .speculation import Draft, SolutionDrafts
+from .stopping import AdaptiveStop, adds_information, is_empty_contribution
+
+__all__ = [
+    'ServiceRouter',
+    'RouterSpeakerSelector',
+    'RoutedAutoSelector',
+    'service_key',
+    'LocalClassifier',
+    'ExampleLibrary',
+    'ExampleSnippet',
+    'split_examples',
+    'ResponseCache',
+    'normalize_key',
+    'with_response_cache',
+    'HistoryCompactor',
+    'compact_speaker_selection',
+    'LatencyTracker',
+    'HedgeCancelled',
+    'hedged',
+    'ROLE_HEADER',
+    'SharedHttpClient',
+    'estimate_request',
+    'for_role',
+    'with_http_client',
+    'SingleFlight',
+    'BACKGROUND',
+    'INTERACTIVE',
+    'RateLimiter',
+    'llm_priority',
+    'prioritize',
+    'prioritize_summaries',
+    'is_approved',
+    'last_verdict',
+    'pass_transcript',
+    'request_review',
+    'ReviewChannel',
+    'ReviewItem',
+    'ReviewQueue',
+    'ReviewStateError',
+    'is_verdict',
+    'QuestionCache',
+    'SolutionStore',
+    'prompt_fingerprint',
+    'Conflict',
+    'SchemaError',
+    'Solution',
+    'SolutionAggregator',
+    'SolutionSummary',
+    'parse_reply',
+    'render_solutions',
+    'UsageLogger',
+    'AgentRegistry',
+    'InputRequest',
+    'SessionChannel',
+    'SessionIO',
+    'TokenEvent',
+    'StreamCancelled',
+    'TokenForwarder',
+    'stop_on',
+    'stop_requested',
+    'stream_tokens',
+    'QuestionSummary',
+    'merge_questions',
+    'ResearchFanout',
+    'SolutionEngine',
+    'reflect_with_llm',
+    'run_blocking',
+    'Draft',
+    'SolutionDrafts',
+    'AdaptiveStop',
+    'adds_information',
+    'is_empty_contribution',
+]
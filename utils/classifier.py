@@ -0,0 +1,73 @@
+"""Local first stage of the technical-question classifier."""
+import re
+from typing import Iterable, Optional
+
+from .text import tokenize
+
+# "1. Yes 2. No", "1) prod\n2) last week": numbered answers to clarifying questions
+_NUMBERED_ANSWERS = re.compile(r"^\s*1[.)]\s+\S.*?(?:^|\s)2[.)]\s+\S", re.DOTALL | re.MULTILINE)
+
+_SMALL_TALK = re.compile(
+    r"^\s*(?:hi|hello|hey|hiya|howdy|yo|greetings|good\s+(?:morning|afternoon|evening)|"
+    r"thanks?(?:\s+you)?(?:\s+(?:so|very)\s+much)?|thx|ty|cheers|ok(?:ay)?|sure|yes|yep|yeah|no|nope|"
+    r"great|cool|perfect|got\s+it|sounds\s+good|bye|goodbye|see\s+you|"
+    r"(?:please\s+)?(?:proceed|continue)(?:\s+with\s+(?:the\s+)?solution)?)"
+    r"(?:\s+(?:there|all|team|everyone))?[\s!.,:;)(-]*$",
+    re.IGNORECASE,
+)
+
+_QUESTION_CUES = re.compile(
+    r"\?|^\s*(?:how|why|what|can|could|should|is\s+it|is\s+there|do\s+i|does)\b|\b(?:help|troubleshoot|fix)\b",
+    re.IGNORECASE,
+)
+
+# Words that point at a technical problem regardless of the AWS service involved.
+TECHNICAL_TERMS = frozenset(tokenize(
+    "error errors exception fail failed failing failure timeout timing timed crash crashing "
+    "denied forbidden unauthorized throttling throttled latency slow outage down unreachable "
+    "configure configuration setup deploy deployment migrate migration scale scaling "
+    "permission policy role cluster instance bucket queue topic function database cache "
+    "subnet endpoint cidr dns certificate memory cpu disk log logs metric alarm container pod kubernetes "
+    "terraform cloudformation cli sdk api kubectl helm 403 404 500 502 503 504"
+))
+
+SERVICE_WEIGHT = 2.0
+TECHNICAL_WEIGHT = 1.0
+QUESTION_WEIGHT = 1.0
+
+
+class LocalClassifier:
+    """Decides obvious cases of "is this an AWS technical question?" without an LLM.
+
+    Numbered answer lists, greetings and confirmations are rejected by pattern.
+    Everything else is scored with a small lexical model: AWS service vocabulary
+    and technical terms push towards YES, and a message with no signal at all
+    is a NO. Messages in between return None and go to the LLM classifier.
+    """
+
+    def __init__(self, service_vocabulary: Iterable[str], technical_score: float, max_chitchat_tokens: int = 12):
+        self.service_vocabulary = frozenset(service_vocabulary)
+        self.technical_score = technical_score
+        self.max_chitchat_tokens = max_chitchat_tokens
+
+    def score(self, text: str) -> float:
+        """Lexical evidence that the text is a technical AWS question."""
+        tokens = set(tokenize(text))
+        score = SERVICE_WEIGHT * len(tokens & self.service_vocabulary)
+        score += TECHNICAL_WEIGHT * len((tokens - self.service_vocabulary) & TECHNICAL_TERMS)
+        if _QUESTION_CUES.search(text):
+            score += QUESTION_WEIGHT
+        return score
+
+    def classify(self, text: str) -> Optional[bool]:
+        """Return True/False for clear-cut messages and None when the LLM should decide."""
+        if not text or not text.strip():
+            return False
+        if _NUMBERED_ANSWERS.search(text) or _SMALL_TALK.match(text):
+            return False
+        score = self.score(text)
+        if score >= self.technical_score:
+            return True
+        if score == 0 and len(tokenize(text)) <= self.max_chitchat_tokens:
+            return False
+        return None
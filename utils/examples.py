@@ -0,0 +1,77 @@
+"""On-demand retrieval of the specialists' worked example snippets."""
+import re
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .text import tokenize
+
+# Numbered example headings inside a specialist's "Example format for solutions" section
+_EXAMPLE_HEADING = re.compile(r"^ {8}\d+\.\s+(.*?):?\s*$", re.MULTILINE)
+
+# Title words that say nothing about the topic of an example
+_GENERIC_TERMS = frozenset({
+    "configuration", "setup", "creation", "management", "step", "command", "full", "example",
+    "operation", "ascii",
+})
+
+EXAMPLES_PREAMBLE = "Worked examples relevant to this conversation (follow their style and level of detail):"
+
+
+class ExampleSnippet(NamedTuple):
+    title: str
+    tags: Tuple[Tuple[str, ...], ...]
+    text: str
+
+    def matches(self, terms: Iterable[str]) -> int:
+        """Number of tags whose terms all occur in ``terms``."""
+        terms = set(terms)
+        return sum(1 for tag in self.tags if tag and terms.issuperset(tag))
+
+
+def split_examples(section: str, extra_tags: Optional[Dict[str, List[str]]] = None) -> List[ExampleSnippet]:
+    """Split an example section into snippets tagged by their title and any extra tags.
+
+    Each tag is a phrase; it matches when all of its (stemmed) words occur in
+    the conversation. ``extra_tags`` maps an example title to more phrases.
+    """
+    extra_tags = extra_tags or {}
+    headings = list(_EXAMPLE_HEADING.finditer(section))
+    snippets = []
+    for heading, following in zip(headings, headings[1:] + [None]):
+        title = heading.group(1)
+        text = section[heading.start():following.start() if following else len(section)].rstrip()
+        phrases = [title, *extra_tags.get(title, [])]
+        tags = tuple(
+            tuple(term for term in tokenize(phrase) if term not in _GENERIC_TERMS) for phrase in phrases
+        )
+        snippets.append(ExampleSnippet(title, tags, text))
+    return snippets
+
+
+class ExampleLibrary:
+    """Selects a specialist's example snippets for the topics a conversation mentions.
+
+    ``inject`` is registered as the specialist's
+    ``process_all_messages_before_reply`` hook: matching snippets are appended
+    as a trailing system message, so the system message itself, and with it
+    the cached prompt prefix, stays the same on every call.
+    """
+
+    def __init__(self, snippets: List[ExampleSnippet], max_snippets: int = 2):
+        self.snippets = snippets
+        self.max_snippets = max_snippets
+
+    def select(self, text: str) -> List[ExampleSnippet]:
+        """Return up to ``max_snippets`` matching snippets, best first, ties in section order."""
+        terms = set(tokenize(text))
+        scored = [(snippet.matches(terms), -i, snippet) for i, snippet in enumerate(self.snippets)]
+        scored = sorted((s for s in scored if s[0]), reverse=True)
+        return [snippet for _, _, snippet in scored[:self.max_snippets]]
+
+    def inject(self, messages: List[Dict]) -> List[Dict]:
+        """Hook: append the examples relevant to the conversation, if any."""
+        text = "\n".join(m.get("content") or "" for m in messages if isinstance(m.get("content"), str))
+        selected = self.select(text)
+        if not selected:
+            return messages
+        content = "\n\n".join([EXAMPLES_PREAMBLE, *(snippet.text for snippet in selected)])
+        return [*messages, {"role": "system", "content": content}]
@@ -0,0 +1,265 @@
+"""Concurrent fan-out of a problem to the relevant researchers and specialists."""
+import abc
+import asyncio
+import contextvars
+import functools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
+
+import autogen
+
+from .review import is_approved
+from .router import ServiceRouter, service_key
+from .questions import merge_questions
+from .rate_limit import BACKGROUND, llm_priority
+from .registry import AgentRegistry
+from .streaming import stop_on
+
+if TYPE_CHECKING:
+    from .speculation import Draft, SolutionDrafts
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def _close_when_idle(loop: asyncio.AbstractEventLoop, executor: ThreadPoolExecutor) -> None:
+    executor.shutdown(wait=True)
+    loop.close()
+
+
+def run_blocking(coroutine: Awaitable[T], max_workers: int) -> T:
+    """Run a coroutine to completion from synchronous code.
+
+    The blocking LLM calls run in the loop's default executor, sized to let
+    every call run at once. Calls abandoned after a timeout are not waited
+    for: they are told to stop (see :meth:`_Fanout.a_ask`), and the loop is
+    closed in the background once the last of them has returned, so none of
+    them reports back to a closed loop.
+    """
+    loop = asyncio.new_event_loop()
+    executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+    loop.set_default_executor(executor)
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+        threading.Thread(target=_close_when_idle, args=(loop, executor), name="fanout-close", daemon=True).start()
+
+
+def reply_content(reply: object) -> str:
+    """Return the text of a reply produced by ``generate_oai_reply``."""
+    content = reply.get("content") if isinstance(reply, dict) else reply
+    return content.strip() if isinstance(content, str) else ""
+
+
+def reflect_with_llm(agent: autogen.ConversableAgent, prompt: str, replies: List[Tuple[str, str]]) -> str:
+    """Summarize agent replies with one LLM call, like autogen's ``reflection_with_llm``, at background priority."""
+    messages = [{"role": "user", "name": name, "content": content} for name, content in replies]
+    messages.append({"role": "system", "content": prompt})
+    with llm_priority(BACKGROUND):
+        response = agent.client.create(messages=messages, cache=agent.client_cache)
+    return reply_content(agent.client.extract_text_or_completion_object(response)[0])
+
+
+class _Fanout(abc.ABC):
+    """Routing, concurrent asking and review loop shared by both phases."""
+
+    def __init__(
+        self,
+        router: ServiceRouter,
+        agents: AgentRegistry,
+        review: Callable[[str], str],
+        threshold: float,
+        max_agents: int,
+        max_reworks: int,
+        on_approved: Optional[Callable[[str, str, List[str]], None]] = None,
+    ):
+        self.router = router
+        self.agents = agents
+        self.names: Dict[str, str] = {service_key(name): name for name in agents.names()}
+        self.review = review
+        self.threshold = threshold
+        self.max_agents = max_agents
+        self.max_reworks = max_reworks
+        self.on_approved = on_approved
+
+    def select(self, text: str) -> List[autogen.ConversableAgent]:
+        """Return the routed agents, or all of them when routing is not confident; agents are built on first use."""
+        keys = [service_key(name) for name in self.router.route(text, self.threshold, self.max_agents)]
+        names = [self.names[key] for key in keys if key in self.names] or list(self.names.values())
+        return [self.agents.get(name) for name in names]
+
+    def ask(self, agent: autogen.ConversableAgent, prompt: str, stop: threading.Event) -> str:
+        """Ask one agent for a reply; returns nothing if the caller gave up before the call started."""
+        if stop.is_set():
+            return ""
+        with stop_on(stop):
+            messages = agent.process_all_messages_before_reply([{"role": "user", "content": prompt}])
+            _, reply = agent.generate_oai_reply(messages=messages)
+        return reply_content(reply)
+
+    async def a_ask(self, agent: autogen.ConversableAgent, prompt: str, timeout: Optional[float] = None) -> str:
+        """Ask one agent in a worker thread, giving up after ``timeout`` seconds.
+
+        The call runs in a copy of the caller's context (its IOStream and LLM
+        priority). When it times out or is cancelled, its stop event is set:
+        a streamed completion then ends at its next chunk, and a call that
+        has not started yet is skipped.
+        """
+        stop = threading.Event()
+        call = functools.partial(contextvars.copy_context().run, self.ask, agent, prompt, stop)
+        try:
+            return await asyncio.wait_for(asyncio.get_running_loop().run_in_executor(None, call), timeout)
+        finally:
+            stop.set()
+
+    async def a_gather(self, agents: List[autogen.ConversableAgent], calls: List[Awaitable[str]]) -> List[Tuple[str, str]]:
+        """Await the calls concurrently and return non-empty (name, reply) pairs in agent order."""
+        results = await asyncio.gather(*calls, return_exceptions=True)
+        replies = []
+        for agent, result in zip(agents, results):
+            if isinstance(result, asyncio.TimeoutError):
+                logger.warning("%s timed out", agent.name)
+            elif isinstance(result, BaseException):
+                logger.warning("%s failed: %s", agent.name, result)
+            elif result:
+                replies.append((agent.name, result))
+        return replies
+
+    @abc.abstractmethod
+    async def collect(self, prompt: str, routing_text: str) -> List[Tuple[str, str]]:
+        """Ask the agents routed for ``routing_text`` and return their (name, reply) pairs."""
+
+    @abc.abstractmethod
+    def combine(self, replies: List[Tuple[str, str]]) -> str:
+        """Turn the replies into one result for review; empty if there is nothing to review."""
+
+    async def a_run(self, problem: str) -> str:
+        """Collect, combine and review replies for a problem; return the reviewed result."""
+        prompt = problem
+        routing_text = problem
+        result = ""
+        for _ in range(self.max_reworks + 1):
+            replies = await self.collect(prompt, routing_text)
+            result = self.combine(replies)
+            if not result:
+                return "TERMINATE"
+            verdict = self.review(result)
+            if is_approved(verdict):
+                if self.on_approved is not None:
+                    self.on_approved(problem, result, [name for name, _ in replies])
+                break
+            routing_text = f"{problem}\n{verdict}"
+            prompt = f"{problem}\n\nPrevious proposal:\n{result}\n\nHuman Expert feedback:\n{verdict}"
+        return result
+
+    def generate_reply(
+        self,
+        recipient: autogen.ConversableAgent,
+        messages: Optional[List[Dict]] = None,
+        sender: Optional[autogen.Agent] = None,
+        config: Optional[object] = None,
+    ) -> Tuple[bool, Optional[str]]:
+        """Reply function for a coordinator, used instead of its nested group chat."""
+        problem = messages[-1].get("content") if messages else None
+        if not problem:
+            return False, None
+        return True, run_blocking(self.a_run(problem), len(self.names))
+
+
+class ResearchFanout(_Fanout):
+    """Research mode that asks every relevant researcher at the same time.
+
+    The problem is routed locally, sent to all routed researchers concurrently
+    through autogen's async reply API, and their numbered question lists are
+    merged once (near-duplicates at or above ``similarity`` are dropped). The
+    research phase therefore takes as long as the slowest researcher rather
+    than the sum of all of them. The merged questions are
+    reviewed by the Human Expert; a REWORK re-runs the fan-out with the
+    feedback attached, and ``on_approved`` is told about approved questions
+    and the researchers that contributed to them.
+    """
+
+    def __init__(
+        self,
+        router: ServiceRouter,
+        researchers: AgentRegistry,
+        review: Callable[[str], str],
+        threshold: float,
+        max_researchers: int,
+        max_reworks: int = 2,
+        on_approved: Optional[Callable[[str, str, List[str]], None]] = None,
+        similarity: Optional[float] = None,
+    ):
+        super().__init__(router, researchers, review, threshold, max_researchers, max_reworks, on_approved)
+        self.similarity = similarity
+
+    async def collect(self, prompt: str, routing_text: str) -> List[Tuple[str, str]]:
+        """Ask the routed researchers concurrently."""
+        agents = self.select(routing_text)
+        return await self.a_gather(agents, [self.a_ask(agent, prompt) for agent in agents])
+
+    def combine(self, replies: List[Tuple[str, str]]) -> str:
+        return merge_questions(replies, self.similarity)
+
+
+class SolutionEngine(_Fanout):
+    """Solution mode that runs the selected specialists concurrently.
+
+    At most ``max_concurrency`` specialists generate at once and each one is
+    given ``timeout`` seconds; a specialist that fails or times out is left
+    out of the result. Replies are handed to ``aggregate`` in the order the
+    specialists were registered, whatever order they finished in, so the
+    aggregation step sees the same input for the same answers.
+
+    With ``drafts`` (a :class:`~utils.speculation.SolutionDrafts`), the first
+    round uses the speculative drafts written during the research phase:
+    as they are, or revised with a short prompt for the user's answers.
+    """
+
+    def __init__(
+        self,
+        router: ServiceRouter,
+        specialists: AgentRegistry,
+        aggregate: Callable[[List[Tuple[str, str]]], str],
+        review: Callable[[str], str],
+        threshold: float,
+        max_specialists: int,
+        max_concurrency: int,
+        timeout: float,
+        max_reworks: int = 2,
+        on_approved: Optional[Callable[[str, str, List[str]], None]] = None,
+        drafts: Optional["SolutionDrafts"] = None,
+    ):
+        super().__init__(router, specialists, review, threshold, max_specialists, max_reworks, on_approved)
+        self.aggregate = aggregate
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.drafts = drafts
+        self._drafts: Dict[str, "Draft"] = {}
+
+    async def a_run(self, problem: str) -> str:
+        self._drafts = self.drafts.take() if self.drafts is not None else {}
+        return await super().a_run(problem)
+
+    async def collect(self, prompt: str, routing_text: str) -> List[Tuple[str, str]]:
+        """Run the routed specialists with bounded concurrency and a per-agent timeout."""
+        order = self.agents.names()
+        agents = sorted(self.select(routing_text), key=lambda agent: order.index(agent.name))
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        drafts, self._drafts = self._drafts, {}
+
+        async def bounded(agent: autogen.ConversableAgent) -> str:
+            draft = drafts.get(agent.name)
+            if draft is not None and draft.revision_prompt is None:
+                return draft.text
+            async with semaphore:
+                return await self.a_ask(agent, draft.revision_prompt if draft is not None else prompt, self.timeout)
+
+        return await self.a_gather(agents, [bounded(agent) for agent in agents])
+
+    def combine(self, replies: List[Tuple[str, str]]) -> str:
+        return self.aggregate(replies) if replies else ""
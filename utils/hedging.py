@@ -0,0 +1,98 @@
+"""Latency tracking and hedged requests against slow LLM calls."""
+import contextvars
+import queue
+import threading
+from collections import deque
+from typing import Callable, Deque, Dict, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class LatencyTracker:
+    """Recent latencies per key (e.g. role and model), for percentile thresholds."""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.window = window
+        self.min_samples = min_samples
+        self._samples: Dict[Hashable, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, key: Hashable, seconds: float) -> None:
+        with self._lock:
+            self._samples.setdefault(key, deque(maxlen=self.window)).append(seconds)
+
+    def percentile(self, key: Hashable, fraction: float) -> Optional[float]:
+        """The ``fraction`` (e.g. 0.95) latency of the key, or None before ``min_samples`` are in."""
+        with self._lock:
+            samples = sorted(self._samples.get(key, ()))
+        if len(samples) < self.min_samples:
+            return None
+        return samples[min(len(samples) - 1, int(fraction * len(samples)))]
+
+
+class HedgeCancelled(Exception):
+    """Raised by an attempt that stopped because the other attempt won."""
+
+
+def hedged(
+    attempt: Callable[[int], T],
+    delay: float,
+    discard: Callable[[T], None],
+    cancel: Callable[[int], None] = lambda index: None,
+) -> Tuple[T, int]:
+    """Run ``attempt(0)``; if it has not returned after ``delay`` seconds, also run ``attempt(1)``.
+
+    Returns the first result to arrive and the index of the attempt that
+    produced it. ``cancel`` is then called with the other attempt's index,
+    so it can stop early (e.g. raising :class:`HedgeCancelled`); its result,
+    if it still returns one, is passed to ``discard``. An attempt that fails
+    leaves the other one to finish; the error is raised only when no attempt
+    is left. Both attempts run in threads with a copy of the caller's
+    context (e.g. its ``llm_priority``).
+    """
+    results: "queue.Queue[Tuple[int, Optional[T], Optional[BaseException]]]" = queue.Queue()
+    lock = threading.Lock()
+    finished = False
+
+    def run(index: int) -> None:
+        try:
+            value = attempt(index)
+        except BaseException as error:  # Handed to the caller, or dropped if the other attempt won
+            results.put((index, None, error))
+            return
+        with lock:
+            if not finished:
+                results.put((index, value, None))
+                return
+        discard(value)
+
+    def start(index: int) -> None:
+        context = contextvars.copy_context()
+        threading.Thread(target=context.run, args=(run, index), name=f"hedge-{index}", daemon=True).start()
+
+    start(0)
+    running, hedge_started = 1, False
+    while True:
+        try:
+            index, value, error = results.get(timeout=None if hedge_started else delay)
+        except queue.Empty:
+            start(1)
+            running, hedge_started = running + 1, True
+            continue
+        running -= 1
+        if error is None:
+            with lock:
+                finished = True
+            if hedge_started:
+                cancel(1 - index)
+            # The other attempt may have put its result just before this one was taken
+            while True:
+                try:
+                    _, late, _ = results.get_nowait()
+                except queue.Empty:
+                    break
+                if late is not None:
+                    discard(late)
+            return value, index
+        if running == 0:
+            raise error
@@ -0,0 +1,116 @@
+"""Sliding-window compaction of group chat history."""
+import functools
+import re
+from typing import Dict, List, Tuple
+
+import autogen
+from autogen.token_count_utils import count_token
+
+_WHITESPACE = re.compile(r"\s+")
+
+_TRUNCATED = "\n[... truncated to fit the context budget]"
+
+DIGEST_HEADER = "Digest of earlier turns (condensed; the full messages were sent before):"
+
+
+def _content(message: Dict) -> str:
+    content = message.get("content")
+    return content if isinstance(content, str) else ""
+
+
+class HistoryCompactor:
+    """Keeps the last turns verbatim and folds older ones into a digest.
+
+    Implements autogen's ``MessageTransform`` protocol, so it is added to an
+    agent through ``TransformMessages`` and applies to every reply the agent
+    generates. The first message (the task handed to the group chat) and the
+    last ``keep_last`` turns are kept as they are; the turns in between become
+    one digest message with a line per turn of at most ``digest_chars``
+    characters. If the result is still above ``max_tokens``, more recent turns
+    are folded, then the oldest digest lines are dropped, then the longest
+    messages are cut. Trailing system messages (e.g. injected examples) are
+    kept and counted but never folded.
+    """
+
+    def __init__(self, keep_last: int = 4, max_tokens: int = 12_000, digest_chars: int = 300, model: str = "gpt-4o"):
+        self.keep_last = max(keep_last, 1)
+        self.max_tokens = max_tokens
+        self.digest_chars = digest_chars
+        self.model = model
+
+    def _tokens(self, messages: List[Dict]) -> int:
+        return sum(count_token(_content(m), self.model) for m in messages)
+
+    def _digest_line(self, message: Dict) -> str:
+        text = _WHITESPACE.sub(" ", _content(message)).strip()
+        if len(text) > self.digest_chars:
+            text = text[:self.digest_chars].rstrip() + " ..."
+        return f"- {message.get('name') or message.get('role', 'unknown')}: {text}"
+
+    def _assemble(self, head: List[Dict], digest_lines: List[str], recent: List[Dict], tail: List[Dict]) -> List[Dict]:
+        digest = [{"role": "user", "content": "\n".join([DIGEST_HEADER, *digest_lines])}] if digest_lines else []
+        return [*head, *digest, *recent, *tail]
+
+    def apply_transform(self, messages: List[Dict]) -> List[Dict]:
+        """Return the compacted history; short histories are returned unchanged."""
+        end = len(messages)
+        while end and messages[end - 1].get("role") == "system":
+            end -= 1
+        conversation, tail = messages[:end], messages[end:]
+        if len(conversation) <= self.keep_last + 1 and self._tokens(messages) <= self.max_tokens:
+            return messages
+
+        head, body = conversation[:1], conversation[1:]
+        split = max(len(body) - self.keep_last, 0)
+        digest_lines = [self._digest_line(m) for m in body[:split]]
+        recent = body[split:]
+        compacted = self._assemble(head, digest_lines, recent, tail)
+
+        while self._tokens(compacted) > self.max_tokens and len(recent) > 1:
+            digest_lines.append(self._digest_line(recent.pop(0)))
+            compacted = self._assemble(head, digest_lines, recent, tail)
+        while self._tokens(compacted) > self.max_tokens and digest_lines:
+            digest_lines.pop(0)
+            compacted = self._assemble(head, digest_lines, recent, tail)
+        overflow = self._tokens(compacted) - self.max_tokens
+        if overflow > 0:
+            compacted = [dict(m) for m in compacted]
+            for message in sorted(compacted, key=lambda m: len(_content(m)), reverse=True):
+                if overflow <= 0:
+                    break
+                text = _content(message)
+                tokens = count_token(text, self.model)
+                target = max(tokens - overflow - count_token(_TRUNCATED, self.model), 0)
+                message["content"] = text[:len(text) * target // max(tokens, 1)] + _TRUNCATED
+                overflow -= tokens - count_token(message["content"], self.model)
+        return compacted
+
+    def get_logs(self, pre_transform_messages: List[Dict], post_transform_messages: List[Dict]) -> Tuple[str, bool]:
+        if post_transform_messages == pre_transform_messages:
+            return "No history compaction needed.", False
+        before, after = self._tokens(pre_transform_messages), self._tokens(post_transform_messages)
+        return (
+            f"Compacted {len(pre_transform_messages)} messages ({before} tokens) "
+            f"to {len(post_transform_messages)} ({after} tokens).",
+            True,
+        )
+
+
+def compact_speaker_selection(groupchat: autogen.GroupChat, compactor: HistoryCompactor) -> None:
+    """Compact the history the group chat's LLM speaker selection sends, like its members' histories.
+
+    autogen builds a new selector agent for every "auto" selection and hands
+    it the whole chat, so the transforms added to the members never apply
+    to it. The compacted history still ends with the last turn, which the
+    selector answers.
+    """
+    prepare = groupchat._prepare_and_select_agents
+
+    @functools.wraps(prepare)
+    def prepare_compacted(last_speaker: autogen.Agent):
+        selected_agent, agents, messages = prepare(last_speaker)
+        if messages:
+            messages = compactor.apply_transform(messages)
+        return selected_agent, agents, messages
+
+    groupchat._prepare_and_select_agents = prepare_compacted
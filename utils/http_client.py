@@ -0,0 +1,287 @@
+"""One HTTP connection pool shared by the OpenAI clients of every agent."""
+import json
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+import openai
+
+from .hedging import HedgeCancelled, LatencyTracker, hedged
+from .llm_cache import normalize_key
+from .rate_limit import INTERACTIVE, RateLimiter, current_priority
+from .single_flight import SingleFlight
+
+# Rough characters per token of a JSON request body, for rate limiting before the call
+CHARS_PER_TOKEN = 4
+
+# Request header naming the agent role a request is made for; removed before sending
+ROLE_HEADER = "x-llm-role"
+
+# Headers of a shared response that describe the body as sent, not as decoded
+_ENCODING_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+
+
+def estimate_request(body: bytes, expected_completion_tokens: int) -> Tuple[str, int]:
+    """Model and token cost (prompt plus completion) of a chat completion request body."""
+    try:
+        params = json.loads(body)
+    except ValueError:
+        return "", 0
+    if not isinstance(params, dict):
+        return "", 0
+    completion = params.get("max_completion_tokens") or params.get("max_tokens") or expected_completion_tokens
+    return str(params.get("model") or ""), len(body) // CHARS_PER_TOKEN + int(completion)
+
+
+class SharedHttpClient(openai.DefaultHttpxClient):
+    """The OpenAI SDK's default HTTP client, shared instead of built per agent.
+
+    Every agent with an ``llm_config`` gets its own OpenAI client, and each
+    one otherwise sets up its own connection pool and TLS context (loading
+    the CA bundle takes tens of milliseconds of CPU). Passing one instance as
+    ``http_client`` reuses the pool and keep-alive connections across agents
+    and sessions; it is safe to use from several threads.
+
+    With a ``rate_limiter``, every request (SDK retries included) first waits
+    for its model's request and token budgets, at the priority of the calling
+    thread (see ``llm_priority``), and each response updates the budgets.
+    Requests that set no ``max_tokens`` are charged ``expected_completion_tokens``.
+
+    ``hedge_percentiles`` maps a role (see :func:`for_role`) to a latency
+    percentile. An interactive request of such a role that is still waiting
+    for its response at that percentile of the role's recent latencies (per
+    model, streamed or not, in ``latencies``) is sent a second time; the
+    first response is used. The other attempt is stopped: a non-streamed
+    chat completion is requested streamed for this (and assembled back into
+    a regular response), so its connection is dropped at the next chunk,
+    which ends the generation; a streamed one is closed when its headers
+    arrive, other requests when their response arrives. Requests of roles
+    without a percentile are never hedged.
+
+    With ``single_flight``, a request identical to one still in flight (same
+    endpoint, and the same model, messages and parameters as the response
+    cache compares them) is not sent: it waits for the first one and gets a
+    copy of its response. Streamed requests are always sent.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        rate_limiter: Optional[RateLimiter] = None,
+        expected_completion_tokens: int = 1000,
+        hedge_percentiles: Optional[Mapping[str, float]] = None,
+        latencies: Optional[LatencyTracker] = None,
+        single_flight: Optional[SingleFlight] = None,
+        **kwargs: Any,
+    ):
+        super().__init__(*args, **kwargs)
+        self.rate_limiter = rate_limiter
+        self.expected_completion_tokens = expected_completion_tokens
+        self.hedge_percentiles = dict(hedge_percentiles or {})
+        self.latencies = latencies or LatencyTracker()
+        self.single_flight = single_flight
+        self._stats_lock = threading.Lock()
+        self._stats = {"hedged": 0, "hedge_wins": 0}
+
+    def _attempt(self, request, model: str, tokens: int, key: Tuple[str, str, bool], read=None, **kwargs):
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(model, tokens)
+        started = time.monotonic()
+        response = super().send(request, **kwargs)
+        if self.rate_limiter is not None:
+            self.rate_limiter.observe(model, response.status_code, response.headers)
+        if read is not None:
+            response = read(response)
+        if response.status_code < 400:
+            self.latencies.record(key, time.monotonic() - started)
+        return response
+
+    def send(self, request, **kwargs):
+        role = request.headers.pop(ROLE_HEADER, "")
+        if request.method != "POST":
+            return super().send(request, **kwargs)
+        if self.single_flight is None or kwargs.get("stream"):
+            return self._send(request, role, **kwargs)
+        key = (str(request.url), normalize_key(request.content.decode("utf-8", errors="replace")))
+        response, shared = self.single_flight.do(key, lambda: self._send(request, role, **kwargs))
+        if not shared:
+            return response
+        # The body was read by the request that was sent; each waiter gets its own response object
+        headers = [(name, value) for name, value in response.headers.items() if name.lower() not in _ENCODING_HEADERS]
+        return type(response)(response.status_code, headers=headers, content=response.content, request=request)
+
+    def _send(self, request, role: str, **kwargs):
+        model, tokens = estimate_request(request.content, self.expected_completion_tokens)
+        key = (role, model, bool(kwargs.get("stream")))
+        percentile = self.hedge_percentiles.get(role)
+        delay = None
+        if percentile is not None and current_priority() == INTERACTIVE:
+            delay = self.latencies.percentile(key, percentile)
+        if delay is None:
+            return self._attempt(request, model, tokens, key, **kwargs)
+
+        # A non-streamed chat completion is requested streamed, so that the losing attempt can be
+        # stopped between chunks: closing its connection ends the generation
+        content = request.content if kwargs.get("stream") else as_event_stream(request)
+        headers = [(name, value) for name, value in request.headers.multi_items() if name.lower() != "content-length"]
+        stops = (threading.Event(), threading.Event())
+
+        def attempt(index: int):
+            if index:
+                with self._stats_lock:
+                    self._stats["hedged"] += 1
+            sent = self.build_request(
+                request.method, request.url, headers=headers, content=content, extensions=request.extensions
+            )
+            if content is request.content:
+                return self._attempt(sent, model, tokens, key, **kwargs)
+
+            def read(response):
+                return completion_response(response, request, stops[index])
+
+            return self._attempt(sent, model, tokens, key, read=read, **{**kwargs, "stream": True})
+
+        response, index = hedged(
+            attempt, delay, discard=lambda response: response.close(), cancel=lambda index: stops[index].set()
+        )
+        if index:
+            with self._stats_lock:
+                self._stats["hedge_wins"] += 1
+        return response
+
+    def stats(self) -> Dict[str, int]:
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def report(self) -> str:
+        stats = self.stats()
+        return f"LLM hedging: {stats['hedged']} requests hedged, {stats['hedge_wins']} answered first by the hedge"
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "SharedHttpClient":
+        # Agents deep-copy their llm_config; they must all share this instance.
+        return self
+
+
+def as_event_stream(request) -> bytes:
+    """The body of a chat completion request, asking for a streamed response (with usage); other bodies as they are."""
+    if not request.url.path.endswith("/chat/completions"):
+        return request.content
+    try:
+        params = json.loads(request.content)
+    except ValueError:
+        return request.content
+    if not isinstance(params, dict) or params.get("stream"):
+        return request.content
+    params["stream"] = True
+    params["stream_options"] = {**(params.get("stream_options") or {}), "include_usage": True}
+    return json.dumps(params).encode("utf-8")
+
+
+def collect_completion(lines: Iterable[str]) -> Dict[str, Any]:
+    """Assemble the ``chat.completion`` a non-streamed request gets from the server-sent events of a streamed one.
+
+    An error event is returned as the error body it carries.
+    """
+    completion: Dict[str, Any] = {"object": "chat.completion"}
+    choices: Dict[int, Dict[str, Any]] = {}
+    for line in lines:
+        if not line.startswith("data:"):
+            continue
+        data = line[len("data:"):].strip()
+        if data == "[DONE]":
+            break
+        chunk = json.loads(data)
+        if chunk.get("error"):
+            return {"error": chunk["error"]}
+        for field in ("id", "created", "model", "system_fingerprint", "service_tier", "usage"):
+            if chunk.get(field) is not None:
+                completion[field] = chunk[field]
+        for part in chunk.get("choices") or []:
+            choice = choices.setdefault(
+                part["index"],
+                {"index": part["index"], "message": {"role": "assistant", "content": None}, "finish_reason": None},
+            )
+            message, delta = choice["message"], part.get("delta") or {}
+            if delta.get("role"):
+                message["role"] = delta["role"]
+            for field in ("content", "refusal"):
+                if delta.get(field) is not None:
+                    message[field] = (message.get(field) or "") + delta[field]
+            if delta.get("function_call"):
+                call = message.setdefault("function_call", {"name": "", "arguments": ""})
+                call["name"] += delta["function_call"].get("name") or ""
+                call["arguments"] += delta["function_call"].get("arguments") or ""
+            for part_call in delta.get("tool_calls") or []:
+                calls = message.setdefault("tool_calls", [])
+                while len(calls) <= part_call["index"]:
+                    calls.append({"id": None, "type": "function", "function": {"name": "", "arguments": ""}})
+                call = calls[part_call["index"]]
+                call["id"] = part_call.get("id") or call["id"]
+                function = part_call.get("function") or {}
+                call["function"]["name"] += function.get("name") or ""
+                call["function"]["arguments"] += function.get("arguments") or ""
+            if part.get("logprobs") is not None:
+                choice["logprobs"] = part["logprobs"]
+            if part.get("finish_reason"):
+                choice["finish_reason"] = part["finish_reason"]
+    completion["choices"] = [choices[index] for index in sorted(choices)]
+    return completion
+
+
+def completion_response(response, request, stop: Optional[threading.Event] = None):
+    """The non-streamed chat completion response for ``request``, read from a streamed ``response``.
+
+    Raises :class:`HedgeCancelled` (and drops the connection) once ``stop`` is set.
+    """
+    try:
+        if response.status_code >= 400 or "text/event-stream" not in response.headers.get("content-type", ""):
+            response.read()  # An error, or a server that answered with the whole completion anyway
+            return response
+        completion = collect_completion(_until(response.iter_lines(), stop))
+    finally:
+        response.close()
+    headers = [
+        (name, value)
+        for name, value in response.headers.items()
+        if name.lower() not in _ENCODING_HEADERS and name.lower() != "content-type"
+    ]
+    return type(response)(
+        500 if "error" in completion else response.status_code,
+        headers=headers + [("content-type", "application/json")],
+        content=json.dumps(completion).encode("utf-8"),
+        request=request,
+    )
+
+
+def _until(lines: Iterable[str], stop: Optional[threading.Event]) -> Iterator[str]:
+    for line in lines:
+        if stop is not None and stop.is_set():
+            raise HedgeCancelled()
+        yield line
+
+
+def with_http_client(config_list: List[Dict[str, Any]], client: Optional[SharedHttpClient]) -> List[Dict[str, Any]]:
+    """Return a copy of an autogen config list whose OpenAI clients use the given HTTP client."""
+    if client is None:
+        return config_list
+    return [{**entry, "http_client": client} for entry in config_list]
+
+
+def for_role(
+    config_list: List[Dict[str, Any]], role: str, timeout: Optional[float] = None, max_retries: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """Return a copy of an autogen config list whose requests carry the role name, a ``timeout`` and ``max_retries``.
+
+    The timeout is the OpenAI client's: it bounds connecting and each read
+    of a request, which the SDK then retries ``max_retries`` times (its
+    default is 2), so a request can take up to ``max_retries + 1`` timeouts.
+    """
+    entries = []
+    for entry in config_list:
+        entry = {**entry, "default_headers": {**entry.get("default_headers", {}), ROLE_HEADER: role}}
+        if timeout is not None:
+            entry["timeout"] = timeout
+        if max_retries is not None:
+            entry["max_retries"] = max_retries
+        entries.append(entry)
+    return entries
@@ -0,0 +1,248 @@
+"""Persistent, size-bounded cache for LLM responses."""
+import hashlib
+import json
+import os
+import pickle
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+# Request parameters that do not change the completion and must not split the cache.
+_IGNORED_PARAMS = frozenset({"stream", "timeout", "user", "cache", "cache_seed", "api_key", "base_url"})
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_key(key: str) -> str:
+    """Turn an autogen cache key into a stable hash of model, messages and parameters.
+
+    autogen passes the JSON-encoded request as the key. Message text is
+    whitespace-normalized (system prompts are indented differently across
+    modules) and transport-only parameters are dropped before hashing.
+    """
+    try:
+        params = json.loads(key)
+    except (TypeError, ValueError):
+        return hashlib.sha256(str(key).encode("utf-8")).hexdigest()
+    if not isinstance(params, dict):
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    normalized: Dict[str, Any] = {k: v for k, v in params.items() if k not in _IGNORED_PARAMS and v is not None}
+    messages: List[Dict[str, Any]] = []
+    for message in params.get("messages") or []:
+        message = {k: v for k, v in message.items() if v is not None}
+        if isinstance(message.get("content"), str):
+            message["content"] = _WHITESPACE.sub(" ", message["content"]).strip()
+        messages.append(message)
+    normalized["messages"] = messages
+    encoded = json.dumps(normalized, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """SQLite-backed response cache usable as autogen's ``cache`` in an llm_config.
+
+    Entries expire ``ttl`` seconds after they were written and the least
+    recently used entries are evicted once the cache holds more than
+    ``max_entries`` responses or ``max_bytes`` of pickled data. The database
+    runs in WAL mode with a busy timeout, so several worker processes can
+    share one file; each thread gets its own connection.
+
+    Hit and miss counts are kept both for this process and, in the database,
+    across every process using the file. Lookups only read: their counts and
+    access times are batched in memory and written at most every
+    ``flush_interval`` seconds, with the next write and by :meth:`flush`.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+        flush_interval: float = 5.0,
+    ):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.flush_interval = flush_interval
+        self.hits = 0
+        self.misses = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # Lookups not yet written to the database
+        self._counts: Dict[str, int] = {}
+        self._accessed: Dict[str, float] = {}
+        self._flushed_at = time.monotonic()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connection() as connection:
+            connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    value BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+                CREATE TABLE IF NOT EXISTS counters (
+                    name TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL
+                );
+                """
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def _count(self, name: str, digest: Optional[str] = None, now: Optional[float] = None) -> bool:
+        """Record a lookup in memory; returns True when the batch is due to be written."""
+        with self._lock:
+            if name == "hits":
+                self.hits += 1
+            else:
+                self.misses += 1
+            self._counts[name] = self._counts.get(name, 0) + 1
+            if digest is not None:
+                self._accessed[digest] = now
+            return time.monotonic() - self._flushed_at >= self.flush_interval
+
+    def _write_pending(self, connection: sqlite3.Connection) -> None:
+        """Write the batched lookups; the caller holds a write transaction."""
+        with self._lock:
+            counts, self._counts = self._counts, {}
+            accessed, self._accessed = self._accessed, {}
+            self._flushed_at = time.monotonic()
+        connection.executemany(
+            "INSERT INTO counters (name, value) VALUES (?, ?) ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            counts.items(),
+        )
+        connection.executemany(
+            "UPDATE responses SET accessed_at = MAX(accessed_at, ?) WHERE key = ?",
+            [(at, digest) for digest, at in accessed.items()],
+        )
+
+    def flush(self) -> None:
+        """Write the hit/miss counts and access times batched since the last write."""
+        with self._lock:
+            if not self._counts:
+                return
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            self._write_pending(connection)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+    def get(self, key: str, default: Optional[Any] = None) -> Optional[Any]:
+        """Return the cached response for an autogen cache key, or ``default``."""
+        digest = normalize_key(key)
+        now = time.time()
+        row = self._connection().execute(
+            "SELECT value, created_at FROM responses WHERE key = ?", (digest,)
+        ).fetchone()
+        # Expired entries are deleted by the next write
+        if row is None or (self.ttl is not None and now - row[1] > self.ttl):
+            due = self._count("misses")
+            value = default
+        else:
+            due = self._count("hits", digest, now)
+            value = pickle.loads(row[0])
+        if due:
+            self.flush()
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a response and evict expired and least recently used entries."""
+        blob = pickle.dumps(value)
+        now = time.time()
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            # Eviction must see the access times of recent hits
+            self._write_pending(connection)
+            connection.execute(
+                "INSERT OR REPLACE INTO responses (key, value, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (normalize_key(key), blob, len(blob), now, now),
+            )
+            self._evict(connection, now)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+    def _evict(self, connection: sqlite3.Connection, now: float) -> None:
+        if self.ttl is not None:
+            connection.execute("DELETE FROM responses WHERE created_at < ?", (now - self.ttl,))
+        if self.max_entries is not None:
+            connection.execute(
+                "DELETE FROM responses WHERE key IN "
+                "(SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+        if self.max_bytes is not None:
+            connection.execute(
+                "DELETE FROM responses WHERE key IN (SELECT key FROM "
+                "(SELECT key, SUM(size) OVER (ORDER BY accessed_at DESC, key) AS total FROM responses) "
+                "WHERE total > ?)",
+                (self.max_bytes,),
+            )
+
+    def stats(self) -> Dict[str, int]:
+        """Return this process's hit/miss counts, the shared totals and the current size."""
+        self.flush()
+        connection = self._connection()
+        totals = dict(connection.execute("SELECT name, value FROM counters").fetchall())
+        entries, size = connection.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "total_hits": totals.get("hits", 0),
+            "total_misses": totals.get("misses", 0),
+            "entries": entries,
+            "bytes": size,
+        }
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        self._connection().execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Write the batched lookups and close this thread's connection; it is reopened on next use."""
+        self.flush()
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def __enter__(self) -> "ResponseCache":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        # autogen wraps every lookup in ``with cache:``; the cache outlives those
+        # blocks and is shared by all agents, so leaving one must not close it.
+        return None
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "ResponseCache":
+        # Agents deep-copy their llm_config; they must all share this instance.
+        return self
+
+
+def with_response_cache(config_list: List[Dict[str, Any]], cache: Optional[ResponseCache]) -> List[Dict[str, Any]]:
+    """Return a copy of an autogen config list that uses the given response cache."""
+    if cache is None:
+        return config_list
+    return [{**entry, "cache": cache} for entry in config_list]
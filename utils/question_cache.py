@@ -0,0 +1,134 @@
+"""Similarity cache mapping past problems to their approved clarifying questions."""
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import autogen
+
+from .review import is_approved
+from .text import cosine_similarity, tfidf_vectors, tokenize
+
+
+class CachedQuestions(NamedTuple):
+    entry_id: int
+    similarity: float
+    problem: str
+    questions: str
+
+
+class QuestionCache:
+    """Reuses Human Expert approved question sets for near-duplicate problems.
+
+    Problems are compared with TF-IDF vectors computed locally over the cached
+    problems, so no embedding model or LLM call is involved. A match at or
+    above ``threshold`` cosine similarity is shown to the Human Expert and, if
+    approved, answered without running the researchers at all (and
+    ``on_approved`` is told, as for questions the researchers wrote). A REWORK
+    invalidates the entry and lets the normal research phase run. Only
+    entries stored under the same ``version`` (e.g. a hash of the
+    researchers' prompts) are matched; entries of other versions stay for
+    the processes still running them (during a rolling deploy, or batch and
+    server side by side) until ``max_entries`` evicts them.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        review: Callable[[str], str],
+        threshold: float,
+        max_entries: Optional[int] = None,
+        version: str = "",
+        on_approved: Optional[Callable[[str, str], None]] = None,
+    ):
+        self.path = path
+        self.review = review
+        self.on_approved = on_approved
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.version = version
+        self._local = threading.local()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        connection = self._connection()
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS questions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                problem TEXT NOT NULL,
+                terms TEXT NOT NULL,
+                questions TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                version TEXT NOT NULL DEFAULT ''
+            )
+            """
+        )
+        columns = {row[1] for row in connection.execute("PRAGMA table_info(questions)")}
+        if "version" not in columns:
+            connection.execute("ALTER TABLE questions ADD COLUMN version TEXT NOT NULL DEFAULT ''")
+        connection.execute("CREATE INDEX IF NOT EXISTS questions_version ON questions (version)")
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            self._local.connection = connection
+        return connection
+
+    def lookup(self, problem: str) -> Optional[CachedQuestions]:
+        """Return the most similar cached problem if it reaches the threshold."""
+        rows = self._connection().execute(
+            "SELECT id, problem, terms, questions FROM questions WHERE version = ?", (self.version,)
+        ).fetchall()
+        if not rows:
+            return None
+        documents = [json.loads(terms) for _, _, terms, _ in rows] + [tokenize(problem)]
+        vectors = tfidf_vectors(documents)
+        query = vectors.pop()
+        similarity, index = max((cosine_similarity(query, vector), i) for i, vector in enumerate(vectors))
+        if similarity < self.threshold:
+            return None
+        entry_id, cached_problem, _, questions = rows[index]
+        return CachedQuestions(entry_id, similarity, cached_problem, questions)
+
+    def store(self, problem: str, questions: str) -> None:
+        """Remember an approved question set for a problem."""
+        connection = self._connection()
+        connection.execute(
+            "INSERT INTO questions (problem, terms, questions, created_at, version) VALUES (?, ?, ?, ?, ?)",
+            (problem, json.dumps(tokenize(problem)), questions, time.time(), self.version),
+        )
+        if self.max_entries is not None:
+            connection.execute(
+                "DELETE FROM questions WHERE id IN (SELECT id FROM questions ORDER BY id DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def invalidate(self, entry_id: int) -> None:
+        """Drop an entry, e.g. after the Human Expert asked for REWORK."""
+        self._connection().execute("DELETE FROM questions WHERE id = ?", (entry_id,))
+
+    def generate_reply(
+        self,
+        recipient: autogen.ConversableAgent,
+        messages: Optional[List[Dict]] = None,
+        sender: Optional[autogen.Agent] = None,
+        config: Optional[object] = None,
+    ) -> Tuple[bool, Optional[str]]:
+        """Reply function for the Research Coordinator, checked before the research phase."""
+        problem = messages[-1].get("content") if messages else None
+        if not problem:
+            return False, None
+        hit = self.lookup(problem)
+        if hit is None:
+            return False, None
+        if is_approved(self.review(hit.questions)):
+            if self.on_approved is not None:
+                self.on_approved(problem, hit.questions)
+            return True, hit.questions
+        self.invalidate(hit.entry_id)
+        return False, None
@@ -0,0 +1,78 @@
+"""Local consolidation of the researchers' clarifying questions."""
+from typing import Dict, List, Optional, Tuple
+
+import autogen
+
+from .review import replies_since_rework
+from .router import service_key
+from .text import cosine_similarity, parse_numbered_list, tfidf_vectors, tokenize
+
+QUESTIONS_PREAMBLE = "Based on our research team's analysis:"
+
+# Words that phrase a question rather than say what it is about
+_QUESTION_FILLER = frozenset({
+    "need", "require", "requirement", "want", "use", "using", "plan", "prefer", "expect", "expected",
+    "any", "there", "will", "would", "should", "currently", "specific", "kind", "type",
+})
+
+
+def question_terms(question: str) -> List[str]:
+    """The topic terms of a question, for duplicate detection."""
+    return [term for term in tokenize(question) if term not in _QUESTION_FILLER]
+
+
+def merge_questions(replies: List[Tuple[str, str]], similarity: Optional[float] = None) -> str:
+    """Merge the numbered question lists of several researchers into one list.
+
+    Questions are grouped under the service of the researcher that asked them
+    and numbered sequentially across all groups. With ``similarity`` set, a
+    question whose TF-IDF cosine similarity to an earlier question reaches it
+    is dropped as a duplicate, so the first researcher to ask keeps it.
+    """
+    asked = [(service_key(name), question) for name, reply in replies for question in parse_numbered_list(reply)]
+    if similarity is not None:
+        vectors = tfidf_vectors([question_terms(question) for _, question in asked])
+        kept = []
+        for i, vector in enumerate(vectors):
+            if all(cosine_similarity(vector, vectors[j]) < similarity for j in kept):
+                kept.append(i)
+        asked = [asked[i] for i in kept]
+
+    groups: Dict[str, List[str]] = {}
+    for service, question in asked:
+        groups.setdefault(service, []).append(question)
+    sections = []
+    number = 1
+    for service, questions in groups.items():
+        lines = [f"[{service}]:"]
+        for question in questions:
+            lines.append(f"{number}. {question}")
+            number += 1
+        sections.append("\n".join(lines))
+    if not sections:
+        return ""
+    return f"{QUESTIONS_PREAMBLE}\n\n" + "\n\n".join(sections)
+
+
+class QuestionSummary:
+    """Local ``summary_method`` for the research nested chat.
+
+    Replaces ``reflection_with_llm``: the researchers' latest numbered lists
+    (those after the Human Expert's last REWORK) are merged and de-duplicated
+    with :func:`merge_questions`, without an LLM call. Deciding which
+    questions the user already answered is left to the researchers' prompts.
+    Without any questions the summary is "TERMINATE", as in fan-out mode.
+    """
+
+    def __init__(self, groupchat: autogen.GroupChat, researcher_names: List[str], reviewer_name: str, similarity: float):
+        self.groupchat = groupchat
+        self.researcher_names = researcher_names
+        self.reviewer_name = reviewer_name
+        self.similarity = similarity
+
+    def latest_replies(self) -> List[Tuple[str, str]]:
+        """Researcher replies since the reviewer last asked for rework."""
+        return replies_since_rework(self.groupchat.messages, self.researcher_names, self.reviewer_name)
+
+    def __call__(self, sender: autogen.ConversableAgent, recipient: autogen.ConversableAgent, summary_args: Dict) -> str:
+        return merge_questions(self.latest_replies(), self.similarity) or "TERMINATE"
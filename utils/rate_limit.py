@@ -0,0 +1,217 @@
+"""Process-wide, priority-aware rate limiting of LLM requests."""
+import contextlib
+import functools
+import itertools
+import re
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+import autogen
+
+INTERACTIVE = 0  # The user (or an expert) is waiting for the reply
+BACKGROUND = 1  # Surveys, summaries and other calls nobody watches
+
+_priority: ContextVar[int] = ContextVar("llm_priority", default=INTERACTIVE)
+
+_DURATION = re.compile(r"([\d.]+)(ms|s|m|h)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+@contextlib.contextmanager
+def llm_priority(priority: int) -> Iterator[None]:
+    """Run the LLM requests made in this block (in this thread) with the given priority."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> int:
+    return _priority.get()
+
+
+def prioritize(agent: autogen.ConversableAgent, priority: int) -> None:
+    """Give every completion of the agent the given priority."""
+    create = agent.client.create
+
+    @functools.wraps(create)
+    def create_with_priority(**config: Any) -> Any:
+        with llm_priority(priority):
+            return create(**config)
+
+    agent.client.create = create_with_priority
+
+
+def prioritize_summaries(
+    agent: autogen.ConversableAgent, priority: int, llm_agent: Optional[autogen.ConversableAgent] = None
+) -> None:
+    """Give the ``reflection_with_llm`` summaries of chats the agent starts the given priority.
+
+    autogen asks a chat's sender for its summary, written by the recipient's
+    model; with ``llm_agent``, that agent's model writes them instead.
+    """
+    reflect = agent._reflection_with_llm
+
+    @functools.wraps(reflect)
+    def reflect_with_priority(*args: Any, **kwargs: Any) -> Any:
+        if llm_agent is not None:
+            kwargs["llm_agent"] = llm_agent
+        with llm_priority(priority):
+            return reflect(*args, **kwargs)
+
+    agent._reflection_with_llm = reflect_with_priority
+
+
+def parse_duration(value: str) -> Optional[float]:
+    """Seconds in a rate-limit reset header such as "1s", "6m0s" or "120ms"."""
+    parts = _DURATION.findall(value or "")
+    if not parts:
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+    return sum(float(number) * _DURATION_UNITS[unit] for number, unit in parts)
+
+
+def retry_after(headers: Mapping[str, str], default: float = 1.0) -> float:
+    """Seconds to wait after a 429, from ``retry-after-ms`` or ``retry-after``."""
+    try:
+        return float(headers.get("retry-after-ms", "")) / 1000
+    except ValueError:
+        pass
+    return parse_duration(headers.get("retry-after", "")) or default
+
+
+class TokenBucket:
+    """Capacity ``limit`` per minute, refilled continuously."""
+
+    def __init__(self, limit: float):
+        self.capacity = float(limit)
+        self.rate = self.capacity / 60.0
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, floor: float = 0.0) -> float:
+        """Seconds until ``amount`` can be taken leaving at least ``floor`` (0 if it can be taken now).
+
+        The requirement is capped at ``capacity``: an amount too large to
+        leave the floor is admitted once the bucket is full.
+        """
+        missing = min(min(amount, self.capacity) + floor, self.capacity) - self.level
+        return max(missing, 0.0) / self.rate
+
+    def take(self, amount: float) -> None:
+        self.level -= min(amount, self.capacity)
+
+
+class _ModelLimits:
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float):
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self.paused_until = 0.0
+        self.waiting: List[Tuple[int, int]] = []  # (priority, arrival) of blocked requests, served in order
+
+
+class RateLimiter:
+    """Meters LLM requests against per-model request and token budgets.
+
+    ``limits`` maps a model name to ``{"rpm": ..., "tpm": ...}``; only
+    ``headroom`` of each is used, so requests wait here instead of being
+    rejected with 429 by the provider (and retried with growing delays by the
+    SDK). Models without limits are not metered. Waiting requests are
+    admitted by priority, then in arrival order, and background requests also
+    leave ``background_reserve`` of each budget to interactive ones. The
+    buckets follow the provider's ``x-ratelimit-remaining-*`` headers and
+    pause for ``retry-after`` when a 429 gets through anyway, e.g. because
+    other processes share the same API key.
+    """
+
+    def __init__(self, limits: Mapping[str, Mapping[str, float]], headroom: float = 0.9, background_reserve: float = 0.2):
+        self.headroom = headroom
+        self.background_reserve = background_reserve
+        self._models = {
+            model: _ModelLimits(limit["rpm"] * headroom, limit["tpm"] * headroom) for model, limit in limits.items()
+        }
+        self._condition = threading.Condition()
+        self._arrivals = itertools.count()
+        self._stats = {"requests": 0, "delayed": 0, "wait_seconds": 0.0, "rate_limited": 0}
+
+    def acquire(self, model: str, tokens: int, priority: Optional[int] = None) -> float:
+        """Block until the model's budgets admit a request of ``tokens``; returns the seconds waited."""
+        limits = self._models.get(model)
+        if limits is None:
+            return 0.0
+        if priority is None:
+            priority = current_priority()
+        ticket = (priority, next(self._arrivals))
+        started = time.monotonic()
+        with self._condition:
+            limits.waiting.append(ticket)
+            limits.waiting.sort()
+            try:
+                while True:
+                    now = time.monotonic()
+                    limits.requests.refill(now)
+                    limits.tokens.refill(now)
+                    delay = limits.paused_until - now
+                    if limits.waiting[0] == ticket:
+                        reserve = self.background_reserve if priority > INTERACTIVE else 0.0
+                        delay = max(
+                            delay,
+                            limits.requests.wait_time(1, reserve * limits.requests.capacity),
+                            limits.tokens.wait_time(tokens, reserve * limits.tokens.capacity),
+                        )
+                        if delay <= 0:
+                            limits.requests.take(1)
+                            limits.tokens.take(tokens)
+                            break
+                    # Woken when a request ahead is admitted or the budgets change
+                    self._condition.wait(delay if delay > 0 else None)
+            finally:
+                limits.waiting.remove(ticket)
+                self._condition.notify_all()
+            waited = time.monotonic() - started
+            self._stats["requests"] += 1
+            if waited > 0.001:
+                self._stats["delayed"] += 1
+                self._stats["wait_seconds"] += waited
+        return waited
+
+    def observe(self, model: str, status: int, headers: Mapping[str, str]) -> None:
+        """Align the model's budgets with the provider's rate-limit headers of a response."""
+        limits = self._models.get(model)
+        if limits is None:
+            return
+        now = time.monotonic()
+        with self._condition:
+            limits.requests.refill(now)
+            limits.tokens.refill(now)
+            for bucket, name in ((limits.requests, "requests"), (limits.tokens, "tokens")):
+                try:
+                    remaining = float(headers.get(f"x-ratelimit-remaining-{name}", ""))
+                except ValueError:
+                    continue
+                # Keep the same headroom below the provider's full limit
+                bucket.level = min(bucket.level, remaining - (bucket.capacity / self.headroom - bucket.capacity))
+            if status == 429:
+                self._stats["rate_limited"] += 1
+                limits.paused_until = max(limits.paused_until, now + retry_after(headers))
+            self._condition.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._condition:
+            return dict(self._stats)
+
+    def report(self) -> str:
+        stats = self.stats()
+        return (
+            f"LLM rate limiter: {stats['requests']} requests, {stats['delayed']} delayed "
+            f"({stats['wait_seconds']:.1f}s in total), {stats['rate_limited']} rejected by the provider"
+        )
@@ -0,0 +1,72 @@
+"""Lazily built agents, created from lightweight descriptors on first use."""
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import autogen
+
+
+class AgentRegistry:
+    """Holds agent descriptors and builds each agent the first time it is needed.
+
+    A descriptor is any object with a ``name`` and a ``create_agent()``
+    method, such as the researcher and specialist profiles; they are cheap to
+    keep around, while an ``AssistantAgent`` sets up an LLM client and copies
+    its configuration. Each session gets its own registry (agents hold their
+    conversation), so a built agent is reused for the rest of its session
+    only; a session never pays for the agents it is not routed to.
+    ``on_create`` is called once for each built agent (e.g. to add
+    capabilities).
+    """
+
+    def __init__(self, descriptors: Iterable[Any], on_create: Optional[Callable[[autogen.ConversableAgent], None]] = None):
+        self.descriptors: Dict[str, Any] = {descriptor.name: descriptor for descriptor in descriptors}
+        self.on_create = on_create
+        self._agents: Dict[str, autogen.ConversableAgent] = {}
+        self._lock = threading.Lock()
+
+    def names(self) -> List[str]:
+        """Names of all registered agents, in registration order."""
+        return list(self.descriptors)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.descriptors
+
+    def get(self, name: str) -> autogen.ConversableAgent:
+        """Return the named agent, building it on first use."""
+        agent = self._agents.get(name)
+        if agent is not None:
+            return agent
+        with self._lock:
+            agent = self._agents.get(name)
+            if agent is None:
+                agent = self.descriptors[name].create_agent()
+                if self.on_create is not None:
+                    self.on_create(agent)
+                self._agents[name] = agent
+        return agent
+
+    def built(self) -> List[autogen.ConversableAgent]:
+        """The agents built so far, in registration order."""
+        return [self._agents[name] for name in self.descriptors if name in self._agents]
+
+    def join(self, groupchat: autogen.GroupChat, manager: autogen.GroupChatManager, names: Iterable[str]) -> None:
+        """Add the named agents to a group chat, building them if needed.
+
+        An agent joining mid-chat is sent the messages it missed, as if it had
+        been in the chat from the start, and may speak after anyone.
+        """
+        for name in names:
+            if name in groupchat.agent_names:
+                continue
+            agent = self.get(name)
+            groupchat.agents.append(agent)
+            transitions = groupchat.allowed_speaker_transitions_dict
+            for speaker in groupchat.agents:
+                allowed = transitions.setdefault(speaker, [])
+                if agent not in allowed and (speaker is not agent or groupchat.allow_repeat_speaker):
+                    allowed.append(agent)
+            transitions[agent] = [
+                other for other in groupchat.agents if other is not agent or groupchat.allow_repeat_speaker
+            ]
+            for message in groupchat.messages:
+                manager.send(message, agent, request_reply=False, silent=True)
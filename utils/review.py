@@ -0,0 +1,60 @@
+"""Human Expert review helpers shared by the research and solution phases."""
+from typing import Dict, Iterable, List, Tuple
+
+import autogen
+
+
+def is_approved(verdict: str) -> bool:
+    """Return True when a review verdict approves the reviewed content."""
+    verdict = (verdict or "").strip().upper()
+    return "APPROVE" in verdict and not verdict.startswith("REWORK")
+
+
+def last_verdict(messages: List[Dict], reviewer_name: str) -> str:
+    """Return the reviewer's most recent message in a chat, or an empty string."""
+    for message in reversed(messages):
+        if message.get("name") == reviewer_name:
+            return message.get("content") or ""
+    return ""
+
+
+def replies_since_rework(messages: List[Dict], names: Iterable[str], reviewer_name: str) -> List[Tuple[str, str]]:
+    """Return (name, content) of the given agents' messages after the reviewer's last REWORK."""
+    names = set(names)
+    replies: List[Tuple[str, str]] = []
+    for message in messages:
+        name, content = message.get("name"), message.get("content") or ""
+        if name == reviewer_name and not is_approved(content):
+            replies = []
+        elif name in names and content:
+            replies.append((name, content))
+    return replies
+
+
+def pass_transcript(messages: List[Dict], reviewer_name: str) -> str:
+    """Return the non-empty messages since the reviewer's last turn, each under its sender's name.
+
+    A single message (e.g. content sent with :func:`request_review`) is
+    returned as is.
+    """
+    start = max((i for i, m in enumerate(messages) if m.get("name") == reviewer_name), default=-1) + 1
+    turns = [
+        (message.get("name") or "", message["content"].strip())
+        for message in messages[start:]
+        if isinstance(message.get("content"), str) and message["content"].strip()
+    ]
+    if len(turns) == 1:
+        return turns[0][1]
+    return "\n\n".join(f"{name}:\n{content}" if name else content for name, content in turns)
+
+
+def request_review(coordinator: autogen.ConversableAgent, reviewer: autogen.Agent, content: str) -> str:
+    """Show content to the reviewer and return their verdict (APPROVE or REWORK: ...)."""
+    result = coordinator.initiate_chat(
+        recipient=reviewer,
+        message=content,
+        max_turns=1,
+        clear_history=True,
+    )
+    replies = [m for m in result.chat_history if m.get("name") == reviewer.name]
+    return (replies[-1].get("content") or "") if replies else ""
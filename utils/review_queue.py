@@ -0,0 +1,263 @@
+"""Persistent queue of Human Expert reviews, worked through by experts asynchronously."""
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from .review import pass_transcript
+from .sessions import InputRequest, SessionChannel
+
+OPEN_STATUSES = ("pending", "claimed")
+
+
+class ReviewItem(NamedTuple):
+    id: int
+    session: str  # The session waiting for the verdict
+    sender: str  # The coordinator asking for the review
+    content: str  # The questions or solution to review
+    status: str  # "pending", "claimed", "decided", "withdrawn" or "expired"
+    reviewer: Optional[str]
+    verdict: Optional[str]  # APPROVE or REWORK: <feedback>
+    created_at: float
+    claimed_at: Optional[float]
+    decided_at: Optional[float]
+    expires_at: float
+
+
+class ReviewStateError(ValueError):
+    """The review item is not in a state that allows the operation (e.g. claimed by someone else)."""
+
+
+def is_verdict(verdict: str) -> bool:
+    """True for "APPROVE" and "REWORK: <feedback>" replies."""
+    return (verdict or "").strip().upper().startswith(("APPROVE", "REWORK"))
+
+
+class ReviewQueue:
+    """Questions and solutions waiting for a Human Expert, kept in SQLite.
+
+    Sessions :meth:`submit` an item and block in :meth:`wait` until it is
+    decided; experts :meth:`claim` the oldest pending item (or a given one),
+    then :meth:`decide` it or :meth:`release` it back to the queue. A claim
+    not decided within ``claim_timeout`` seconds can be claimed by another
+    expert. Items nobody decided before their session stopped waiting expire.
+    Verdicts given in this process wake the waiting session at once; the
+    queue file can also be shared with other processes, whose verdicts are
+    picked up every ``poll_interval`` seconds.
+    """
+
+    def __init__(self, path: str, claim_timeout: float, poll_interval: float = 1.0):
+        self.path = path
+        self.claim_timeout = claim_timeout
+        self.poll_interval = poll_interval
+        self._local = threading.local()
+        self._decided = threading.Condition()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        connection = self._connection()
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS reviews (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                session TEXT NOT NULL,
+                sender TEXT NOT NULL,
+                content TEXT NOT NULL,
+                status TEXT NOT NULL,
+                reviewer TEXT,
+                verdict TEXT,
+                created_at REAL NOT NULL,
+                claimed_at REAL,
+                decided_at REAL,
+                expires_at REAL NOT NULL
+            )
+            """
+        )
+        connection.execute("CREATE INDEX IF NOT EXISTS reviews_status ON reviews (status, id)")
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            self._local.connection = connection
+        return connection
+
+    def _expire(self, connection: sqlite3.Connection, now: float) -> None:
+        connection.execute(
+            "UPDATE reviews SET status = 'expired' WHERE status IN ('pending', 'claimed') AND expires_at <= ?", (now,)
+        )
+
+    def submit(self, session: str, sender: str, content: str, timeout: float) -> ReviewItem:
+        """Queue content for review; it expires if undecided after ``timeout`` seconds."""
+        now = time.time()
+        cursor = self._connection().execute(
+            "INSERT INTO reviews (session, sender, content, status, created_at, expires_at) VALUES (?, ?, ?, 'pending', ?, ?)",
+            (session, sender, content, now, now + timeout),
+        )
+        return self.get(cursor.lastrowid)
+
+    def get(self, item_id: int) -> Optional[ReviewItem]:
+        row = self._connection().execute("SELECT * FROM reviews WHERE id = ?", (item_id,)).fetchone()
+        return ReviewItem(*row) if row else None
+
+    def items(self, status: Optional[str] = None, limit: int = 100) -> List[ReviewItem]:
+        """Items oldest first, optionally only those with the given status."""
+        connection = self._connection()
+        self._expire(connection, time.time())
+        if status is None:
+            rows = connection.execute("SELECT * FROM reviews ORDER BY id LIMIT ?", (limit,))
+        else:
+            rows = connection.execute("SELECT * FROM reviews WHERE status = ? ORDER BY id LIMIT ?", (status, limit))
+        return [ReviewItem(*row) for row in rows]
+
+    def claim(self, reviewer: str, item_id: Optional[int] = None) -> Optional[ReviewItem]:
+        """Assign the oldest claimable item (or the given one) to a reviewer; None if there is none."""
+        now = time.time()
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            self._expire(connection, now)
+            claimable = "(status = 'pending' OR (status = 'claimed' AND (claimed_at <= ? OR reviewer = ?)))"
+            if item_id is None:
+                row = connection.execute(
+                    f"SELECT id FROM reviews WHERE {claimable} ORDER BY id LIMIT 1", (now - self.claim_timeout, reviewer)
+                ).fetchone()
+            else:
+                row = connection.execute(
+                    f"SELECT id FROM reviews WHERE id = ? AND {claimable}", (item_id, now - self.claim_timeout, reviewer)
+                ).fetchone()
+            if row is not None:
+                connection.execute(
+                    "UPDATE reviews SET status = 'claimed', reviewer = ?, claimed_at = ? WHERE id = ?",
+                    (reviewer, now, row[0]),
+                )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return self.get(row[0]) if row is not None else None
+
+    def _update_open(self, item_id: int, reviewer: str, assignments: str, values: tuple) -> ReviewItem:
+        """Apply an update to an open item that is unclaimed or claimed by ``reviewer``."""
+        now = time.time()
+        connection = self._connection()
+        self._expire(connection, now)
+        cursor = connection.execute(
+            f"UPDATE reviews SET {assignments} WHERE id = ? AND "
+            "(status = 'pending' OR (status = 'claimed' AND (reviewer = ? OR claimed_at <= ?)))",
+            values + (item_id, reviewer, now - self.claim_timeout),
+        )
+        item = self.get(item_id)
+        if item is None:
+            raise KeyError(item_id)
+        if not cursor.rowcount:
+            owner = f" by {item.reviewer}" if item.status == "claimed" else ""
+            raise ReviewStateError(f"Review {item_id} is {item.status}{owner}")
+        return item
+
+    def decide(self, item_id: int, reviewer: str, verdict: str) -> ReviewItem:
+        """Record a reviewer's verdict and wake the waiting session."""
+        if not is_verdict(verdict):
+            raise ValueError('A verdict is "APPROVE" or "REWORK: <feedback>"')
+        item = self._update_open(
+            item_id,
+            reviewer,
+            "status = 'decided', reviewer = ?, verdict = ?, decided_at = ?",
+            (reviewer, verdict.strip(), time.time()),
+        )
+        with self._decided:
+            self._decided.notify_all()
+        return item
+
+    def release(self, item_id: int, reviewer: str) -> ReviewItem:
+        """Give a claimed item back to the queue undecided."""
+        return self._update_open(item_id, reviewer, "status = 'pending', reviewer = NULL, claimed_at = NULL", ())
+
+    def withdraw(self, item_id: int) -> None:
+        """Take an undecided item off the queue, e.g. when its session ended."""
+        self._connection().execute(
+            "UPDATE reviews SET status = 'withdrawn' WHERE id = ? AND status IN ('pending', 'claimed')", (item_id,)
+        )
+
+    def wait(self, item_id: int, cancelled: Callable[[], bool] = lambda: False) -> Optional[str]:
+        """Block until the item is decided and return the verdict; None once it expires, is withdrawn or ``cancelled()``."""
+        while True:
+            item = self.get(item_id)
+            if item is None or item.status not in OPEN_STATUSES:
+                return item.verdict if item is not None and item.status == "decided" else None
+            if cancelled():
+                self.withdraw(item_id)
+                return None
+            if item.expires_at <= time.time():
+                self._connection().execute(
+                    "UPDATE reviews SET status = 'expired' WHERE id = ? AND status IN ('pending', 'claimed')", (item_id,)
+                )
+                continue
+            with self._decided:
+                self._decided.wait(min(self.poll_interval, max(item.expires_at - time.time(), 0)))
+
+
+class ReviewChannel(SessionChannel):
+    """Session channel whose reviewer requests go to a :class:`ReviewQueue`.
+
+    Input requests of the agent named ``reviewer_name`` are submitted as
+    review items for session ``session_id``, with every contribution since
+    the reviewer's last turn (all researchers' questions, all proposed
+    solutions) as the content, and the session thread waits for the verdict
+    (at most ``review_timeout`` seconds, then the reply is "exit"); every
+    other request is answered by the session's client as usual. While a
+    verdict is outstanding the session is not waiting for its client, and
+    its state shows the item under ``review``.
+
+    Only the review items are persistent: the session itself lives in the
+    thread blocked here, so its pending reviews expire if the process stops
+    and the session cannot be resumed from the queue.
+    """
+
+    def __init__(
+        self,
+        reviews: ReviewQueue,
+        session_id: str,
+        reviewer_name: str,
+        review_timeout: float,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        idle_timeout: Optional[float] = None,
+        max_tokens: int = 20_000,
+    ):
+        super().__init__(loop, idle_timeout=idle_timeout, max_tokens=max_tokens)
+        self.reviews = reviews
+        self.session_id = session_id
+        self.reviewer_name = reviewer_name
+        self.review_timeout = review_timeout
+        self.review_id: Optional[int] = None
+
+    def request(self, agent: str, messages: List[Dict], prompt: str) -> InputRequest:
+        request = super().request(agent, messages, prompt)
+        if agent != self.reviewer_name:
+            return request
+        return request._replace(message=pass_transcript(messages, self.reviewer_name))
+
+    def ask(self, request: InputRequest) -> str:
+        if request.agent != self.reviewer_name:
+            return super().ask(request)
+        if self._cancelled:
+            return "exit"
+        item = self.reviews.submit(self.session_id, request.sender, request.message, self.review_timeout)
+        self.review_id = item.id
+        self._notify()
+        try:
+            verdict = self.reviews.wait(item.id, cancelled=lambda: self._cancelled)
+        finally:
+            self.review_id = None
+            self._notify()
+        return verdict if verdict is not None else "exit"
+
+    def state(self) -> Dict[str, Any]:
+        state = super().state()
+        review_id = self.review_id
+        item = self.reviews.get(review_id) if review_id is not None else None
+        state["review"] = {"id": item.id, "status": item.status, "reviewer": item.reviewer} if item else None
+        return state
@@ -0,0 +1,180 @@
+"""Local routing of problems to AWS service agents without an LLM call."""
+import math
+from collections import Counter, defaultdict
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import autogen
+
+from .text import tokenize
+
+# Relative weight of each researcher field when building a service profile.
+SERVICE_AREA_WEIGHT = 3.0
+EXPERTISE_WEIGHT = 1.5
+DESCRIPTION_WEIGHT = 1.0
+
+# Vendor and brand words in service names ("Amazon EC2", "AWS Lambda"); they name no particular service
+VENDOR_TERMS = frozenset({"aws", "amazon"})
+
+
+def service_key(agent_name: str) -> str:
+    """Map an agent name such as "EKS_Researcher" to its service key "EKS"."""
+    return agent_name.rsplit("_", 1)[0]
+
+
+class ServiceRouter:
+    """Scores researchers against a problem using their expertise and description.
+
+    Every researcher is turned into a weighted bag of words built from its
+    service area, expertise list and description. Words shared by every
+    researcher (such as "AWS" or "specialist") carry no signal, so each word
+    is additionally weighted by its inverse document frequency.
+    """
+
+    def __init__(self, researchers: List):
+        self.profiles: Dict[str, Dict[str, float]] = {}
+        for researcher in researchers:
+            profile = defaultdict(float)
+            fields = [
+                (getattr(researcher, "service_area", ""), SERVICE_AREA_WEIGHT),
+                (" ".join(researcher.expertise), EXPERTISE_WEIGHT),
+                (researcher.description, DESCRIPTION_WEIGHT),
+            ]
+            for text, weight in fields:
+                for token in set(tokenize(text)):
+                    profile[token] = max(profile[token], weight)
+            self.profiles[researcher.name] = dict(profile)
+
+        document_frequency = Counter(token for profile in self.profiles.values() for token in profile)
+        total = len(self.profiles)
+        self.idf = {token: math.log(total / count) for token, count in document_frequency.items()}
+
+    def service_terms(self) -> List[str]:
+        """Return the distinctive words of the researchers' service areas (e.g. "lambda", "vpc").
+
+        Vendor words and words found in more than one service area (such as
+        "amazon" in most of them) are left out: they do not name a service.
+        """
+        areas = Counter(
+            token
+            for profile in self.profiles.values()
+            for token, weight in profile.items()
+            if weight == SERVICE_AREA_WEIGHT
+        )
+        return sorted(token for token, count in areas.items() if count == 1 and token not in VENDOR_TERMS)
+
+    def score(self, text: str) -> Dict[str, float]:
+        """Score every researcher against the given text."""
+        tokens = set(tokenize(text))
+        return {
+            name: sum(weight * self.idf[token] for token, weight in profile.items() if token in tokens)
+            for name, profile in self.profiles.items()
+        }
+
+    def rank(self, text: str) -> List[Tuple[str, float]]:
+        """Return researchers with a positive score, best match first."""
+        scores = self.score(text)
+        ranked = [(name, score) for name, score in scores.items() if score > 0]
+        return sorted(ranked, key=lambda item: item[1], reverse=True)
+
+    def route(self, text: str, threshold: float, max_agents: Optional[int] = None) -> List[str]:
+        """Return the names of researchers scoring at or above the threshold."""
+        names = [name for name, score in self.rank(text) if score >= threshold]
+        return names[:max_agents] if max_agents else names
+
+
+class RouterSpeakerSelector:
+    """Custom ``speaker_selection_method`` for the researcher GroupChat.
+
+    Routed researchers speak once each, best match first, then the reviewer
+    is asked to approve. A REWORK from the reviewer starts a new pass with the
+    feedback folded into the routing text, and an approval ends the chat.
+    When no researcher reaches the confidence threshold, the selection is
+    handed to autogen's LLM-based selector (``fallback``).
+
+    With ``join`` set, researchers are added to the chat only when they are
+    routed to (all of them before falling back to the LLM selector), see
+    ``AgentRegistry.join``.
+    """
+
+    def __init__(
+        self,
+        router: ServiceRouter,
+        reviewer_name: str,
+        threshold: float,
+        max_speakers: int,
+        fallback: str = "auto",
+        join: Optional[Callable[[autogen.GroupChat, List[str]], None]] = None,
+    ):
+        self.router = router
+        self.reviewer_name = reviewer_name
+        self.threshold = threshold
+        self.max_speakers = max_speakers
+        self.fallback = fallback
+        self.join = join
+
+    def _fall_back(self, groupchat: autogen.GroupChat) -> str:
+        if self.join is not None:
+            self.join(groupchat, list(self.router.profiles))
+        return self.fallback
+
+    def __call__(self, last_speaker: autogen.Agent, groupchat: autogen.GroupChat) -> Union[autogen.Agent, str, None]:
+        messages = groupchat.messages
+        if not messages:
+            return self._fall_back(groupchat)
+
+        last_content = messages[-1].get("content") or ""
+        if last_speaker.name == self.reviewer_name and "REWORK" not in last_content.upper():
+            # The reviewer approved (or had nothing to add): the chat is done.
+            return None
+
+        reviews = [m.get("content") or "" for m in messages if m.get("name") == self.reviewer_name]
+        routing_text = "\n".join([messages[0].get("content") or ""] + reviews)
+        candidates = self.router.route(routing_text, self.threshold, self.max_speakers)
+        if self.join is not None:
+            self.join(groupchat, candidates)
+        candidates = [name for name in candidates if name in groupchat.agent_names]
+        if not candidates:
+            return self._fall_back(groupchat)
+
+        # Only speakers since the last review count towards the current pass.
+        spoken = set()
+        for message in reversed(messages):
+            if message.get("name") == self.reviewer_name:
+                break
+            spoken.add(message.get("name"))
+
+        for name in candidates:
+            if name not in spoken:
+                return groupchat.agent_by_name(name)
+        return groupchat.agent_by_name(self.reviewer_name)
+
+
+class RoutedAutoSelector:
+    """``speaker_selection_method`` that leaves the choice to the LLM among routed agents.
+
+    Before each selection the agents (e.g. specialists) whose service the
+    router matches to the task are joined to the chat, or all of them when
+    none matches confidently; autogen's ``"auto"`` selector then picks among
+    the agents present.
+    """
+
+    def __init__(
+        self,
+        router: ServiceRouter,
+        names: List[str],
+        join: Callable[[autogen.GroupChat, List[str]], None],
+        threshold: float,
+        max_agents: int,
+    ):
+        self.router = router
+        self.by_service = {service_key(name): name for name in names}
+        self.join = join
+        self.threshold = threshold
+        self.max_agents = max_agents
+
+    def __call__(self, last_speaker: autogen.Agent, groupchat: autogen.GroupChat) -> str:
+        task = (groupchat.messages[0].get("content") or "") if groupchat.messages else ""
+        routed = [service_key(name) for name in self.router.route(task, self.threshold, self.max_agents)]
+        names = [self.by_service[key] for key in routed if key in self.by_service]
+        self.join(groupchat, names or list(self.by_service.values()))
+        return "auto"
@@ -0,0 +1,209 @@
+"""Message-driven human input and output capture for sessions run without a terminal."""
+import asyncio
+import queue
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, NamedTuple, Optional
+
+import autogen
+
+
+class TokenEvent(NamedTuple):
+    seq: int  # Position in the session's token stream, from 1
+    agent: str  # The agent generating the text, e.g. a specialist
+    text: str
+
+
+class InputRequest(NamedTuple):
+    agent: str  # The agent waiting for input, e.g. the user proxy or the Human Expert
+    sender: str  # The agent whose message is to be answered
+    message: str  # The message to answer: questions, a solution to review, ...
+    prompt: str  # autogen's console prompt, for reference
+
+
+class SessionIO:
+    """autogen ``IOStream`` for a session without a terminal.
+
+    Printed output is kept as the session transcript (the last
+    ``max_chunks`` writes). Agents that are not bound to a
+    :class:`SessionChannel` (group chat managers, researchers and specialists
+    asking whether to continue) get an empty reply, as if Enter was pressed.
+    """
+
+    def __init__(self, max_chunks: int = 5_000):
+        self._chunks = deque(maxlen=max_chunks)
+        self._lock = threading.Lock()
+
+    def print(self, *objects: Any, sep: str = " ", end: str = "\n", flush: bool = False) -> None:
+        with self._lock:
+            self._chunks.append(sep.join(str(o) for o in objects) + end)
+
+    def input(self, prompt: str = "", *, password: bool = False) -> str:
+        return ""
+
+    def transcript(self) -> str:
+        with self._lock:
+            return "".join(self._chunks)
+
+
+class SessionChannel:
+    """Passes a session's human input requests out and the replies back in.
+
+    The session runs its (blocking) autogen chats in its own thread; agents
+    bound with :meth:`bind` ask for input through :meth:`ask`, which blocks
+    that thread until :meth:`answer` is called from elsewhere, e.g. an HTTP
+    handler. A session holds at most one pending request at a time. Without
+    an answer within ``idle_timeout`` seconds the reply is "exit", which ends
+    the current chat. Coroutines on ``loop`` can wait for the next request or
+    the end of the session with :meth:`wait`.
+
+    Tokens of streamed completions are published with :meth:`publish` (the
+    last ``max_tokens`` are kept) and read with :meth:`tokens` and
+    :meth:`wait_tokens`, so a client can show a solution while it is written.
+    """
+
+    def __init__(
+        self,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        idle_timeout: Optional[float] = None,
+        max_tokens: int = 20_000,
+    ):
+        self.loop = loop
+        self.idle_timeout = idle_timeout
+        self.status = "running"
+        self.pending: Optional[InputRequest] = None
+        self.result: Optional[List[Dict]] = None
+        self.error: Optional[str] = None
+        self._replies: "queue.Queue[str]" = queue.Queue()
+        self._cancelled = False
+        self._lock = threading.Lock()
+        self._waiters: List[asyncio.Future] = []
+        self._tokens: Deque[TokenEvent] = deque(maxlen=max_tokens)
+        self._token_seq = 0
+
+    def start(self) -> None:
+        """Mark a session that was queued for a worker (``status`` "queued") as running (session thread)."""
+        with self._lock:
+            self.status = "running"
+        self._notify()
+
+    def bind(self, agent: autogen.ConversableAgent) -> None:
+        """Route the agent's human input through this channel instead of stdin."""
+        last: Dict[str, List[Dict]] = {}
+
+        def remember(messages: List[Dict]) -> List[Dict]:
+            last["messages"] = messages
+            return messages
+
+        def get_human_input(prompt: str) -> str:
+            return self.ask(self.request(agent.name, last.get("messages", []), prompt))
+
+        agent.register_hook("process_all_messages_before_reply", remember)
+        agent.get_human_input = get_human_input
+
+    def request(self, agent: str, messages: List[Dict], prompt: str) -> InputRequest:
+        """The input request of an agent about to reply to ``messages``: the last message is the one to answer."""
+        message = messages[-1] if messages else {}
+        content = message.get("content")
+        return InputRequest(agent, message.get("name") or "", content if isinstance(content, str) else "", prompt)
+
+    def ask(self, request: InputRequest) -> str:
+        """Publish an input request and block until it is answered (session thread)."""
+        with self._lock:
+            if self._cancelled:
+                return "exit"
+            self.pending = request
+        self._notify()
+        try:
+            reply = self._replies.get(timeout=self.idle_timeout)
+        except queue.Empty:
+            reply = "exit"
+        with self._lock:
+            self.pending = None
+        return reply
+
+    def answer(self, agent: str, content: str) -> bool:
+        """Answer the pending request if it is the given agent's; False otherwise."""
+        with self._lock:
+            if self.pending is None or self.pending.agent != agent:
+                return False
+            self.pending = None
+            self._replies.put(content)
+        return True
+
+    def cancel(self) -> None:
+        """End the session: the pending request and all later ones are answered with "exit"."""
+        with self._lock:
+            self._cancelled = True
+            if self.pending is not None:
+                self.pending = None
+                self._replies.put("exit")
+
+    def finish(self, result: Optional[List[Dict]] = None, error: Optional[str] = None) -> None:
+        """Record the outcome of the session (session thread)."""
+        with self._lock:
+            self.status = "failed" if error is not None else "done"
+            self.result = result
+            self.error = error
+        self._notify()
+
+    def publish(self, agent: str, text: str) -> None:
+        """Append a streamed chunk of an agent's reply (any thread)."""
+        with self._lock:
+            self._token_seq += 1
+            self._tokens.append(TokenEvent(self._token_seq, agent, text))
+        self._notify()
+
+    def tokens(self, after: int = 0) -> List[TokenEvent]:
+        """Streamed chunks published after position ``after``, oldest first."""
+        with self._lock:
+            if after >= self._token_seq:
+                return []
+            return [event for event in self._tokens if event.seq > after]
+
+    def waiting(self) -> bool:
+        """True when the session needs input or has ended."""
+        return self.status not in ("queued", "running") or self.pending is not None
+
+    def state(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "status": self.status,
+                "pending": self.pending._asdict() if self.pending is not None else None,
+                "result": self.result,
+                "error": self.error,
+                "stream_position": self._token_seq,
+            }
+
+    def _notify(self) -> None:
+        if self.loop is not None and not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self._wake)
+
+    def _wake(self) -> None:
+        waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def _wait_until(self, ready: Callable[[], bool], timeout: float) -> bool:
+        deadline = self.loop.time() + timeout
+        while not ready():
+            remaining = deadline - self.loop.time()
+            if remaining <= 0:
+                break
+            waiter = self.loop.create_future()
+            self._waiters.append(waiter)
+            try:
+                await asyncio.wait_for(waiter, remaining)
+            except asyncio.TimeoutError:
+                break
+        return ready()
+
+    async def wait(self, timeout: float) -> bool:
+        """Wait until the session needs input or has ended; returns ``waiting()``."""
+        return await self._wait_until(self.waiting, timeout)
+
+    async def wait_tokens(self, after: int, timeout: float) -> List[TokenEvent]:
+        """Wait for chunks after position ``after`` and return them; none if the session needs input or has ended first."""
+        await self._wait_until(lambda: self._token_seq > after or self.waiting(), timeout)
+        return self.tokens(after)
@@ -0,0 +1,60 @@
+"""Coalescing of identical concurrent calls into one."""
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Runs one call per key at a time; identical calls made meanwhile wait for it and share its result.
+
+    Unlike a cache, nothing is kept once the call returns: the next call
+    with the key runs again. If the call raises, every caller waiting for
+    it gets the same error.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._stats = {"calls": 0, "shared": 0}
+
+    def do(self, key: Hashable, call: Callable[[], T]) -> Tuple[T, bool]:
+        """Return the result of ``call`` (or of the identical call in flight) and whether it was shared."""
+        with self._lock:
+            self._stats["calls"] += 1
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            else:
+                self._stats["shared"] += 1
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value, True
+        try:
+            flight.value = call()
+        except BaseException as error:
+            flight.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.value, False
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self._stats, "in_flight": len(self._flights)}
+
+    def report(self) -> str:
+        stats = self.stats()
+        return f"LLM single-flight: {stats['calls']} requests, {stats['shared']} shared an identical request in flight"
@@ -0,0 +1,132 @@
+"""Store of Human Expert approved solutions for repeat tickets."""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import autogen
+
+from .text import normalize_text
+
+
+def prompt_fingerprint(system_message: str) -> str:
+    """Content hash of an agent's system message."""
+    return hashlib.sha256((system_message or "").encode("utf-8")).hexdigest()
+
+
+class StoredSolution(NamedTuple):
+    key: str
+    solution: str
+    created_at: float
+
+    def with_provenance(self) -> str:
+        """The solution prefixed with a marker saying where it came from."""
+        approved = datetime.fromtimestamp(self.created_at, tz=timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+        return f"[Approved solution reused from {approved}, ref {self.key[:12]}]\n\n{self.solution}"
+
+
+class SolutionStore:
+    """Keeps approved specialist solutions keyed by problem and the user's answers.
+
+    The key is a hash of the normalized problem statement and the user's
+    numbered answers, so a repeat ticket is answered straight from the store.
+    An entry is stale once it is older than ``max_age`` seconds or when the
+    system message of any specialist that contributed to it has changed since
+    it was stored; stale entries are deleted on lookup.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        fingerprints: Dict[str, str],
+        ticket: Callable[[], Tuple[str, str]],
+        max_age: Optional[float] = None,
+    ):
+        self.path = path
+        self.fingerprints = fingerprints
+        self.ticket = ticket
+        self.max_age = max_age
+        self._local = threading.local()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection().execute(
+            """
+            CREATE TABLE IF NOT EXISTS solutions (
+                key TEXT PRIMARY KEY,
+                solution TEXT NOT NULL,
+                fingerprints TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            self._local.connection = connection
+        return connection
+
+    @staticmethod
+    def key(problem: str, answers: str) -> str:
+        """Hash of the normalized problem and answers."""
+        text = f"{normalize_text(problem)}\n{normalize_text(answers)}"
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def get(self, problem: str, answers: str) -> Optional[StoredSolution]:
+        """Return the stored solution for a ticket unless it is missing or stale."""
+        key = self.key(problem, answers)
+        connection = self._connection()
+        row = connection.execute(
+            "SELECT solution, fingerprints, created_at FROM solutions WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        solution, fingerprints, created_at = row
+        expired = self.max_age is not None and time.time() - created_at > self.max_age
+        changed = any(self.fingerprints.get(name) != value for name, value in json.loads(fingerprints).items())
+        if expired or changed:
+            connection.execute("DELETE FROM solutions WHERE key = ?", (key,))
+            return None
+        return StoredSolution(key, solution, created_at)
+
+    def put(self, problem: str, answers: str, solution: str, specialists: Optional[Iterable[str]] = None) -> None:
+        """Store an approved solution with the prompt fingerprints of its specialists.
+
+        Without a list of contributing specialists, every specialist's
+        fingerprint is recorded, so any prompt change invalidates the entry.
+        """
+        names = list(specialists) if specialists else list(self.fingerprints)
+        fingerprints = {name: self.fingerprints[name] for name in names if name in self.fingerprints}
+        self._connection().execute(
+            "INSERT OR REPLACE INTO solutions (key, solution, fingerprints, created_at) VALUES (?, ?, ?, ?)",
+            (self.key(problem, answers), solution, json.dumps(fingerprints), time.time()),
+        )
+
+    def remember(self, solution: str, specialists: Optional[List[str]] = None) -> None:
+        """Store an approved solution for the current ticket."""
+        problem, answers = self.ticket()
+        if problem:
+            self.put(problem, answers, solution, specialists)
+
+    def generate_reply(
+        self,
+        recipient: autogen.ConversableAgent,
+        messages: Optional[List[Dict]] = None,
+        sender: Optional[autogen.Agent] = None,
+        config: Optional[object] = None,
+    ) -> Tuple[bool, Optional[str]]:
+        """Reply function for the Solution Coordinator, checked before the specialists run."""
+        problem, answers = self.ticket()
+        if not problem:
+            return False, None
+        stored = self.get(problem, answers)
+        if stored is None:
+            return False, None
+        return True, stored.with_provenance()
@@ -0,0 +1,269 @@
+"""Structured specialist solutions: validation, local aggregation and rendering."""
+import json
+import logging
+import re
+from typing import Callable, Dict, List, NamedTuple, Sequence, Tuple
+
+import autogen
+
+from .review import replies_since_rework
+from .router import ServiceRouter, service_key
+from .text import cosine_similarity, normalize_text, tfidf_vectors, tokenize
+
+LEVELS = ("Low", "Medium", "High")
+CONSIDERATIONS = ("complexity", "cost", "scalability", "maintenance")
+NO_VIABLE_SOLUTION = "No viable solution available for the given requirements."
+
+logger = logging.getLogger(__name__)
+
+# The outermost JSON object of a reply, also when it is wrapped in a ```json fence
+_JSON_OBJECT = re.compile(r"\{.*\}", re.DOTALL)
+
+
+class SchemaError(ValueError):
+    """A specialist reply that does not match the solution schema."""
+
+
+class ImplementationBlock(NamedTuple):
+    language: str
+    code: str
+
+
+class Solution(NamedTuple):
+    specialist: str
+    name: str
+    description: str
+    implementation: Tuple[ImplementationBlock, ...]
+    best_practices: Tuple[str, ...]
+    considerations: Dict[str, str]
+
+    def text(self) -> str:
+        """The prose of the solution, used for relevance and duplicate detection."""
+        return "\n".join([self.name, self.description, *self.best_practices])
+
+    def effort(self) -> int:
+        """Lower is easier: complexity, cost and maintenance levels minus scalability."""
+        level = {name: LEVELS.index(value) for name, value in self.considerations.items()}
+        return level["complexity"] + level["cost"] + level["maintenance"] - level["scalability"]
+
+
+class Conflict(NamedTuple):
+    """Two solutions for the same part of the problem that disagree; the higher-ranked one is kept."""
+
+    kept: Solution
+    dropped: Solution
+    differences: Tuple[str, ...]
+
+
+def disagreements(first: Solution, second: Solution) -> Tuple[str, ...]:
+    """How two solutions on the same topic disagree: different code, or opposite consideration levels."""
+    differences = []
+    code = [normalize_text(block.code) for block in first.implementation]
+    other_code = [normalize_text(block.code) for block in second.implementation]
+    if code and other_code and code != other_code:
+        differences.append("different implementation")
+    for name in CONSIDERATIONS:
+        levels = (first.considerations[name], second.considerations[name])
+        if abs(LEVELS.index(levels[0]) - LEVELS.index(levels[1])) > 1:
+            differences.append(f"{name} {levels[0]} vs {levels[1]}")
+    return tuple(differences)
+
+
+def _string(value: object, path: str) -> str:
+    if not isinstance(value, str) or not value.strip():
+        raise SchemaError(f"{path} must be a non-empty string")
+    return value.strip()
+
+
+def _list(value: object, path: str) -> list:
+    if not isinstance(value, list):
+        raise SchemaError(f"{path} must be a list")
+    return value
+
+
+def validate_solution(data: object, specialist: str, path: str = "solution") -> Solution:
+    """Check one solution object against the schema and return it as a Solution."""
+    if not isinstance(data, dict):
+        raise SchemaError(f"{path} must be an object")
+    blocks = []
+    for i, block in enumerate(_list(data.get("implementation", []), f"{path}.implementation")):
+        if not isinstance(block, dict):
+            raise SchemaError(f"{path}.implementation[{i}] must be an object")
+        language = block.get("language") or ""
+        if not isinstance(language, str):
+            raise SchemaError(f"{path}.implementation[{i}].language must be a string")
+        blocks.append(ImplementationBlock(language.strip(), _string(block.get("code"), f"{path}.implementation[{i}].code")))
+    practices = tuple(
+        _string(practice, f"{path}.best_practices[{i}]")
+        for i, practice in enumerate(_list(data.get("best_practices", []), f"{path}.best_practices"))
+    )
+    considerations = data.get("considerations")
+    if not isinstance(considerations, dict):
+        raise SchemaError(f"{path}.considerations must be an object")
+    levels = {}
+    for name in CONSIDERATIONS:
+        value = considerations.get(name)
+        level = value.strip().capitalize() if isinstance(value, str) else None
+        if level not in LEVELS:
+            raise SchemaError(f"{path}.considerations.{name} must be one of {', '.join(LEVELS)}")
+        levels[name] = level
+    return Solution(
+        specialist=specialist,
+        name=_string(data.get("name"), f"{path}.name"),
+        description=_string(data.get("description"), f"{path}.description"),
+        implementation=tuple(blocks),
+        best_practices=practices,
+        considerations=levels,
+    )
+
+
+def parse_reply(specialist: str, reply: str) -> List[Solution]:
+    """Parse and validate a specialist's JSON reply; raises SchemaError if it is invalid."""
+    match = _JSON_OBJECT.search(reply or "")
+    if match is None:
+        raise SchemaError("reply contains no JSON object")
+    try:
+        data = json.loads(match.group())
+    except ValueError as e:
+        raise SchemaError(f"reply is not valid JSON: {e}") from e
+    if not isinstance(data, dict):
+        raise SchemaError("reply must be a JSON object")
+    solutions = _list(data.get("solutions"), "solutions")
+    return [validate_solution(item, specialist, f"solutions[{i}]") for i, item in enumerate(solutions)]
+
+
+def render_solutions(
+    solutions: List[Solution], unstructured: List[Tuple[str, str]] = (), conflicts: Sequence[Conflict] = ()
+) -> str:
+    """Render solutions as markdown in the specialists' original text layout.
+
+    Conflicts are listed after the solutions, so the reviewer sees which
+    proposals were set aside in favour of which solution.
+    """
+    sections = []
+    for number, solution in enumerate(solutions, 1):
+        lines = [
+            f"Solution {number}: {solution.name}",
+            f"Proposed by: {solution.specialist}",
+            f"Description: {solution.description}",
+        ]
+        if solution.implementation:
+            lines.append("Implementation:")
+            for block in solution.implementation:
+                lines.extend([f"```{block.language}", block.code.rstrip(), "```"])
+        if solution.best_practices:
+            lines.append("Best Practices:")
+            lines.extend(f"- {practice}" for practice in solution.best_practices)
+        lines.append("Considerations:")
+        lines.extend(f"- {name.capitalize()}: {solution.considerations[name]}" for name in CONSIDERATIONS)
+        sections.append("\n".join(lines))
+    if conflicts:
+        numbers = {id(solution): number for number, solution in enumerate(solutions, 1)}
+        lines = ["Conflicting proposals (set aside):"]
+        for conflict in conflicts:
+            lines.append(
+                f"- {conflict.dropped.name} ({conflict.dropped.specialist}) disagrees with "
+                f"Solution {numbers[id(conflict.kept)]}: {', '.join(conflict.differences)}"
+            )
+        sections.append("\n".join(lines))
+    for name, reply in unstructured:
+        sections.append(f"Additional input from {name}:\n{reply.strip()}")
+    return "\n\n".join(sections) if sections else NO_VIABLE_SOLUTION
+
+
+class SolutionAggregator:
+    """Local replacement for the LLM call that aggregated the specialists' solutions.
+
+    Each reply is validated against the solution schema. Solutions are ranked
+    by their TF-IDF relevance to the ticket plus how strongly the router
+    associates the ticket with the specialist's service, with lower effort
+    (complexity, cost, maintenance) breaking ties. Solutions relevant by
+    neither measure are dropped. A solution on the same topic as a
+    higher-ranked one (cosine at or above ``similarity``, or identical code)
+    is dropped, so the most relevant specialist's version wins. If the two
+    disagree, i.e. their code differs or a consideration is Low in one and
+    High in the other, the dropped one is listed as a conflict under the
+    solutions rather than silently discarded as a duplicate. Replies that
+    fail validation are kept verbatim after the solutions.
+    """
+
+    def __init__(self, router: ServiceRouter, ticket: Callable[[], Tuple[str, str]], similarity: float = 0.6):
+        self.router = router
+        self.ticket = ticket
+        self.similarity = similarity
+
+    def rank(self, problem: str, solutions: List[Solution]) -> List[Solution]:
+        """Order solutions best first and drop those unrelated to the problem."""
+        if not solutions:
+            return []
+        vectors = tfidf_vectors([tokenize(problem)] + [tokenize(solution.text()) for solution in solutions])
+        query = vectors[0]
+        service_scores = {service_key(name): score for name, score in self.router.score(problem).items()}
+        top = max(service_scores.values(), default=0.0) or 1.0
+        scored = []
+        for i, (solution, vector) in enumerate(zip(solutions, vectors[1:])):
+            relevance = cosine_similarity(query, vector)
+            affinity = service_scores.get(service_key(solution.specialist), 0.0) / top
+            scored.append((relevance + 0.5 * affinity, relevance > 0 or affinity > 0, i, solution))
+        relevant = [item for item in scored if item[1]] or scored
+        relevant.sort(key=lambda item: (-item[0], item[3].effort(), item[2]))
+        return [solution for *_, solution in relevant]
+
+    def resolve(self, solutions: List[Solution]) -> Tuple[List[Solution], List[Conflict]]:
+        """Keep the first of each group of solutions on the same topic; return them and the conflicts."""
+        vectors = tfidf_vectors([tokenize(solution.text()) for solution in solutions])
+        kept: List[int] = []
+        conflicts: List[Conflict] = []
+        for i, solution in enumerate(solutions):
+            code = [normalize_text(block.code) for block in solution.implementation]
+            match = next(
+                (
+                    j
+                    for j in kept
+                    if cosine_similarity(vectors[i], vectors[j]) >= self.similarity
+                    or (code and code == [normalize_text(block.code) for block in solutions[j].implementation])
+                ),
+                None,
+            )
+            if match is None:
+                kept.append(i)
+                continue
+            differences = disagreements(solutions[match], solution)
+            if differences:
+                conflicts.append(Conflict(solutions[match], solution, differences))
+        return [solutions[i] for i in kept], conflicts
+
+    def aggregate(self, replies: List[Tuple[str, str]]) -> str:
+        """Validate, rank, resolve duplicates and conflicts, and render the specialists' replies."""
+        problem, answers = self.ticket()
+        solutions: List[Solution] = []
+        unstructured: List[Tuple[str, str]] = []
+        for name, reply in replies:
+            try:
+                solutions.extend(parse_reply(name, reply))
+            except SchemaError as e:
+                logger.warning("%s did not return valid structured output (%s); keeping it as text", name, e)
+                unstructured.append((name, reply))
+        ranked = self.rank(f"{problem}\n{answers}", solutions)
+        kept, conflicts = self.resolve(ranked)
+        return render_solutions(kept, unstructured, conflicts)
+
+
+class SolutionSummary:
+    """Local ``summary_method`` for the solution nested chat, using a SolutionAggregator."""
+
+    def __init__(
+        self,
+        groupchat: autogen.GroupChat,
+        specialist_names: List[str],
+        reviewer_name: str,
+        aggregator: SolutionAggregator,
+    ):
+        self.groupchat = groupchat
+        self.specialist_names = specialist_names
+        self.reviewer_name = reviewer_name
+        self.aggregator = aggregator
+
+    def __call__(self, sender: autogen.ConversableAgent, recipient: autogen.ConversableAgent, summary_args: Dict) -> str:
+        replies = replies_since_rework(self.groupchat.messages, self.specialist_names, self.reviewer_name)
+        return self.aggregator.aggregate(replies)
@@ -0,0 +1,183 @@
+"""Speculative solution drafts, written while the user answers the clarifying questions."""
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, NamedTuple, Optional, Set, Tuple
+
+from .fanout import reply_content
+from .rate_limit import BACKGROUND, llm_priority
+from .registry import AgentRegistry
+from .router import ServiceRouter, service_key
+from .streaming import muted_tokens
+from .text import parse_numbered_list, tokenize
+
+DRAFT_PROMPT = """{problem}
+
+The user has not answered these clarifying questions yet:
+{questions}
+
+Draft your solution from what is known so far; where an answer would change it, assume the most common setup.
+End the draft with one line for each question whose answer you assumed:
+Assumption <question number>: <the answer you assumed>"""
+
+DELTA_PROMPT = """You drafted the solution below before the user answered the clarifying questions.
+
+Problem:
+{problem}
+
+Clarifying questions:
+{questions}
+
+User's answers:
+{answers}
+
+Revise the draft for these answers: keep what still applies, change only what the answers affect where they differ from the draft's assumptions, and reply with the complete solution in the same format, without the assumption lines.
+
+Draft:
+{draft}"""
+
+# Replies that only ask to go on add nothing a draft would have to be revised for
+_NON_ANSWER_TERMS = frozenset(tokenize("proceed continue go ahead please solution exit ok okay thanks skip"))
+
+# "No", "none" and "not" answer a question the same way
+_NEGATIONS = frozenset({"no", "none", "never", "not"})
+
+_ASSUMPTION = re.compile(r"^\W*assumption\s+(\d+)\W*?[:.)-]\s*(.*\S)\s*$", re.IGNORECASE)
+
+
+def split_assumptions(draft: str) -> Tuple[str, Dict[int, str]]:
+    """Split a draft into its text and the answers it assumed, by question number."""
+    lines, assumptions = [], {}
+    for line in draft.splitlines():
+        match = _ASSUMPTION.match(line)
+        if match:
+            assumptions[int(match.group(1))] = match.group(2)
+        else:
+            lines.append(line)
+    return "\n".join(lines).strip(), assumptions
+
+
+def _terms(text: str) -> Set[str]:
+    return {"not" if token in _NEGATIONS else token for token in tokenize(text)}
+
+
+def _answer_items(answers: str) -> List[Tuple[Optional[int], str]]:
+    """(question number, answer) pairs: numbered answers in order, otherwise one unnumbered item per line."""
+    numbered = parse_numbered_list(answers)
+    if numbered:
+        return list(enumerate(numbered, 1))
+    return [(None, line) for line in answers.splitlines() if line.strip()]
+
+
+def contradicts(answers: str, questions: str, assumptions: Dict[int, str]) -> bool:
+    """True if an answer says something the draft's assumptions do not.
+
+    An answer (minus the words of its question and replies like "proceed")
+    is covered when its terms are all in the assumption for its question, or,
+    when answers are not numbered, in any assumption. Without assumptions,
+    every informative answer counts.
+    """
+    question_terms = [_terms(question) for question in parse_numbered_list(questions)]
+    all_question_terms = set().union(*question_terms)
+    assumed = {number: _terms(text) for number, text in assumptions.items()}
+    all_assumed = set().union(*assumed.values())
+    for number, answer in _answer_items(answers):
+        if number is not None and number <= len(question_terms):
+            asked, covered = question_terms[number - 1], assumed.get(number, set())
+        else:
+            asked, covered = all_question_terms, all_assumed
+        if _terms(answer) - _NON_ANSWER_TERMS - asked - covered:
+            return True
+    return False
+
+
+class Draft(NamedTuple):
+    text: str
+    revision_prompt: Optional[str]  # None when the draft is used as it is
+
+
+class SolutionDrafts:
+    """Drafts the solutions of confidently routed specialists ahead of the solution phase.
+
+    :meth:`start` is called once the clarifying questions for a problem are
+    approved. If the problem routes to specialists with a score of at least
+    ``threshold``, they draft a solution from the problem alone in background
+    threads, at background LLM priority and without streaming, while the user
+    reads and answers the questions. Each draft ends with the answers it
+    assumed. When the solution phase starts, :meth:`take` hands out the
+    drafts made for the current ``ticket()`` (problem, answers) that are
+    finished, or finish within ``grace`` seconds: as they are if the answers
+    match those assumptions (see :func:`contradicts`), otherwise with a
+    short prompt to revise the draft for the answers. Specialists whose
+    draft is not ready, or failed, and problems nobody drafted for, are
+    solved as usual, so a slow draft never delays the solution phase by
+    more than ``grace``.
+    """
+
+    def __init__(
+        self,
+        router: ServiceRouter,
+        specialists: AgentRegistry,
+        ticket: Callable[[], Tuple[str, str]],
+        threshold: float,
+        max_specialists: int,
+        max_concurrency: int,
+        grace: float,
+    ):
+        self.router = router
+        self.specialists = specialists
+        self.ticket = ticket
+        self.threshold = threshold
+        self.max_specialists = max_specialists
+        self.max_concurrency = max_concurrency
+        self.grace = grace
+        self.names: Dict[str, str] = {service_key(name): name for name in specialists.names()}
+        self._lock = threading.Lock()
+        self._problem: Optional[str] = None
+        self._questions = ""
+        self._futures: Dict[str, Future] = {}
+
+    def start(self, problem: str, questions: str) -> bool:
+        """Start drafting for a problem if routing is confident; True if drafts are (already) being written."""
+        keys = [service_key(name) for name in self.router.route(problem, self.threshold, self.max_specialists)]
+        names = [self.names[key] for key in keys if key in self.names]
+        with self._lock:
+            if self._problem == problem:
+                return True
+            if not names:
+                return False
+            executor = ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(names)), thread_name_prefix="draft")
+            prompt = DRAFT_PROMPT.format(problem=problem, questions=questions)
+            self._problem, self._questions = problem, questions
+            self._futures = {name: executor.submit(self._draft, name, prompt) for name in names}
+            executor.shutdown(wait=False)
+        return True
+
+    def _draft(self, name: str, prompt: str) -> str:
+        agent = self.specialists.get(name)
+        with llm_priority(BACKGROUND), muted_tokens():
+            messages = agent.process_all_messages_before_reply([{"role": "user", "content": prompt}])
+            _, reply = agent.generate_oai_reply(messages=messages)
+        return reply_content(reply)
+
+    def take(self) -> Dict[str, Draft]:
+        """The current ticket's drafts done within ``grace`` seconds, by specialist name (each handed out once)."""
+        problem, answers = self.ticket()
+        with self._lock:
+            if not problem or problem != self._problem:
+                return {}
+            futures, questions = self._futures, self._questions
+            self._problem, self._futures = None, {}
+        done, pending = wait(futures.values(), timeout=self.grace)
+        for future in pending:
+            future.cancel()  # Drafts not started yet are dropped; running ones finish unused
+        drafts = {}
+        for name, future in futures.items():
+            if future not in done or future.exception() is not None or not future.result():
+                continue
+            text, assumptions = split_assumptions(future.result())
+            prompt = None
+            if contradicts(answers, questions, assumptions):
+                prompt = DELTA_PROMPT.format(problem=problem, questions=questions, answers=answers, draft=future.result())
+            drafts[name] = Draft(text, prompt)
+        return drafts
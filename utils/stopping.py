@@ -0,0 +1,116 @@
+"""Early exit for group chats once the agents stop adding information."""
+import re
+from typing import Callable, Dict, List, Optional, Union
+
+import autogen
+
+from .review import is_approved
+from .text import cosine_similarity, parse_numbered_list, tfidf_vectors, tokenize
+
+# Turns that say nothing: agents told to "stay silent" often reply with one of these
+_EMPTY_REPLY = re.compile(
+    r"^\W*(?:\(?silent\)?|silence|n/?a|none|terminate|pass|"
+    r"(?:i have )?no (?:further |additional |more |relevant )?(?:questions?|input|comments?|solutions?)\b.*|"
+    r"(?:i have )?nothing (?:further |more )?to add\b.*)\W*$",
+    re.IGNORECASE | re.DOTALL,
+)
+_MAX_EMPTY_REPLY_CHARS = 120
+
+Selector = Callable[[autogen.Agent, autogen.GroupChat], Union[autogen.Agent, str, None]]
+
+
+def is_empty_contribution(content: Optional[str]) -> bool:
+    """True for a turn without content, or one that only says it has nothing to add."""
+    content = (content or "").strip()
+    if not tokenize(content):
+        return True
+    return len(content) <= _MAX_EMPTY_REPLY_CHARS and bool(_EMPTY_REPLY.match(content))
+
+
+def _items(content: str) -> List[str]:
+    return parse_numbered_list(content) or [content]
+
+
+def adds_information(content: str, earlier: List[str], similarity: float) -> bool:
+    """True if the turn has an item (numbered line, or the whole text) below ``similarity`` to all earlier items."""
+    if is_empty_contribution(content):
+        return False
+    new_items = _items(content)
+    old_items = [item for text in earlier for item in _items(text)]
+    if not old_items:
+        return True
+    vectors = tfidf_vectors([tokenize(item) for item in old_items + new_items])
+    old_vectors, new_vectors = vectors[: len(old_items)], vectors[len(old_items):]
+    return any(
+        max(cosine_similarity(vector, old) for old in old_vectors) < similarity for vector in new_vectors if vector
+    )
+
+
+class AdaptiveStop:
+    """Wraps a ``speaker_selection_method`` and stops a group chat when no new information arrives.
+
+    A pass is the run of turns since the reviewer last spoke. It ends when
+    ``max_idle_turns`` turns in a row were empty or repeated earlier content
+    (at ``similarity`` or above), when every agent present besides the
+    reviewer has spoken, or when one agent has taken ``max_repeats`` turns of
+    it (a repeated-speaker loop). The reviewer is then asked if the pass
+    added anything; otherwise the chat ends. The chat also ends right after
+    the reviewer approves a pass that had content. Every other turn is
+    chosen by ``selector``; the fixed ``max_round`` of the chat stays as the
+    upper bound.
+    """
+
+    def __init__(
+        self,
+        selector: Union[Selector, str],
+        reviewer_name: str,
+        similarity: float,
+        max_idle_turns: int = 2,
+        max_repeats: int = 2,
+    ):
+        self.selector = selector
+        self.reviewer_name = reviewer_name
+        self.similarity = similarity
+        self.max_idle_turns = max_idle_turns
+        self.max_repeats = max_repeats
+        self.stops: Dict[str, int] = {}  # How often each rule ended a pass
+
+    def _stop_reason(self, groupchat: autogen.GroupChat, contributions: List[Dict], new: List[bool]) -> Optional[str]:
+        if len(new) >= self.max_idle_turns and not any(new[-self.max_idle_turns:]):
+            return "no new information"
+        speakers = [message.get("name") for message in contributions]
+        participants = {agent.name for agent in groupchat.agents} - {self.reviewer_name}
+        if participants and participants <= set(speakers):
+            return "every agent has spoken"
+        if speakers and speakers.count(speakers[-1]) >= self.max_repeats:
+            return "repeated speaker"
+        return None
+
+    def __call__(self, last_speaker: autogen.Agent, groupchat: autogen.GroupChat) -> Union[autogen.Agent, str, None]:
+        messages = groupchat.messages
+        if messages and last_speaker.name == self.reviewer_name and is_approved(messages[-1].get("content") or ""):
+            reviewed = False
+            for message in reversed(messages[1:-1]):
+                if message.get("name") == self.reviewer_name:
+                    break
+                reviewed = reviewed or not is_empty_contribution(message.get("content"))
+            if reviewed:
+                return None
+            # An approval of nothing (the reviewer was picked before anyone spoke) does not end the chat
+
+        # Contributions of the current pass, and whether each added something to what came before
+        start = max((i for i, m in enumerate(messages) if m.get("name") == self.reviewer_name), default=0) + 1
+        earlier = [m.get("content") or "" for m in messages[:start] if m.get("name") != self.reviewer_name]
+        contributions, new = messages[start:], []
+        for message in contributions:
+            content = message.get("content") or ""
+            new.append(adds_information(content, earlier, self.similarity))
+            earlier.append(content)
+
+        reason = self._stop_reason(groupchat, contributions, new)
+        if reason is None:
+            return self.selector(last_speaker, groupchat) if callable(self.selector) else self.selector
+        self.stops[reason] = self.stops.get(reason, 0) + 1
+        if any(new) and self.reviewer_name in groupchat.agent_names:
+            return groupchat.agent_by_name(self.reviewer_name)
+        return None
@@ -0,0 +1,98 @@
+"""Forwarding of streamed completion tokens to a session's client."""
+import contextlib
+import functools
+import re
+import threading
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, Optional
+
+import autogen
+from autogen.io.base import IOStream
+
+# Colour codes autogen prints before and after a streamed completion
+_ANSI = re.compile(r"\033\[[0-9;]*m")
+
+_muted: ContextVar[bool] = ContextVar("tokens_muted", default=False)
+_stop: ContextVar[Optional[threading.Event]] = ContextVar("tokens_stop", default=None)
+
+
+class StreamCancelled(Exception):
+    """Raised into a streamed completion whose caller has given up on it (e.g. after a timeout)."""
+
+
+@contextlib.contextmanager
+def muted_tokens() -> Iterator[None]:
+    """Completions made in this block (in this thread) are not streamed, e.g. speculative drafts."""
+    token = _muted.set(True)
+    try:
+        yield
+    finally:
+        _muted.reset(token)
+
+
+@contextlib.contextmanager
+def stop_on(event: threading.Event) -> Iterator[None]:
+    """Completions streamed in this block (in this thread) are abandoned once ``event`` is set."""
+    token = _stop.set(event)
+    try:
+        yield
+    finally:
+        _stop.reset(token)
+
+
+def stop_requested() -> bool:
+    """True once the caller of this block (see :func:`stop_on`) has given up on its result."""
+    stop = _stop.get()
+    return stop is not None and stop.is_set()
+
+
+class TokenForwarder:
+    """``IOStream`` active while one agent's streaming completion runs.
+
+    autogen prints each streamed chunk to the current ``IOStream``; this one
+    hands the text to ``on_token(agent_name, text)`` instead. Once ``stop``
+    is set, the next chunk raises :class:`StreamCancelled`, which ends the
+    completion and closes its connection, so an abandoned call stops
+    generating (and sending) tokens.
+    """
+
+    def __init__(
+        self, agent_name: str, on_token: Callable[[str, str], None], stop: Optional[threading.Event] = None
+    ):
+        self.agent_name = agent_name
+        self.on_token = on_token
+        self.stop = stop
+
+    def print(self, *objects: Any, sep: str = " ", end: str = "\n", flush: bool = False) -> None:
+        if self.stop is not None and self.stop.is_set():
+            raise StreamCancelled(self.agent_name)
+        text = sep.join(str(o) for o in objects) + end
+        # Chunks may be just whitespace. The colour markers autogen prints around a
+        # completion are dropped, but the one after it still ends its last line.
+        if _ANSI.search(text):
+            text = "\n" if "\n" in text else ""
+        if text:
+            self.on_token(self.agent_name, text)
+
+    def input(self, prompt: str = "", *, password: bool = False) -> str:
+        return ""
+
+
+def stream_tokens(agent: autogen.ConversableAgent, on_token: Callable[[str, str], None]) -> None:
+    """Stream the agent's completions and send their tokens to ``on_token``.
+
+    ``stream=True`` is added to each of the agent's ``create`` calls and a
+    :class:`TokenForwarder` is installed around them, so only this agent's
+    tokens are captured, also when its completion runs in a worker thread.
+    Responses served from the response cache arrive whole, without tokens.
+    """
+    create = agent.client.create
+
+    @functools.wraps(create)
+    def streaming_create(**config: Any) -> Any:
+        if _muted.get():
+            return create(**config)
+        with IOStream.set_default(TokenForwarder(agent.name, on_token, _stop.get())):
+            return create(**{**config, "stream": True})
+
+    agent.client.create = streaming_create
@@ -0,0 +1,72 @@
+"""Text helpers shared by the local (non-LLM) routing and classification stages."""
+import math
+import re
+from collections import Counter
+from typing import Dict, List
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+_NUMBERED_ITEM_PATTERN = re.compile(r"^\s*(?:\*\*)?\d+[.)](?:\*\*)?\s+(.*\S)\s*$")
+
+STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "can", "do", "does", "for",
+    "from", "have", "how", "i", "in", "is", "it", "its", "me", "my", "of", "on",
+    "or", "our", "so", "that", "the", "their", "this", "to", "we", "what", "when",
+    "where", "which", "with", "you", "your",
+})
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase and reduce text to space-separated alphanumeric words."""
+    return " ".join(_TOKEN_PATTERN.findall((text or "").lower()))
+
+
+def stem(token: str) -> str:
+    """Strip the most common English plural endings from a token."""
+    if len(token) > 4 and token.endswith("ies"):
+        return token[:-3] + "y"
+    if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+        return token[:-1]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase, split on non-alphanumerics, drop stopwords and stem."""
+    if not text:
+        return []
+    return [stem(token) for token in _TOKEN_PATTERN.findall(text.lower()) if token not in STOPWORDS]
+
+
+def parse_numbered_list(text: str) -> List[str]:
+    """Extract the items of a "1. ... 2. ..." list, joining indented continuation lines."""
+    items: List[str] = []
+    for line in (text or "").splitlines():
+        match = _NUMBERED_ITEM_PATTERN.match(line)
+        if match:
+            items.append(match.group(1))
+        elif items and line.strip() and line.startswith((" ", "\t")):
+            items[-1] = f"{items[-1]} {line.strip()}"
+    return items
+
+
+def cosine_similarity(left: Dict[str, float], right: Dict[str, float]) -> float:
+    """Cosine similarity of two sparse term vectors."""
+    if len(left) > len(right):
+        left, right = right, left
+    dot = sum(weight * right.get(term, 0.0) for term, weight in left.items())
+    if not dot:
+        return 0.0
+    norm = math.sqrt(sum(w * w for w in left.values())) * math.sqrt(sum(w * w for w in right.values()))
+    return dot / norm
+
+
+def tfidf_vectors(documents: List[List[str]]) -> List[Dict[str, float]]:
+    """Build smoothed, sublinear TF-IDF vectors for tokenized documents."""
+    document_frequency = Counter(term for tokens in documents for term in set(tokens))
+    total = len(documents)
+    vectors = []
+    for tokens in documents:
+        vectors.append({
+            term: (1 + math.log(count)) * (math.log((1 + total) / (1 + document_frequency[term])) + 1)
+            for term, count in Counter(tokens).items()
+        })
+    return vectors
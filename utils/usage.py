@@ -0,0 +1,121 @@
+"""Per-call LLM token usage reporting, including provider prompt-cache hits."""
+import threading
+import uuid
+from collections import Counter, defaultdict
+from typing import Any, Dict, Optional, Union
+
+import autogen
+from autogen.logger.base_logger import BaseLogger
+
+
+class UsageLogger(BaseLogger):
+    """autogen runtime logger that reports token usage for every LLM call.
+
+    For each completion it records prompt, completion and cached prompt
+    tokens (``usage.prompt_tokens_details.cached_tokens``, the part of the
+    prompt prefix the provider served from its prompt cache). Responses
+    answered from the local response cache are counted separately, since no
+    tokens were sent for them. Totals are kept per agent.
+
+    Streamed completions carry no provider usage in autogen: it counts their
+    tokens locally, so their cached tokens are unknown. They are counted as
+    ``streamed_calls`` and left out of ``cached_tokens``, and shown as "n/a"
+    rather than as 0.
+    """
+
+    def __init__(self, echo: bool = True):
+        self.echo = echo
+        self.totals: Dict[str, Counter] = defaultdict(Counter)
+        self._lock = threading.Lock()
+
+    def start(self) -> str:
+        return str(uuid.uuid4())
+
+    def log_chat_completion(
+        self,
+        invocation_id: uuid.UUID,
+        client_id: int,
+        wrapper_id: int,
+        source: Union[str, autogen.Agent],
+        request: Dict[str, Any],
+        response: Any,
+        is_cached: int,
+        cost: float,
+        start_time: str,
+    ) -> None:
+        usage = getattr(response, "usage", None)
+        if usage is None:
+            return
+        name = getattr(source, "name", None) or str(source)
+        if is_cached:
+            with self._lock:
+                self.totals[name]["response_cache_hits"] += 1
+            if self.echo:
+                print(f"[usage] {name}: answered from the response cache")
+            return
+        prompt = usage.prompt_tokens or 0
+        completion = usage.completion_tokens or 0
+        if isinstance(request, dict) and request.get("stream"):
+            with self._lock:
+                self.totals[name].update(
+                    calls=1, streamed_calls=1, prompt_tokens=prompt, completion_tokens=completion
+                )
+            if self.echo:
+                print(f"[usage] {name}: prompt={prompt} cached=n/a (streamed) completion={completion}")
+            return
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached = getattr(details, "cached_tokens", None) or 0
+        with self._lock:
+            self.totals[name].update(
+                calls=1, prompt_tokens=prompt, cached_tokens=cached, completion_tokens=completion
+            )
+        if self.echo:
+            share = cached / prompt if prompt else 0.0
+            print(
+                f"[usage] {name}: prompt={prompt} cached={cached} ({share:.0%}) completion={completion}"
+            )
+
+    def summary(self) -> Dict[str, Dict[str, int]]:
+        """Return the token totals per agent."""
+        with self._lock:
+            return {name: dict(counts) for name, counts in self.totals.items()}
+
+    def report(self) -> str:
+        """Render the per-agent totals as a small table.
+
+        The cached column counts non-streamed calls only, and is "n/a" for
+        agents whose calls were all streamed.
+        """
+        lines = [
+            f"{'agent':<28}{'calls':>7}{'streamed':>10}{'prompt':>10}{'cached':>10}{'completion':>12}{'cache hits':>12}"
+        ]
+        for name, counts in sorted(self.summary().items()):
+            calls, streamed = counts.get("calls", 0), counts.get("streamed_calls", 0)
+            cached = "n/a" if calls and calls == streamed else counts.get("cached_tokens", 0)
+            lines.append(
+                f"{name:<28}{calls:>7}{streamed:>10}{counts.get('prompt_tokens', 0):>10}"
+                f"{cached:>10}{counts.get('completion_tokens', 0):>12}"
+                f"{counts.get('response_cache_hits', 0):>12}"
+            )
+        return "\n".join(lines)
+
+    def log_new_agent(self, agent: Any, init_args: Dict[str, Any]) -> None:
+        pass
+
+    def log_event(self, source: Any, name: str, **kwargs: Dict[str, Any]) -> None:
+        pass
+
+    def log_new_wrapper(self, wrapper: Any, init_args: Dict[str, Any]) -> None:
+        pass
+
+    def log_new_client(self, client: Any, wrapper: Any, init_args: Dict[str, Any]) -> None:
+        pass
+
+    def log_function_use(self, source: Any, function: Any, args: Dict[str, Any], returns: Any) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+    def get_connection(self) -> Optional[Any]:
+        return None